@@ -21,6 +21,7 @@ setup(
     install_requires=[
         "requests>=2.32.0,<3.0.0",
         "pandas>=2.0.0,<3.0.0",
+        "numpy>=1.24.0",
         "PyMuPDF>=1.23.0,<2.0.0",
         "python-dotenv>=1.0.0,<2.0.0",
     ],
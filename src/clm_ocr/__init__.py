@@ -8,12 +8,25 @@ __author__ = "chaewonjeong"
 
 from .main import process_pdf, load_saved_result
 from .processor import OCRProcessor
-from .client import ClovaOCRClient, OCROutputManager
+from .streaming import iter_pages, process_pdf_streaming
+from .client import ClovaOCRClient, OCROutputManager, AdaptiveTimeout, OCRBatcher
+from .storage import DirectoryStorage, ShardedDirectoryStorage, SQLiteStorage
+from .pipeline import OCRPipeline
+from .endpoints import EndpointPool
 
 __all__ = [
     'process_pdf',
     'load_saved_result',
+    'iter_pages',
+    'process_pdf_streaming',
     'OCRProcessor',
     'ClovaOCRClient',
     'OCROutputManager',
+    'AdaptiveTimeout',
+    'OCRBatcher',
+    'DirectoryStorage',
+    'ShardedDirectoryStorage',
+    'SQLiteStorage',
+    'OCRPipeline',
+    'EndpointPool',
 ]
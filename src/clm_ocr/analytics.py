@@ -0,0 +1,277 @@
+"""
+코퍼스 단위 OCR 품질 분석
+저장된 프로젝트들을 병렬로 스캔하여 신뢰도 분포, 저신뢰 영역, 이상 문서를 집계
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import REFINE_CONFIDENCE
+from .storage import DirectoryStorage
+
+REPORT_FILENAME = 'quality_report.csv'
+
+# 신뢰도 히스토그램 구간 수 (0~1 균등 분할)
+HISTOGRAM_BINS = 10
+# 저신뢰 영역 집계용 페이지 격자 크기 (GRID x GRID)
+REGION_GRID = 3
+# 문서 이상치 판정 기준 (수정 z-점수 절댓값)
+OUTLIER_Z = 3.5
+
+HIST_COLUMNS = [f'hist_{i:02d}' for i in range(HISTOGRAM_BINS)]
+REGION_COLUMNS = [f'region_{r}_{c}' for r in range(REGION_GRID) for c in range(REGION_GRID)]
+
+
+def analyze_result(ocr_result: Dict[str, Any]) -> pd.DataFrame:
+    """
+    OCR 결과 하나의 페이지별 품질 지표 계산
+
+    Args:
+        ocr_result: CLOVA OCR API 응답
+
+    Returns:
+        페이지별 행 DataFrame
+        (page, fields, mean_conf, min_conf, low_conf, hist_*, region_*)
+    """
+    images = ocr_result.get('images', [])
+    num_pages = len(images)
+
+    pages, confidences, xs, ys, sizes = [], [], [], [], []
+    for page_idx, image in enumerate(images):
+        fields = image.get('fields', [])
+        info = image.get('convertedImageInfo', {})
+        width, height = info.get('width'), info.get('height')
+
+        page_xs, page_ys = [], []
+        for field in fields:
+            vertices = field.get('boundingPoly', {}).get('vertices', [])
+            if vertices:
+                page_xs.append(sum(v.get('x', 0) for v in vertices) / len(vertices))
+                page_ys.append(sum(v.get('y', 0) for v in vertices) / len(vertices))
+            else:
+                page_xs.append(0.0)
+                page_ys.append(0.0)
+            confidences.append(field.get('inferConfidence', 0))
+
+        # 페이지 크기 정보가 없으면 필드 좌표 범위로 추정
+        width = width or max(page_xs, default=0) or 1
+        height = height or max(page_ys, default=0) or 1
+        pages.extend([page_idx] * len(fields))
+        xs.extend(x / width for x in page_xs)
+        ys.extend(y / height for y in page_ys)
+        sizes.append(len(fields))
+
+    page = np.asarray(pages, dtype=np.int64)
+    conf = np.asarray(confidences, dtype=np.float64)
+    counts = np.asarray(sizes, dtype=np.int64)
+
+    # 신뢰도 히스토그램 (페이지 x 구간)
+    bins = np.clip((conf * HISTOGRAM_BINS).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+    hist = np.bincount(page * HISTOGRAM_BINS + bins, minlength=num_pages * HISTOGRAM_BINS)
+    hist = hist.reshape(num_pages, HISTOGRAM_BINS)
+
+    # 저신뢰 필드의 페이지 내 위치 격자 집계
+    low = conf < REFINE_CONFIDENCE
+    gx = np.clip((np.asarray(xs) * REGION_GRID).astype(np.int64), 0, REGION_GRID - 1)
+    gy = np.clip((np.asarray(ys) * REGION_GRID).astype(np.int64), 0, REGION_GRID - 1)
+    cells = REGION_GRID * REGION_GRID
+    regions = np.bincount(
+        (page * cells + gy * REGION_GRID + gx)[low], minlength=num_pages * cells
+    ).reshape(num_pages, cells)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_conf = np.bincount(page, weights=conf, minlength=num_pages) / counts
+    min_conf = np.full(num_pages, np.nan)
+    if conf.size:
+        np.fmin.at(min_conf, page, conf)
+
+    report = pd.DataFrame({
+        'page': np.arange(1, num_pages + 1),
+        'fields': counts,
+        'mean_conf': mean_conf,
+        'min_conf': min_conf,
+        'low_conf': np.bincount(page[low], minlength=num_pages),
+    })
+    report[HIST_COLUMNS] = hist
+    report[REGION_COLUMNS] = regions
+    return report
+
+
+def _analyze_project(task: Tuple[str, str, int]) -> Optional[pd.DataFrame]:
+    """워커 프로세스: 프로젝트 하나를 읽어 페이지별 지표 반환 (읽기 실패 시 None)"""
+    project, json_path, mtime_ns = task
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            report = analyze_result(json.load(f))
+    except (OSError, ValueError):
+        return None
+    report.insert(0, 'project', project)
+    report.insert(1, 'mtime_ns', mtime_ns)
+    return report
+
+
+def scan_projects(
+    output_base: str = "./output",
+    storage: Optional[DirectoryStorage] = None
+) -> Dict[str, Tuple[str, int]]:
+    """
+    완료된 OCR 결과가 있는 프로젝트 목록 수집
+
+    워커 프로세스가 파일 경로로 직접 읽으므로 디렉토리 기반 저장소만 지원합니다
+    (SQLiteStorage는 TypeError).
+
+    Args:
+        output_base: 출력 루트 디렉토리
+        storage: 디렉토리 기반 저장소 (기본값: output_base 아래 문서별 디렉토리,
+            ShardedDirectoryStorage 사용 가능)
+
+    Returns:
+        {프로젝트명: (ocr_result.json 경로, 수정 시각(ns))}
+    """
+    storage = storage or DirectoryStorage(output_base)
+    if not isinstance(storage, DirectoryStorage):
+        raise TypeError(f"{type(storage).__name__}는 파일 경로를 제공하지 않습니다")
+
+    projects = {}
+    for project in storage.iter_documents():
+        stat = storage.stat(project, 'ocr_result.json')
+        if stat is None:
+            continue
+        manifest = storage.read_manifest(project)
+        if manifest is not None and 'ocr_result.json' not in manifest['artifacts']:
+            continue
+        json_path = storage.project_dir(project) / 'ocr_result.json'
+        projects[project] = (str(json_path), stat[1])
+    return projects
+
+
+def build_quality_report(
+    output_base: str = "./output",
+    report_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    incremental: bool = True,
+    storage: Optional[DirectoryStorage] = None
+) -> pd.DataFrame:
+    """
+    저장된 전체 프로젝트의 품질 리포트를 병렬로 생성
+
+    incremental=True이면 기존 리포트에서 변경되지 않은 프로젝트는 재사용하고,
+    새로 추가되었거나 수정된 프로젝트만 다시 분석합니다.
+
+    Args:
+        output_base: 출력 루트 디렉토리
+        report_path: 리포트 CSV 경로 (기본값: 저장소 루트/quality_report.csv)
+        workers: 워커 프로세스 수 (기본값: CPU 수)
+        incremental: 기존 리포트 재사용 여부
+        storage: 디렉토리 기반 저장소 (scan_projects와 동일, 기본값: output_base 아래 문서별 디렉토리)
+
+    Returns:
+        페이지별 품질 리포트 DataFrame
+        (문서 단위 doc_mean_conf, doc_z, doc_outlier 열 포함)
+
+    Example:
+        >>> report = build_quality_report('./output')
+        >>> report[report['doc_outlier']]['project'].unique()
+    """
+    storage = storage or DirectoryStorage(output_base)
+    projects = scan_projects(output_base, storage)
+    report_path = Path(report_path) if report_path else storage.output_base / REPORT_FILENAME
+
+    existing = None
+    if incremental and report_path.exists():
+        # 숫자처럼 보이는 프로젝트명('2024')도 문자열로 읽어야 scan_projects 키와 비교됨
+        existing = pd.read_csv(report_path, encoding='utf-8-sig', dtype={'project': str})
+        known = existing.groupby('project')['mtime_ns'].first().to_dict()
+        existing = existing[[
+            projects.get(project, (None, None))[1] == mtime
+            for project, mtime in zip(existing['project'], existing['mtime_ns'])
+        ]]
+        todo = [
+            (project, path, mtime) for project, (path, mtime) in projects.items()
+            if known.get(project) != mtime
+        ]
+    else:
+        todo = [(project, path, mtime) for project, (path, mtime) in projects.items()]
+
+    print(f"📊 품질 분석: 전체 {len(projects)}개 중 {len(todo)}개 프로젝트 분석")
+
+    frames = [existing] if existing is not None and not existing.empty else []
+    if todo:
+        chunksize = max(1, len(todo) // ((workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            frames.extend(
+                frame for frame in executor.map(_analyze_project, todo, chunksize=chunksize)
+                if frame is not None
+            )
+
+    base_columns = ['project', 'mtime_ns', 'page', 'fields', 'mean_conf', 'min_conf', 'low_conf']
+    if frames:
+        report = pd.concat(frames, ignore_index=True)
+        report = report[base_columns + HIST_COLUMNS + REGION_COLUMNS]
+    else:
+        report = pd.DataFrame(columns=base_columns + HIST_COLUMNS + REGION_COLUMNS)
+    report = _flag_outliers(report)
+
+    tmp_path = report_path.with_name(f".{report_path.name}.tmp")
+    report.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    os.replace(tmp_path, report_path)
+
+    report.attrs['analyzed'] = len(todo)
+    print(f"✅ 품질 리포트 저장: {report_path}")
+    return report
+
+
+def _flag_outliers(report: pd.DataFrame) -> pd.DataFrame:
+    """문서 평균 신뢰도의 수정 z-점수로 이상 문서 표시"""
+    if report.empty:
+        return report.assign(doc_mean_conf=[], doc_z=[], doc_outlier=[])
+
+    weighted = report['mean_conf'].fillna(0).to_numpy() * report['fields'].to_numpy()
+    grouped = pd.DataFrame({
+        'project': report['project'], 'weighted': weighted, 'fields': report['fields']
+    }).groupby('project', sort=False).sum()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        doc_mean = (grouped['weighted'] / grouped['fields']).to_numpy()
+
+    values = doc_mean[~np.isnan(doc_mean)]
+    z = np.zeros_like(doc_mean)
+    if values.size:
+        median = np.median(values)
+        mad = np.median(np.abs(values - median))
+        # MAD가 0이면 평균 절대편차로 대체 (Iglewicz-Hoaglin)
+        scale = 1.4826 * mad if mad > 0 else 1.2533 * np.mean(np.abs(values - median))
+        if scale > 0:
+            z = (doc_mean - median) / scale
+
+    doc = pd.DataFrame(
+        {'doc_mean_conf': doc_mean, 'doc_z': np.nan_to_num(z)}, index=grouped.index
+    )
+    doc['doc_outlier'] = doc['doc_z'].abs() > OUTLIER_Z
+    return report.drop(columns=['doc_mean_conf', 'doc_z', 'doc_outlier'], errors='ignore') \
+        .join(doc, on='project')
+
+
+def summarize_report(report: pd.DataFrame) -> Dict[str, Any]:
+    """
+    품질 리포트의 코퍼스 단위 요약
+
+    Args:
+        report: build_quality_report 결과
+
+    Returns:
+        {'documents', 'pages', 'fields', 'histogram', 'hot_spots', 'outliers'}
+    """
+    regions = report[REGION_COLUMNS].to_numpy().sum(axis=0)
+    return {
+        'documents': int(report['project'].nunique()),
+        'pages': int(len(report)),
+        'fields': int(report['fields'].sum()),
+        'histogram': report[HIST_COLUMNS].to_numpy().sum(axis=0).tolist(),
+        'hot_spots': regions.reshape(REGION_GRID, REGION_GRID).tolist(),
+        'outliers': sorted(report.loc[report['doc_outlier'].astype(bool), 'project'].unique()),
+    }
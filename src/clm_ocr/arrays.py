@@ -0,0 +1,405 @@
+"""
+OCR 결과의 배열 기반 인코딩
+중첩된 images/fields 딕셔너리를 숫자 열과 하나의 UTF-8 텍스트 버퍼로 변환하여
+multiprocessing.shared_memory로 워커 프로세스에 복사 없이 전달
+"""
+import json
+import struct
+from collections.abc import Mapping, Sequence
+from multiprocessing import shared_memory
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .processor import OCRProcessor
+
+_MAGIC = b'CLMA'
+_ALIGN = 8
+
+
+class ResultArrays:
+    """
+    OCR 결과의 열 기반 표현
+
+    필드 단위 열:
+        page_offsets (페이지 수 + 1): 페이지별 필드 시작 인덱스
+        text_offsets (필드 수 + 1) + text (uint8): 이어 붙인 UTF-8 텍스트
+        confidence (float64, 없으면 NaN), line_break (int8, 없으면 -1),
+        type_code (int16, types 목록 인덱스, 없으면 -1),
+        num_vertices (uint8) + vertices (필드 수, 최대 꼭짓점 수, 2)
+    페이지 단위 열:
+        page_meta_offsets + page_meta: 필드 외 페이지 항목(tables 등)의 JSON
+
+    from_buffer/attach로 만든 인스턴스의 열은 원본 버퍼를 그대로 참조합니다.
+
+    Example:
+        >>> arrays = ResultArrays.from_result(ocr_result)
+        >>> shm = arrays.to_shared_memory()
+        >>> # 워커 프로세스
+        >>> arrays, shm = ResultArrays.attach(name)
+        >>> text = OCRProcessor.to_text(arrays.view())
+    """
+
+    COLUMNS = (
+        'page_offsets', 'text_offsets', 'text', 'confidence', 'line_break', 'type_code',
+        'num_vertices', 'vertices', 'page_meta_offsets', 'page_meta',
+    )
+
+    def __init__(self, columns: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        self.columns = columns
+        self.meta = meta
+        self.types: List[str] = meta.get('types', [])
+
+    @property
+    def num_pages(self) -> int:
+        return len(self.columns['page_offsets']) - 1
+
+    @property
+    def num_fields(self) -> int:
+        return len(self.columns['text_offsets']) - 1
+
+    # ============================================
+    # 인코딩
+    # ============================================
+
+    @classmethod
+    def from_result(cls, ocr_result: Dict[str, Any]) -> 'ResultArrays':
+        """
+        OCR 결과를 배열로 인코딩
+
+        필드의 인코딩 대상 키(inferText, inferConfidence, type, lineBreak, boundingPoly)
+        외의 항목은 보존되지 않습니다.
+
+        Args:
+            ocr_result: CLOVA OCR API 응답
+
+        Returns:
+            ResultArrays
+        """
+        images = ocr_result.get('images', [])
+        fields = [field for image in images for field in image.get('fields', [])]
+        num_fields = len(fields)
+
+        page_offsets = np.zeros(len(images) + 1, dtype=np.int64)
+        np.cumsum([len(image.get('fields', [])) for image in images], out=page_offsets[1:])
+
+        encoded = [str(field.get('inferText', '')).encode('utf-8') for field in fields]
+        text_offsets = np.zeros(num_fields + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=text_offsets[1:])
+
+        types: Dict[str, int] = {}
+        type_code = np.array([
+            types.setdefault(field['type'], len(types)) if 'type' in field else -1
+            for field in fields
+        ], dtype=np.int16)
+
+        polys = [field.get('boundingPoly', {}).get('vertices', []) for field in fields]
+        max_vertices = max((len(poly) for poly in polys), default=0)
+        vertices = np.zeros((num_fields, max_vertices, 2), dtype=np.float64)
+        for idx, poly in enumerate(polys):
+            for v_idx, vertex in enumerate(poly):
+                vertices[idx, v_idx] = (vertex.get('x', 0), vertex.get('y', 0))
+
+        page_meta = [
+            json.dumps({k: v for k, v in image.items() if k != 'fields'},
+                       ensure_ascii=False).encode('utf-8')
+            for image in images
+        ]
+        page_meta_offsets = np.zeros(len(images) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in page_meta], out=page_meta_offsets[1:])
+
+        columns = {
+            'page_offsets': page_offsets,
+            'text_offsets': text_offsets,
+            'text': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            'confidence': np.array(
+                [field.get('inferConfidence', np.nan) for field in fields], dtype=np.float64
+            ),
+            'line_break': np.array(
+                [int(field['lineBreak']) if 'lineBreak' in field else -1 for field in fields],
+                dtype=np.int8
+            ),
+            'type_code': type_code,
+            'num_vertices': np.array([len(poly) for poly in polys], dtype=np.uint8),
+            'vertices': vertices,
+            'page_meta_offsets': page_meta_offsets,
+            'page_meta': np.frombuffer(b''.join(page_meta), dtype=np.uint8),
+        }
+        meta = {
+            'types': list(types),
+            'result': {k: v for k, v in ocr_result.items() if k != 'images'},
+        }
+        return cls(columns, meta)
+
+    def _layout(self) -> Tuple[bytes, int]:
+        """(헤더 바이트, 전체 크기) 계산 - 각 열은 8바이트 경계에 정렬"""
+        offset, specs = 0, {}
+        for name in self.COLUMNS:
+            column = self.columns[name]
+            specs[name] = [column.dtype.str, list(column.shape), offset]
+            offset += -(-column.nbytes // _ALIGN) * _ALIGN
+        header = json.dumps({'columns': specs, 'meta': self.meta}, ensure_ascii=False).encode()
+        prefix = len(_MAGIC) + 4 + len(header)
+        prefix = -(-prefix // _ALIGN) * _ALIGN
+        return header, prefix + offset
+
+    @property
+    def nbytes(self) -> int:
+        """to_buffer에 필요한 바이트 수"""
+        return self._layout()[1]
+
+    def to_buffer(self, buffer: Optional[Union[bytearray, memoryview]] = None) -> memoryview:
+        """
+        연속된 버퍼 하나로 직렬화
+
+        Args:
+            buffer: 기록할 버퍼 (nbytes 이상, 기본값: 새 bytearray)
+
+        Returns:
+            기록된 영역의 memoryview
+        """
+        header, total = self._layout()
+        if buffer is None:
+            buffer = bytearray(total)
+        view = memoryview(buffer)[:total]
+        if len(view) < total:
+            raise ValueError(f"버퍼 크기가 부족합니다: {len(view)} < {total}")
+
+        struct.pack_into('<4sI', view, 0, _MAGIC, len(header))
+        view[8:8 + len(header)] = header
+        offset = -(-(8 + len(header)) // _ALIGN) * _ALIGN
+        for name in self.COLUMNS:
+            data = np.ascontiguousarray(self.columns[name]).reshape(-1).view(np.uint8)
+            np.frombuffer(view, dtype=np.uint8, count=data.size, offset=offset)[:] = data
+            offset += -(-data.size // _ALIGN) * _ALIGN
+        return view
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview]) -> 'ResultArrays':
+        """
+        to_buffer 결과에서 복사 없이 배열 복원
+
+        Args:
+            buffer: 직렬화된 버퍼 (공유 메모리의 buf 등)
+
+        Returns:
+            버퍼를 참조하는 ResultArrays
+        """
+        magic, header_len = struct.unpack_from('<4sI', buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError("ResultArrays 버퍼가 아닙니다")
+        header = json.loads(bytes(buffer[8:8 + header_len]))
+        base = -(-(8 + header_len) // _ALIGN) * _ALIGN
+
+        columns = {}
+        for name, (dtype, shape, offset) in header['columns'].items():
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape)) if shape else 1
+            columns[name] = np.frombuffer(
+                buffer, dtype=dtype, count=count, offset=base + offset
+            ).reshape(shape)
+        return cls(columns, header['meta'])
+
+    def to_shared_memory(self, name: Optional[str] = None) -> shared_memory.SharedMemory:
+        """
+        공유 메모리 블록을 만들어 직렬화
+
+        반환된 블록은 호출자가 소유하며, 사용이 끝나면 close()와 unlink()를 호출해야 합니다.
+
+        Args:
+            name: 공유 메모리 이름 (기본값: 자동 생성)
+
+        Returns:
+            SharedMemory (워커에는 shm.name을 전달)
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(self.nbytes, 1))
+        self.to_buffer(shm.buf)
+        return shm
+
+    @classmethod
+    def attach(cls, name: str) -> Tuple['ResultArrays', shared_memory.SharedMemory]:
+        """
+        다른 프로세스가 만든 공유 메모리 블록에 연결
+
+        사용이 끝나면 배열 참조를 버린 뒤 shm.close()를 호출합니다 (unlink는 생성한 쪽에서).
+        Python 3.12 이하에서는 resource tracker를 공유하는 하위 프로세스(multiprocessing
+        워커)에서 연결해야 합니다. 무관한 프로세스가 연결하면 종료 시 블록이 해제될 수 있습니다.
+
+        Args:
+            name: 공유 메모리 이름
+
+        Returns:
+            (ResultArrays, SharedMemory) 튜플
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:   # Python 3.12 이하 (워커는 생성한 프로세스의 tracker를 공유)
+            shm = shared_memory.SharedMemory(name=name)
+        return cls.from_buffer(shm.buf), shm
+
+    # ============================================
+    # 디코딩
+    # ============================================
+
+    def field_text(self, idx: int) -> str:
+        offsets = self.columns['text_offsets']
+        return self.columns['text'][offsets[idx]:offsets[idx + 1]].tobytes().decode('utf-8')
+
+    def page_meta(self, page_idx: int) -> Dict[str, Any]:
+        offsets = self.columns['page_meta_offsets']
+        data = self.columns['page_meta'][offsets[page_idx]:offsets[page_idx + 1]]
+        return json.loads(data.tobytes()) if data.size else {}
+
+    def field(self, idx: int) -> Dict[str, Any]:
+        """필드 하나를 OCR 응답 형식 딕셔너리로 복원"""
+        field: Dict[str, Any] = {'inferText': self.field_text(idx)}
+        confidence = self.columns['confidence'][idx]
+        if not np.isnan(confidence):
+            field['inferConfidence'] = float(confidence)
+        type_code = int(self.columns['type_code'][idx])
+        if type_code >= 0:
+            field['type'] = self.types[type_code]
+        line_break = int(self.columns['line_break'][idx])
+        if line_break >= 0:
+            field['lineBreak'] = bool(line_break)
+        num_vertices = int(self.columns['num_vertices'][idx])
+        if num_vertices:
+            field['boundingPoly'] = {'vertices': [
+                {'x': float(x), 'y': float(y)}
+                for x, y in self.columns['vertices'][idx, :num_vertices].tolist()
+            ]}
+        return field
+
+    def view(self) -> 'ResultView':
+        """OCRProcessor 변환에 그대로 넘길 수 있는 지연 디코딩 뷰"""
+        return ResultView(self)
+
+    def to_result(self) -> Dict[str, Any]:
+        """전체 OCR 결과 딕셔너리로 복원"""
+        result = dict(self.meta.get('result', {}))
+        result['images'] = [
+            {**self.page_meta(page_idx), 'fields': list(PageFields(self, page_idx))}
+            for page_idx in range(self.num_pages)
+        ]
+        return result
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        OCRProcessor.to_dataframe과 같은 DataFrame을 열 단위로 생성
+
+        Returns:
+            DATAFRAME_COLUMNS 열의 DataFrame
+        """
+        if not self.num_fields:
+            return pd.DataFrame()
+
+        page_offsets = self.columns['page_offsets']
+        counts = np.diff(page_offsets)
+        page = np.repeat(np.arange(1, self.num_pages + 1), counts)
+        field_no = np.arange(self.num_fields) - np.repeat(page_offsets[:-1], counts) + 1
+        texts = [self.field_text(idx) for idx in range(self.num_fields)]
+        types = np.array(self.types + ['NORMAL'], dtype=object)
+        vertices = self.columns['vertices']
+        has_vertex = self.columns['num_vertices'] > 0
+        first = vertices[:, 0] if vertices.shape[1] else np.zeros((self.num_fields, 2))
+
+        return pd.DataFrame({
+            '페이지': page,
+            '필드_번호': field_no,
+            '텍스트': texts,
+            '신뢰도': np.nan_to_num(self.columns['confidence'], nan=0.0),
+            '타입': types[self.columns['type_code']],
+            '줄바꿈': self.columns['line_break'] == 1,
+            'X1': np.where(has_vertex, first[:, 0], 0.0),
+            'Y1': np.where(has_vertex, first[:, 1], 0.0),
+        }, columns=OCRProcessor.DATAFRAME_COLUMNS)
+
+
+class PageFields(Sequence):
+    """한 페이지 필드의 지연 디코딩 시퀀스"""
+
+    def __init__(self, arrays: ResultArrays, page_idx: int):
+        self._arrays = arrays
+        offsets = arrays.columns['page_offsets']
+        self._start = int(offsets[page_idx])
+        self._stop = int(offsets[page_idx + 1])
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return self._arrays.field(self._start + idx)
+
+
+class PageView(Mapping):
+    """images 항목 하나의 지연 디코딩 뷰 (fields 외 항목은 처음 접근할 때 JSON 복원)"""
+
+    def __init__(self, arrays: ResultArrays, page_idx: int):
+        self._arrays = arrays
+        self._page_idx = page_idx
+        self._meta: Optional[Dict[str, Any]] = None
+
+    def _page_meta(self) -> Dict[str, Any]:
+        if self._meta is None:
+            self._meta = self._arrays.page_meta(self._page_idx)
+        return self._meta
+
+    def __getitem__(self, key: str):
+        if key == 'fields':
+            return PageFields(self._arrays, self._page_idx)
+        return self._page_meta()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._page_meta()
+        yield 'fields'
+
+    def __len__(self) -> int:
+        return len(self._page_meta()) + 1
+
+
+class _PageViews(Sequence):
+    def __init__(self, arrays: ResultArrays):
+        self._arrays = arrays
+
+    def __len__(self) -> int:
+        return self._arrays.num_pages
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return PageView(self._arrays, idx)
+
+
+class ResultView(Mapping):
+    """
+    ResultArrays 위의 OCR 응답 형식 뷰
+
+    ocr_result를 받는 OCRProcessor 메서드에 그대로 넘길 수 있으며,
+    필드는 접근할 때만 딕셔너리로 복원됩니다. JSON 저장이 필요하면 to_result()를 사용합니다.
+    """
+
+    def __init__(self, arrays: ResultArrays):
+        self.arrays = arrays
+
+    def __getitem__(self, key: str):
+        if key == 'images':
+            return _PageViews(self.arrays)
+        return self.arrays.meta.get('result', {})[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.arrays.meta.get('result', {})
+        yield 'images'
+
+    def __len__(self) -> int:
+        return len(self.arrays.meta.get('result', {})) + 1
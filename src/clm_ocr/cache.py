@@ -0,0 +1,229 @@
+"""
+저장된 결과 캐시
+load_saved_result로 불러온 프로젝트를 프로세스 안에서 재사용 (메모리 상한 LRU, 파일 변경 시 무효화)
+"""
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import CACHE_MAX_BYTES, CACHE_PREFETCH_WORKERS
+from .storage import OutputStorage, DirectoryStorage, MANIFEST_FILENAME
+
+# 변경 여부를 확인할 산출물 (크기/수정 시각이 하나라도 바뀌면 다시 불러옴)
+WATCHED_FILES = (MANIFEST_FILENAME, 'ocr_result.json', 'ocr_data.csv')
+
+Loaded = Tuple[Optional[Dict[str, Any]], Optional[pd.DataFrame]]
+
+
+class ProjectCache:
+    """
+    프로젝트 결과 캐시
+
+    - 조회할 때마다 산출물의 크기/수정 시각을 확인해 바뀌었으면 다시 불러옵니다.
+    - 같은 프로젝트를 여러 스레드가 동시에 요청하면 한 번만 불러오고 나머지는 결과를 기다립니다.
+    - 전체 추정 메모리가 max_bytes를 넘으면 가장 오래 사용하지 않은 프로젝트부터 제거합니다.
+
+    반환되는 결과와 DataFrame은 캐시와 공유되므로 읽기 전용으로 사용해야 합니다.
+
+    Example:
+        >>> cache = ProjectCache(max_bytes=1024 ** 3)
+        >>> ocr_result, df = cache.get('resume')
+        >>> cache.prefetch(['resume', 'cover_letter'])
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = CACHE_MAX_BYTES,
+        prefetch_workers: int = CACHE_PREFETCH_WORKERS
+    ):
+        """
+        Args:
+            max_bytes: 최대 메모리 (bytes)
+            prefetch_workers: 미리 불러오기 스레드 수
+        """
+        self.max_bytes = max_bytes
+        self.prefetch_workers = prefetch_workers
+
+        # 키 -> (변경 확인용 서명, 결과, 추정 크기)
+        self._entries: 'OrderedDict[str, Tuple[tuple, Loaded, int]]' = OrderedDict()
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        project_name: str,
+        output_base: str = "./output",
+        storage: Optional[OutputStorage] = None
+    ) -> Loaded:
+        """
+        캐시된 결과 반환 (없거나 파일이 바뀌었으면 불러와 저장)
+
+        Args:
+            project_name: 프로젝트 폴더명/문서 ID
+            output_base: 출력 루트 디렉토리
+            storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리)
+
+        Returns:
+            (ocr_result, df_result) 튜플 (결과가 없으면 (None, None), 캐시하지 않음)
+        """
+        storage = storage or DirectoryStorage(output_base)
+        key = storage.location(project_name)
+        signature = _signature(storage, project_name)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self._discard(key)
+                self.invalidations += 1
+
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._loading[key] = future
+                self.misses += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            from .main import load_saved_result
+            loaded = load_saved_result(project_name, storage=storage)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            # 불러오기 전 서명으로 저장하므로, 불러오는 동안 파일이 바뀌었다면 다음 조회에서 다시 불러옴
+            if loaded[0] is not None:
+                self._store(key, signature, loaded)
+        future.set_result(loaded)
+        return loaded
+
+    def prefetch(
+        self,
+        project_names: Iterable[str],
+        output_base: str = "./output",
+        storage: Optional[OutputStorage] = None
+    ) -> List[Future]:
+        """
+        프로젝트들을 백그라운드 스레드에서 미리 불러오기
+
+        Args:
+            project_names: 프로젝트 폴더명/문서 ID 이터러블
+            output_base: 출력 루트 디렉토리
+            storage: 산출물 저장소
+
+        Returns:
+            프로젝트별 Future 리스트 (결과는 get과 동일)
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.prefetch_workers, thread_name_prefix='ocr-cache-prefetch'
+                )
+            executor = self._executor
+        return [
+            executor.submit(self.get, project_name, output_base, storage)
+            for project_name in project_names
+        ]
+
+    def invalidate(self, project_name: Optional[str] = None, output_base: str = "./output",
+                   storage: Optional[OutputStorage] = None) -> None:
+        """프로젝트 하나(project_name 지정) 또는 전체 캐시 비우기"""
+        with self._lock:
+            if project_name is None:
+                self._entries.clear()
+                self.nbytes = 0
+            else:
+                storage = storage or DirectoryStorage(output_base)
+                self._discard(storage.location(project_name))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            {'entries', 'nbytes', 'max_bytes', 'hits', 'misses', 'invalidations', 'evictions'}
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+            }
+
+    def _store(self, key: str, signature: tuple, loaded: Loaded) -> None:
+        size = _estimate_size(loaded)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (signature, loaded, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+
+def _signature(storage: OutputStorage, project_name: str) -> tuple:
+    return tuple(storage.stat(project_name, filename) for filename in WATCHED_FILES)
+
+
+def _estimate_size(loaded: Loaded) -> int:
+    """결과 딕셔너리(객체 크기 합)와 DataFrame(deep 메모리)의 추정 메모리"""
+    ocr_result, df = loaded
+    total = int(df.memory_usage(deep=True).sum()) if df is not None else 0
+    seen = set()
+    stack = [ocr_result]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return total
+
+
+_default_cache: Optional[ProjectCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> ProjectCache:
+    """프로세스 전역 캐시 (load_saved_result(use_cache=True)가 사용)"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ProjectCache()
+        return _default_cache
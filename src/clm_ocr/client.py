@@ -6,30 +6,223 @@ import requests
 import uuid
 import time
 import json
+import queue
+import socket
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, List
 
-from .config import API_URL, SECRET_KEY, DEFAULT_TIMEOUT
+import fitz  # PyMuPDF
+from requests.adapters import HTTPAdapter
+
+from .upload import MultipartEncoder, DEFAULT_CHUNK_SIZE
+from .storage import OutputStorage, DirectoryStorage, MANIFEST_FILENAME
+from .config import (
+    API_URL, SECRET_KEY,
+    TIMEOUT_BASE, TIMEOUT_PER_PAGE, TIMEOUT_PER_MB, TIMEOUT_MIN, TIMEOUT_MAX,
+    TIMEOUT_MULTIPLIER, TIMEOUT_MIN_SAMPLES, DEFAULT_MAX_HEDGE_RATIO,
+    MAX_IMAGES_PER_REQUEST, MAX_REQUEST_BYTES, DEFAULT_BATCH_MAX_WAIT,
+)
+
+
+class AdaptiveTimeout:
+    """페이지 수/파일 크기와 관측 지연 퍼센타일 기반 타임아웃 정책"""
+
+    def __init__(
+        self,
+        base: float = TIMEOUT_BASE,
+        per_page: float = TIMEOUT_PER_PAGE,
+        per_mb: float = TIMEOUT_PER_MB,
+        min_timeout: float = TIMEOUT_MIN,
+        max_timeout: float = TIMEOUT_MAX,
+        multiplier: float = TIMEOUT_MULTIPLIER,
+        min_samples: int = TIMEOUT_MIN_SAMPLES,
+        window: int = 500
+    ):
+        """
+        Args:
+            base: 요청당 기본 소요 시간 추정치 (초)
+            per_page: 페이지당 추가 시간 (초)
+            per_mb: MB당 추가 시간 (초)
+            min_timeout: 타임아웃 하한 (초)
+            max_timeout: 타임아웃 상한 (초)
+            multiplier: 학습된 p99 대비 여유 배수
+            min_samples: 학습값을 사용하기 위한 최소 관측 수
+            window: 보관할 최근 관측 수
+        """
+        self.base = base
+        self.per_page = per_page
+        self.per_mb = per_mb
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+
+        # 관측 지연 / 정적 추정치 비율 (문서 크기와 무관하게 비교 가능)
+        self._ratios = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def estimate(self, pages: int, size_bytes: int) -> float:
+        """문서 크기 기반 정적 소요 시간 추정치 (초)"""
+        return self.base + self.per_page * pages + self.per_mb * size_bytes / (1024 * 1024)
+
+    def observe(self, latency: float, pages: int, size_bytes: int) -> None:
+        """성공한 요청의 지연 시간 기록"""
+        with self._lock:
+            self._ratios.append(latency / self.estimate(pages, size_bytes))
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        관측 비율의 퍼센타일 (관측 수가 부족하면 None)
+
+        Args:
+            q: 0~1 사이 분위수
+        """
+        with self._lock:
+            if len(self._ratios) < self.min_samples:
+                return None
+            ordered = sorted(self._ratios)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def timeout(self, pages: int, size_bytes: int) -> float:
+        """요청 타임아웃 (학습 전에는 정적 추정치 사용)"""
+        estimate = self.estimate(pages, size_bytes)
+        p99 = self.percentile(0.99)
+        if p99 is not None:
+            estimate = estimate * p99 * self.multiplier
+        return min(self.max_timeout, max(self.min_timeout, estimate))
+
+    def hedge_delay(self, pages: int, size_bytes: int) -> Optional[float]:
+        """헤지 요청을 보낼 대기 시간 = 학습된 p95 (학습 전에는 None)"""
+        p95 = self.percentile(0.95)
+        if p95 is None:
+            return None
+        return self.estimate(pages, size_bytes) * p95
+
+
+class RequestCancelled(requests.exceptions.RequestException):
+    """헤지에서 진 요청을 중단했을 때 (엔드포인트 장애로 집계하지 않음)"""
+
+
+def _shutdown(conn) -> None:
+    sock = getattr(conn, 'sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _TrackingAdapter(HTTPAdapter):
+    """새 연결이 만들어질 때마다 on_connect를 호출하는 어댑터"""
+
+    def __init__(self, on_connect):
+        self._on_connect = on_connect
+        super().__init__()
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        on_connect = self._on_connect
+        pool_classes = {}
+        for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items():
+            class Connection(pool_cls.ConnectionCls):
+                def connect(self):
+                    super().connect()
+                    on_connect(self)
+
+            pool_classes[scheme] = type(
+                pool_cls.__name__, (pool_cls,), {'ConnectionCls': Connection}
+            )
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+
+class _AbortableSession(requests.Session):
+    """
+    진행 중인 요청을 즉시 중단할 수 있는 세션 (헤지 요청마다 하나씩 사용)
+
+    Session.close는 풀에 반납된 연결만 닫으므로, abort는 사용 중인 연결의 소켓을 직접 끊어
+    응답을 기다리던 요청이 타임아웃까지 연결을 잡고 있지 않도록 합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.aborted = False
+        self._connections = []
+        self._lock = threading.Lock()
+        for prefix in ('http://', 'https://'):
+            self.mount(prefix, _TrackingAdapter(self._track))
+
+    def _track(self, conn) -> None:
+        with self._lock:
+            self._connections.append(conn)
+            aborted = self.aborted
+        if aborted:
+            _shutdown(conn)
+
+    def abort(self) -> None:
+        with self._lock:
+            self.aborted = True
+            connections = list(self._connections)
+        for conn in connections:
+            _shutdown(conn)
+        self.close()
 
 
 class ClovaOCRClient:
     """CLOVA OCR API 클라이언트"""
 
-    def __init__(self, api_url: str = API_URL, secret_key: str = SECRET_KEY):
+    def __init__(
+        self,
+        api_url: str = API_URL,
+        secret_key: str = SECRET_KEY,
+        timeout: Optional[float] = None,
+        timeout_policy: Optional[AdaptiveTimeout] = None,
+        hedge: bool = False,
+        max_hedge_ratio: float = DEFAULT_MAX_HEDGE_RATIO,
+        upload_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = False,
+        endpoints=None
+    ):
         """
         Args:
             api_url: CLOVA OCR API URL
             secret_key: CLOVA OCR Secret Key
+            timeout: 고정 타임아웃 (초). 지정하면 적응형 타임아웃을 사용하지 않음
+            timeout_policy: 적응형 타임아웃 정책 (기본값: AdaptiveTimeout())
+            hedge: 학습된 p95를 넘긴 요청에 중복(헤지) 요청 발송 여부
+            max_hedge_ratio: 전체 요청 대비 헤지 요청 최대 비율
+            upload_chunk_size: 스트리밍 업로드 청크 크기 (bytes)
+            use_mmap: 업로드 파일을 mmap으로 읽을지 여부
+            endpoints: 여러 도메인/키에 나눠 보낼 때 EndpointPool 또는
+                (api_url, secret_key[, weight]) 리스트. 지정하면 api_url/secret_key 대신 사용
         """
         self.api_url = api_url
         self.secret_key = secret_key
+        if endpoints is not None and not hasattr(endpoints, 'acquire'):
+            from .endpoints import EndpointPool
+            endpoints = EndpointPool(endpoints)
+        self.endpoints = endpoints
         self.cache = {}
 
+        self.timeout = timeout
+        self.timeout_policy = timeout_policy or AdaptiveTimeout()
+        self.hedge = hedge
+        self.max_hedge_ratio = max_hedge_ratio
+        self.upload_chunk_size = upload_chunk_size
+        self.use_mmap = use_mmap
+
+        self.requests_sent = 0
+        self.hedges_sent = 0
+        self._stats_lock = threading.Lock()
+
     def ocr_from_file(
         self,
         file_path: str,
         lang: str = 'ko',
-        enable_table: bool = False
+        enable_table: bool = False,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         파일에서 OCR 수행
@@ -38,6 +231,7 @@ class ClovaOCRClient:
             file_path: PDF/이미지 파일 경로
             lang: 언어 코드 (기본값: 'ko')
             enable_table: 테이블 인식 활성화
+            use_cache: 결과 캐시 사용 여부 (임시 파일을 처리할 때는 False)
 
         Returns:
             OCR API 응답 (JSON)
@@ -48,7 +242,7 @@ class ClovaOCRClient:
         """
         # 캐시 확인
         cache_key = f"{file_path}_{lang}_{enable_table}"
-        if cache_key in self.cache:
+        if use_cache and cache_key in self.cache:
             print("📦 캐시된 결과 반환")
             return self.cache[cache_key]
 
@@ -56,13 +250,174 @@ class ClovaOCRClient:
         if not file_path.exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
-        file_ext = file_path.suffix.lower().replace('.', '')
+        try:
+            result = self._request([(file_path, file_path.stem)], lang, enable_table)
 
-        request_json = {
-            'images': [{
+            # 캐시 저장
+            if use_cache:
+                self.cache[cache_key] = result
+            print("✅ OCR 완료!")
+            return result
+
+        except requests.exceptions.RequestException as e:
+            print(f"❌ API 요청 실패: {e}")
+            raise
+
+    def ocr_batch(
+        self,
+        file_paths: List[str],
+        lang: str = 'ko',
+        enable_table: bool = False,
+        max_images: int = MAX_IMAGES_PER_REQUEST,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 이미지 파일을 요청당 최대 max_images개씩 묶어 OCR
+
+        응답의 images는 요청 시 부여한 이름으로 입력별로 다시 나눕니다.
+
+        Args:
+            file_paths: 이미지/PDF 파일 경로 리스트
+            lang: 언어 코드 (기본값: 'ko')
+            enable_table: 테이블 인식 활성화
+            max_images: 요청당 최대 이미지 수
+            max_bytes: 요청당 최대 업로드 크기 (bytes)
+            use_cache: 결과 캐시 사용 여부
+
+        Returns:
+            입력 순서대로의 OCR 결과 리스트 (각 결과는 ocr_from_file과 같은 형식)
+
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않을 때
+            requests.exceptions.RequestException: API 요청 실패 시
+            ValueError: 응답에 일부 입력의 결과가 없을 때
+
+        Example:
+            >>> results = client.ocr_batch(['id_card.jpg', 'certificate.png'])
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        for path in paths:
+            if not path.exists():
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        pending = []
+        for idx, path in enumerate(paths):
+            cache_key = f"{file_paths[idx]}_{lang}_{enable_table}"
+            if use_cache and cache_key in self.cache:
+                results[idx] = self.cache[cache_key]
+            else:
+                pending.append(idx)
+
+        sizes = {idx: paths[idx].stat().st_size for idx in pending}
+        for batch in plan_batches(pending, sizes, max_images, max_bytes):
+            names = {f"{idx:04d}_{paths[idx].stem}": idx for idx in batch}
+            try:
+                response = self._request(
+                    [(paths[idx], name) for name, idx in names.items()], lang, enable_table
+                )
+            except requests.exceptions.RequestException as e:
+                print(f"❌ API 요청 실패: {e}")
+                raise
+
+            for name, images in split_batch_response(response, list(names)).items():
+                idx = names[name]
+                results[idx] = {**response, 'images': images}
+                if use_cache:
+                    self.cache[f"{file_paths[idx]}_{lang}_{enable_table}"] = results[idx]
+
+            print(f"✅ 배치 OCR 완료! ({len(batch)}개 파일)")
+
+        return results
+
+    def _request(
+        self,
+        images: List[Tuple[Path, str]],
+        lang: str,
+        enable_table: bool
+    ) -> Dict[str, Any]:
+        """
+        타임아웃 산정, 헤지, 지연 관측을 포함한 OCR 요청 1회
+
+        Args:
+            images: (파일 경로, 요청 이미지 이름) 리스트
+        """
+        pages = sum(_count_pages(path) for path, _ in images)
+        size_bytes = sum(path.stat().st_size for path, _ in images)
+
+        if self.timeout is not None:
+            timeout, hedge_delay = self.timeout, None
+        else:
+            timeout = self.timeout_policy.timeout(pages, size_bytes)
+            hedge_delay = self.timeout_policy.hedge_delay(pages, size_bytes) if self.hedge else None
+
+        if hedge_delay is None:
+            result, latency = self._post(images, lang, enable_table, timeout)
+        else:
+            result, latency = self._post_hedged(images, lang, enable_table, timeout, hedge_delay)
+
+        self.timeout_policy.observe(latency, pages, size_bytes)
+        return result
+
+    def _post(
+        self,
+        images: List[Tuple[Path, str]],
+        lang: str,
+        enable_table: bool,
+        timeout: float,
+        session: Optional[_AbortableSession] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        OCR 요청 전송 (엔드포인트 풀이 있으면 가장 한가한 엔드포인트로 보내고 장애 시 전환)
+
+        Args:
+            session: 지정하면 이 세션으로 전송 (헤지 요청의 중단용)
+
+        Returns:
+            (OCR API 응답, 소요 시간(초)) 튜플
+        """
+        if self.endpoints is None:
+            return self._send(
+                images, lang, enable_table, timeout, self.api_url, self.secret_key, session
+            )
+        return self.endpoints.call(
+            lambda endpoint: self._send(
+                images, lang, enable_table, timeout, endpoint.api_url, endpoint.secret_key,
+                session
+            ),
+            timeout=timeout
+        )
+
+    def _send(
+        self,
+        images: List[Tuple[Path, str]],
+        lang: str,
+        enable_table: bool,
+        timeout: float,
+        api_url: str,
+        secret_key: str,
+        session: Optional[_AbortableSession] = None
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        엔드포인트 하나로 OCR 요청 전송 (images 순서대로 file 파트 추가)
+
+        Raises:
+            RequestCancelled: session이 중단되었을 때
+
+        Returns:
+            (OCR API 응답, 소요 시간(초)) 튜플
+        """
+        request_images = []
+        for file_path, name in images:
+            file_ext = file_path.suffix.lower().replace('.', '')
+            request_images.append({
                 'format': file_ext if file_ext != 'jpeg' else 'jpg',
-                'name': file_path.stem
-            }],
+                'name': name
+            })
+
+        request_json = {
+            'images': request_images,
             'requestId': str(uuid.uuid4()),
             'version': 'V2',
             'timestamp': int(round(time.time() * 1000)),
@@ -70,67 +425,345 @@ class ClovaOCRClient:
             'enableTableDetection': enable_table
         }
 
-        payload = {'message': json.dumps(request_json).encode('UTF-8')}
-        files = [('file', open(file_path, 'rb'))]
-        headers = {'X-OCR-SECRET': self.secret_key}
+        # 파일을 메모리에 올리지 않고 청크 단위로 전송
+        encoder = MultipartEncoder(self.upload_chunk_size, self.use_mmap)
+        encoder.add_field('message', json.dumps(request_json).encode('UTF-8'))
+        for file_path, _ in images:
+            encoder.add_file('file', file_path)
+        headers = {'X-OCR-SECRET': secret_key, 'Content-Type': encoder.content_type}
 
-        try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                data=payload,
-                files=files,
-                timeout=DEFAULT_TIMEOUT
-            )
+        with self._stats_lock:
+            self.requests_sent += 1
 
+        start = time.perf_counter()
+        post = session.post if session is not None else requests.post
+        try:
+            with encoder:
+                response = post(
+                    api_url,
+                    headers=headers,
+                    data=encoder,
+                    timeout=timeout
+                )
             response.raise_for_status()
-            result = response.json()
-
-            # 캐시 저장
-            self.cache[cache_key] = result
-            print("✅ OCR 완료!")
-            return result
-
+            return response.json(), time.perf_counter() - start
         except requests.exceptions.RequestException as e:
-            print(f"❌ API 요청 실패: {e}")
+            if session is not None and session.aborted:
+                raise RequestCancelled("헤지 요청에 밀려 중단됨") from e
             raise
+
+    def _post_hedged(
+        self,
+        images: List[Tuple[Path, str]],
+        lang: str,
+        enable_table: bool,
+        timeout: float,
+        hedge_delay: float
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        헤지 요청 전송: 기본 요청이 hedge_delay 안에 끝나지 않으면 중복 요청을 보내고
+        먼저 성공한 응답을 사용
+
+        요청마다 별도 세션을 사용하고, 끝나면 진 쪽 세션의 연결을 끊어 바로 정리합니다.
+
+        Returns:
+            (OCR API 응답, 기본 요청 시작부터의 소요 시간(초)) 튜플
+            (지연 학습에는 헤지 대기 시간을 포함한 실제 응답 시간을 사용)
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+        futures: Dict[Future, _AbortableSession] = {}
+
+        def submit() -> Future:
+            session = _AbortableSession()
+            future = executor.submit(self._post, images, lang, enable_table, timeout, session)
+            futures[future] = session
+            return future
+
+        start = time.perf_counter()
+        try:
+            primary = submit()
+            done, _ = wait([primary], timeout=hedge_delay)
+            if done or not self._acquire_hedge():
+                return primary.result()[0], time.perf_counter() - start
+
+            print(f"⏱️ 응답 지연 ({hedge_delay:.1f}초 초과) - 헤지 요청 발송")
+            pending = {primary, submit()}
+            first_error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()[0], time.perf_counter() - start
+                    first_error = first_error or future.exception()
+            raise first_error
         finally:
-            files[0][1].close()
+            for session in futures.values():
+                session.abort()
+            executor.shutdown(wait=False)
+
+    def _acquire_hedge(self) -> bool:
+        """헤지 예산 확인 후 사용 (요청 대비 비율 상한)"""
+        with self._stats_lock:
+            if self.hedges_sent + 1 > self.max_hedge_ratio * self.requests_sent:
+                return False
+            self.hedges_sent += 1
+            return True
+
+
+class OCRBatcher:
+    """작은 파일 큐에서 자동으로 묶음을 구성해 ocr_batch로 전송"""
+
+    _CLOSE = object()
+
+    def __init__(
+        self,
+        client: ClovaOCRClient,
+        lang: str = 'ko',
+        enable_table: bool = False,
+        max_images: int = MAX_IMAGES_PER_REQUEST,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        max_wait: float = DEFAULT_BATCH_MAX_WAIT,
+        max_concurrent_batches: int = 4,
+        dispatcher=None
+    ):
+        """
+        Args:
+            client: OCR 클라이언트
+            lang: 언어 코드
+            enable_table: 테이블 인식 활성화
+            max_images: 요청당 최대 이미지 수
+            max_bytes: 요청당 최대 업로드 크기 (bytes)
+            max_wait: 첫 파일이 들어온 뒤 묶음을 채우기 위해 기다리는 최대 시간 (초)
+            max_concurrent_batches: 동시에 전송할 최대 묶음 수
+            dispatcher: 지정하면 묶음 전송을 적응형 동시성/서킷 브레이커로 감쌈
+                (concurrency.AdaptiveDispatcher, 실제 동시 수는 둘 중 작은 값)
+
+        Example:
+            >>> with OCRBatcher(client) as batcher:
+            ...     futures = [batcher.submit(path) for path in small_images]
+            >>> results = [future.result() for future in futures]
+        """
+        self.client = client
+        self.lang = lang
+        self.enable_table = enable_table
+        self.max_images = max_images
+        self.max_bytes = max_bytes
+        self.max_wait = max_wait
+        self.dispatcher = dispatcher
+
+        self._queue: queue.Queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_batches)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, file_path: str) -> Future:
+        """
+        파일을 큐에 추가
+
+        Returns:
+            해당 파일의 OCR 결과를 담을 Future
+        """
+        future: Future = Future()
+        self._queue.put((file_path, Path(file_path).stat().st_size, future))
+        return future
+
+    def close(self) -> None:
+        """남은 파일을 모두 전송하고 종료"""
+        self._queue.put(self._CLOSE)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'OCRBatcher':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        carry = None
+        closing = False
+        while not closing or carry is not None:
+            item = carry if carry is not None else self._queue.get()
+            carry = None
+            if item is self._CLOSE:
+                break
+
+            batch, batch_bytes = [item], item[1]
+            deadline = time.monotonic() + self.max_wait
+            # 종료 신호 이후에는 더 들어올 파일이 없으므로 남은 파일을 바로 전송
+            while len(batch) < self.max_images and not closing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is self._CLOSE:
+                    closing = True
+                    break
+                if batch_bytes + nxt[1] > self.max_bytes:
+                    carry = nxt
+                    break
+                batch.append(nxt)
+                batch_bytes += nxt[1]
+
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List[Tuple[str, int, Future]]) -> None:
+        call = self.dispatcher.call if self.dispatcher is not None else (
+            lambda fn, *args, **kwargs: fn(*args, **kwargs)
+        )
+        try:
+            results = call(
+                self.client.ocr_batch,
+                [file_path for file_path, _, _ in batch],
+                lang=self.lang,
+                enable_table=self.enable_table,
+                max_images=self.max_images,
+                max_bytes=self.max_bytes
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def plan_batches(
+    items: List[Any],
+    sizes: Dict[Any, int],
+    max_images: int = MAX_IMAGES_PER_REQUEST,
+    max_bytes: int = MAX_REQUEST_BYTES
+) -> List[List[Any]]:
+    """
+    입력 순서를 유지하며 이미지 수/업로드 크기 상한 내로 묶음 구성
+
+    상한보다 큰 파일은 단독 묶음이 됩니다.
+
+    Args:
+        items: 묶을 항목 리스트
+        sizes: {항목: 바이트 크기}
+        max_images: 묶음당 최대 항목 수
+        max_bytes: 묶음당 최대 바이트 수
+
+    Returns:
+        묶음 리스트
+    """
+    batches, current, current_bytes = [], [], 0
+    for item in items:
+        size = sizes[item]
+        if current and (len(current) >= max_images or current_bytes + size > max_bytes):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(item)
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def split_batch_response(
+    response: Dict[str, Any],
+    names: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    묶음 요청 응답의 images를 요청 이미지 이름별로 분리
+
+    응답에 이름이 없으면 요청 순서대로 하나씩 대응시킵니다.
+
+    Args:
+        response: OCR API 응답
+        names: 요청에 사용한 이미지 이름 리스트
+
+    Returns:
+        {이름: 해당 입력의 images 리스트}
+
+    Raises:
+        ValueError: 응답에 결과가 없는 입력이 있을 때 (페이지 없는 성공으로 처리하지 않음)
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {name: [] for name in names}
+    images = response.get('images', [])
+    if all(image.get('name') in grouped for image in images):
+        for image in images:
+            grouped[image['name']].append(image)
+    else:
+        for name, image in zip(names, images):
+            grouped[name].append(image)
+
+    missing = [name for name, group in grouped.items() if not group]
+    if missing:
+        raise ValueError(f"응답에 결과가 없는 입력: {', '.join(missing)}")
+    return grouped
+
+
+def _count_pages(file_path: Path) -> int:
+    """PDF 페이지 수 (PDF가 아니거나 열 수 없으면 1)"""
+    if file_path.suffix.lower() != '.pdf':
+        return 1
+    try:
+        with fitz.open(file_path) as doc:
+            return max(1, doc.page_count)
+    except Exception:
+        return 1
 
 
 class OCROutputManager:
     """OCR 결과 저장 경로 관리"""
 
+    # 완료된 산출물 목록을 기록하는 마커 파일
+    MANIFEST_FILENAME = MANIFEST_FILENAME
+
     def __init__(
         self,
         source_pdf: str,
         output_base: str = "./output",
-        project_name: Optional[str] = None
+        project_name: Optional[str] = None,
+        storage: Optional[OutputStorage] = None
     ):
         """
         Args:
             source_pdf: 원본 PDF 파일 경로
             output_base: 출력 루트 디렉토리 (기본값: ./output)
-            project_name: 프로젝트 폴더명 (기본값: None, PDF 파일명 사용)
+            project_name: 프로젝트 폴더명 (기본값: None, 저장소의 기본 문서 ID 사용)
+            storage: 저장소 백엔드 (기본값: output_base 아래 문서별 디렉토리)
         """
         self.source_pdf = Path(source_pdf)
         self.pdf_name = self.source_pdf.stem
         self.output_base = Path(output_base)
+        self.storage = storage or DirectoryStorage(output_base)
+
+        # 프로젝트명 결정: 사용자 지정 > 저장소 기본 ID (디렉토리 저장소는 PDF 파일명)
+        self.project_name = project_name or self.storage.document_id(str(self.source_pdf))
 
-        # 프로젝트명 결정: 사용자 지정 > PDF 파일명
-        self.project_name = project_name or self.pdf_name
+        # PDF별 전용 디렉토리 (디렉토리 기반 저장소만 해당)
+        self.project_dir = (
+            self.storage.project_dir(self.project_name)
+            if isinstance(self.storage, DirectoryStorage) else None
+        )
 
-        # PDF별 전용 디렉토리
-        self.project_dir = self.output_base / self.project_name
+    def location(self, filename: Optional[str] = None) -> str:
+        """출력 메시지용 저장 위치 (filename을 지정하면 해당 산출물 위치)"""
+        return self.storage.location(self.project_name, filename)
 
-    def setup_directories(self) -> None:
-        """필요한 디렉토리 생성"""
-        self.project_dir.mkdir(parents=True, exist_ok=True)
-        print(f"📁 출력 디렉토리: {self.project_dir}")
+    def setup_directories(self, overwrite: bool = False) -> None:
+        """
+        필요한 디렉토리 생성
+
+        Args:
+            overwrite: 다른 원본에 연결된 프로젝트도 이 원본으로 다시 연결해 덮어쓰기
+
+        Raises:
+            FileExistsError: 같은 프로젝트명에 다른 원본의 결과가 있을 때 (overwrite=False)
+        """
+        self.storage.prepare(self.project_name)
+        self.storage.claim(self.project_name, str(self.source_pdf), overwrite)
+        print(f"📁 출력 디렉토리: {self.location()}")
 
     def get_path(self, filename: str) -> Path:
         """
-        저장 경로 반환
+        저장 경로 반환 (디렉토리 기반 저장소만 해당)
 
         Args:
             filename: 저장할 파일명 (예: 'ocr_result.json')
@@ -138,4 +771,69 @@ class OCROutputManager:
         Returns:
             전체 경로 (예: ./output/test2/ocr_result.json)
         """
+        if self.project_dir is None:
+            raise TypeError(f"{type(self.storage).__name__}는 파일 경로를 제공하지 않습니다")
         return self.project_dir / filename
+
+    def atomic_path(self, filename: str):
+        """
+        임시 파일 경로를 제공하고, 블록이 성공하면 최종 산출물로 원자적으로 반영
+
+        블록에서 예외가 발생하면 임시 파일을 삭제하고 기존 파일은 그대로 둡니다.
+
+        Args:
+            filename: 최종 파일명 (예: 'ocr_result.json')
+
+        Yields:
+            임시 파일 경로
+        """
+        return self.storage.atomic_path(self.project_name, filename)
+
+    def invalidate_manifest(self) -> None:
+        """완료 마커 제거 (새 결과 저장 시작 전 호출)"""
+        self.storage.delete(self.project_name, self.MANIFEST_FILENAME)
+
+    def write_manifest(
+        self,
+        artifacts: List[str],
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        완료된 산출물 목록을 마커 파일로 기록
+
+        Args:
+            artifacts: 저장이 완료된 파일명 리스트
+            extra: 마커에 함께 기록할 추가 정보 (예: {'duplicate_of': [...]})
+
+        Returns:
+            마커 저장 위치
+        """
+        manifest = {
+            'source_pdf': str(self.source_pdf),
+            'completed_at': int(round(time.time() * 1000)),
+            'artifacts': {
+                name: self.storage.size(self.project_name, name) for name in sorted(artifacts)
+            },
+            **(extra or {}),
+        }
+        with self.atomic_path(self.MANIFEST_FILENAME) as tmp_path:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return self.location(self.MANIFEST_FILENAME)
+
+    @classmethod
+    def read_manifest(cls, project_dir: Path) -> Optional[Dict[str, Any]]:
+        """
+        완료 마커 읽기
+
+        Args:
+            project_dir: 프로젝트 디렉토리
+
+        Returns:
+            마커 내용 (마커가 없으면 None)
+        """
+        manifest_path = Path(project_dir) / cls.MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
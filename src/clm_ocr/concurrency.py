@@ -0,0 +1,442 @@
+"""
+적응형 동시성 제어 및 서킷 브레이커
+관측된 지연/오류에 따라 동시 요청 수를 AIMD로 조정하고, 실패가 이어지는 엔드포인트로의 전송을 중단
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional
+
+import requests
+
+from .client import ClovaOCRClient, _count_pages
+from .config import (
+    CONCURRENCY_INITIAL, CONCURRENCY_MIN, CONCURRENCY_MAX, CONCURRENCY_DECREASE_FACTOR,
+    CONCURRENCY_LATENCY_TOLERANCE, BREAKER_FAILURE_THRESHOLD, BREAKER_RECOVERY_TIME,
+)
+
+# 과부하로 간주하는 HTTP 상태 코드 (서킷 브레이커 실패로 집계)
+OVERLOAD_STATUS = {429, 500, 502, 503, 504}
+
+
+class AIMDLimiter:
+    """
+    동시 요청 수 제한 (Additive Increase / Multiplicative Decrease)
+
+    성공할 때마다 한도를 1/한도씩 늘려(왕복 1회당 약 +1) 천천히 올리고,
+    과부하 신호(429/5xx/타임아웃 또는 지연 증가)가 오면 한도를 decrease_factor배로 줄입니다.
+    같은 혼잡 구간에서 시작된 요청들의 실패는 한 번만 감소시킵니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = CONCURRENCY_INITIAL,
+        min_limit: int = CONCURRENCY_MIN,
+        max_limit: int = CONCURRENCY_MAX,
+        decrease_factor: float = CONCURRENCY_DECREASE_FACTOR,
+        latency_tolerance: float = CONCURRENCY_LATENCY_TOLERANCE,
+        window: int = 100,
+        min_samples: int = 10
+    ):
+        """
+        Args:
+            initial_limit: 초기 동시 요청 수
+            min_limit: 동시 요청 수 하한
+            max_limit: 동시 요청 수 상한
+            decrease_factor: 과부하 시 한도 감소 배수
+            latency_tolerance: 최근 최소 지연 대비 과부하 판정 배수
+            window: 지연 기준선 계산에 사용할 최근 관측 수
+            min_samples: 지연 기반 판정을 시작할 최소 관측 수
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.min_samples = min_samples
+
+        self._limit = float(min(max_limit, max(min_limit, initial_limit)))
+        self._in_flight = 0
+        self._epoch = 0
+        self._latencies = deque(maxlen=window)
+        self._cond = threading.Condition()
+
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 요청 수"""
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        진행 중인 요청 수가 한도 미만이 될 때까지 대기 후 슬롯 확보
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            release에 넘길 토큰 (시간 초과 시 None)
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._in_flight < self.limit, timeout):
+                return None
+            self._in_flight += 1
+            return self._epoch
+
+    def release(
+        self,
+        token: int,
+        latency: Optional[float] = None,
+        overloaded: bool = False
+    ) -> None:
+        """
+        슬롯 반납 및 한도 조정
+
+        Args:
+            token: acquire가 반환한 토큰
+            latency: 성공한 요청의 (정규화된) 지연 시간. None이면 지연 판정 생략
+            overloaded: 과부하 응답(429/5xx/타임아웃) 여부
+        """
+        with self._cond:
+            self._in_flight -= 1
+
+            if latency is not None and not overloaded:
+                if len(self._latencies) >= self.min_samples:
+                    overloaded = latency > self.latency_tolerance * min(self._latencies)
+                self._latencies.append(latency)
+
+            if overloaded:
+                # 감소 이후에 시작된 요청의 신호만 반영 (혼잡 구간당 1회 감소)
+                if token == self._epoch:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._epoch += 1
+                    self.decreases += 1
+            elif latency is not None and self._limit < self.max_limit:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+                self.increases += 1
+
+            self._cond.notify_all()
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 전송을 차단하고, recovery_time 후 시험 요청 1건으로 복구 여부 확인
+
+    상태: closed(정상) -> open(차단) -> half_open(시험 요청 1건) -> closed 또는 open
+    차단될 때마다 세대(epoch)가 바뀌며, 이전 세대에 시작된 요청의 결과는 무시합니다
+    (차단 전에 보낸 요청이 늦게 실패해도 시험 요청의 결과로 취급하지 않음).
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_time: float = BREAKER_RECOVERY_TIME,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_threshold: 차단까지의 연속 실패 횟수
+            recovery_time: 차단 후 시험 요청까지 대기 시간 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._clock = clock
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._epoch = 0
+        self._cond = threading.Condition()
+
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (차단 시간이 지났으면 half_open)"""
+        with self._cond:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_time:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def acquire(self) -> Optional[int]:
+        """
+        지금 요청을 보내도 되면 토큰 반환 (half_open이면 시험 요청 1건만 허용)
+
+        Returns:
+            record_*에 넘길 토큰 (차단 중이면 None, 토큰을 받았으면 결과를 반드시 보고)
+        """
+        with self._cond:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return self._epoch
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return self._epoch
+            return None
+
+    def allow(self) -> bool:
+        """acquire의 토큰 없는 버전 (결과를 토큰 없이 보고하면 현재 세대로 취급)"""
+        return self.acquire() is not None
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        전송이 허용될 때까지 대기 (차단 중인 작업은 실패시키지 않고 보류)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            record_*에 넘길 토큰 (시간 초과 시 None)
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            token = self.acquire()
+            if token is not None:
+                return token
+            with self._cond:
+                wait_for = self.recovery_time - (self._clock() - self._opened_at)
+                if self._state == self.HALF_OPEN:
+                    wait_for = self.recovery_time   # 시험 요청 결과를 기다림
+                if deadline is not None:
+                    wait_for = min(wait_for, deadline - self._clock())
+                    if wait_for <= 0:
+                        return False
+                self._cond.wait(max(0.01, wait_for))
+
+    def _is_stale(self, token: Optional[int]) -> bool:
+        return token is not None and token != self._epoch
+
+    def record_success(self, token: Optional[int] = None) -> None:
+        with self._cond:
+            if self._is_stale(token):
+                return
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+            self._cond.notify_all()
+
+    def record_failure(self, token: Optional[int] = None) -> None:
+        with self._cond:
+            if self._is_stale(token):
+                return
+            self._failures += 1
+            state = self._current_state()
+            # 차단 중에 뒤늦게 도착한 실패는 차단 시간을 연장하지 않음
+            if state != self.OPEN and (state == self.HALF_OPEN
+                                       or self._failures >= self.failure_threshold):
+                self.opens += 1
+                print(f"🚫 서킷 차단: 연속 {self._failures}회 실패, "
+                      f"{self.recovery_time:.0f}초 후 재시도")
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._epoch += 1
+            self._probe_in_flight = False
+            self._cond.notify_all()
+
+    def record_ignored(self, token: Optional[int] = None) -> None:
+        """엔드포인트 상태와 무관한 실패(잘못된 요청 등) 보고 - 시험 요청 슬롯만 반납"""
+        with self._cond:
+            if self._is_stale(token):
+                return
+            self._probe_in_flight = False
+            self._cond.notify_all()
+
+
+def is_overload_error(error: Exception) -> bool:
+    """과부하/엔드포인트 장애로 볼 예외인지 (429/5xx/타임아웃/연결 실패)"""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code in OVERLOAD_STATUS
+
+
+def _retry_after(error: Exception) -> float:
+    response = getattr(error, 'response', None)
+    try:
+        return float(response.headers.get('Retry-After', 0)) if response is not None else 0.0
+    except ValueError:
+        return 0.0
+
+
+class AdaptiveDispatcher:
+    """
+    AIMDLimiter + CircuitBreaker로 호출을 감싸는 전송기
+
+    서킷이 차단된 동안 호출은 대기하며(작업 보류), 과부하 오류는 max_attempts까지 재시도합니다.
+
+    Example:
+        >>> dispatcher = AdaptiveDispatcher()
+        >>> result = dispatcher.call(client.ocr_from_file, 'a.pdf', use_cache=False)
+        >>> dispatcher.metrics()
+    """
+
+    def __init__(
+        self,
+        limiter: Optional[AIMDLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: int = 3
+    ):
+        """
+        Args:
+            limiter: 동시 요청 수 제한 (기본값: AIMDLimiter())
+            breaker: 서킷 브레이커 (기본값: CircuitBreaker())
+            max_attempts: 과부하 오류 시 최대 시도 횟수
+        """
+        self.limiter = limiter or AIMDLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+
+    def call(self, fn: Callable[..., Any], *args, cost: float = 1.0, **kwargs) -> Any:
+        """
+        제한/차단 규칙에 따라 fn(*args, **kwargs) 호출
+
+        Args:
+            fn: 호출할 함수 (예: client.ocr_from_file)
+            cost: 지연 정규화 기준 (예: 정적 소요 시간 추정치). 지연 / cost로 비교
+            *args, **kwargs: fn 인자
+
+        Returns:
+            fn 반환값
+
+        Raises:
+            fn이 발생시킨 예외 (재시도 횟수 초과 또는 재시도 불가 오류)
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            with self._lock:
+                self._waiting += 1
+            try:
+                permit = self.breaker.wait()
+                token = self.limiter.acquire()
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+            start = time.perf_counter()
+            latency, error = None, None
+            try:
+                result = fn(*args, **kwargs)
+                latency = (time.perf_counter() - start) / cost
+            except Exception as e:
+                error = e
+            finally:
+                # KeyboardInterrupt 등 다른 예외로 빠져나가도 슬롯과 시험 요청 자리를 반납
+                overloaded = error is not None and is_overload_error(error)
+                self.limiter.release(token, latency=latency, overloaded=overloaded)
+                if latency is not None:
+                    self.breaker.record_success(permit)
+                elif overloaded:
+                    self.breaker.record_failure(permit)
+                else:
+                    self.breaker.record_ignored(permit)
+
+            if error is None:
+                with self._lock:
+                    self.succeeded += 1
+                return result
+
+            if not overloaded or attempt == self.max_attempts:
+                with self._lock:
+                    self.failed += 1
+                raise error
+            with self._lock:
+                self.retried += 1
+            delay = _retry_after(error)
+            if delay:
+                time.sleep(delay)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        현재 상태 지표
+
+        Returns:
+            {'limit', 'in_flight', 'waiting', 'breaker_state', 'breaker_opens',
+             'increases', 'decreases', 'succeeded', 'failed', 'retried'}
+        """
+        with self._lock:
+            return {
+                'limit': self.limiter.limit,
+                'in_flight': self.limiter.in_flight,
+                'waiting': self._waiting,
+                'breaker_state': self.breaker.state,
+                'breaker_opens': self.breaker.opens,
+                'increases': self.limiter.increases,
+                'decreases': self.limiter.decreases,
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'retried': self.retried,
+            }
+
+
+def ocr_many(
+    client: ClovaOCRClient,
+    file_paths: List[str],
+    lang: str = 'ko',
+    enable_table: bool = False,
+    dispatcher: Optional[AdaptiveDispatcher] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    여러 파일을 적응형 동시성으로 OCR
+
+    스레드는 limiter.max_limit개까지 만들지만, 실제 동시 요청 수는 AIMD 한도를 따릅니다.
+
+    Args:
+        client: ClovaOCRClient
+        file_paths: PDF/이미지 파일 경로 리스트
+        lang: 언어 코드
+        enable_table: 테이블 인식 활성화
+        dispatcher: 전송기 (기본값: AdaptiveDispatcher())
+
+    Returns:
+        입력 순서대로의 OCR 결과 리스트 (실패한 파일은 None)
+
+    Example:
+        >>> dispatcher = AdaptiveDispatcher()
+        >>> results = ocr_many(client, pdf_paths, dispatcher=dispatcher)
+        >>> print(dispatcher.metrics())
+    """
+    dispatcher = dispatcher or AdaptiveDispatcher()
+
+    def run(file_path: str) -> Optional[Dict[str, Any]]:
+        path = Path(file_path)
+        try:
+            # 문서 크기가 달라도 지연을 비교할 수 있도록 정적 추정치로 정규화
+            cost = client.timeout_policy.estimate(_count_pages(path), path.stat().st_size)
+            return dispatcher.call(
+                client.ocr_from_file, file_path, lang=lang, enable_table=enable_table,
+                use_cache=False, cost=cost
+            )
+        except Exception as e:
+            print(f"❌ {file_path} 처리 실패: {e}")
+            return None
+
+    workers = max(1, min(dispatcher.limiter.max_limit, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, file_paths))
+
+    metrics = dispatcher.metrics()
+    print(f"📈 동시 요청 한도 {metrics['limit']} (감소 {metrics['decreases']}회), "
+          f"서킷 {metrics['breaker_state']}")
+    return results
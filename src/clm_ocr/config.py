@@ -40,10 +40,99 @@ OUTPUT_DIR = PROJECT_ROOT / 'output'
 # OCR 설정
 # ============================================
 DEFAULT_LANG = 'ko'
-DEFAULT_TIMEOUT = 30
 DEFAULT_ENABLE_TABLE = False
 
+# 요청당 이미지 수 / 업로드 크기 상한 (도메인 설정에 맞게 조정)
+MAX_IMAGES_PER_REQUEST = 10
+MAX_REQUEST_BYTES = 50 * 1024 * 1024
+# 자동 배치: 첫 파일이 들어온 뒤 묶음을 채우기 위해 기다리는 최대 시간 (초)
+DEFAULT_BATCH_MAX_WAIT = 0.2
+
+# ============================================
+# 적응형 타임아웃 / 헤지 요청 설정
+# ============================================
+# 정적 추정치 = 기본 + 페이지당 * 페이지 수 + MB당 * 파일 크기(MB)
+TIMEOUT_BASE = 10
+TIMEOUT_PER_PAGE = 3
+TIMEOUT_PER_MB = 2
+TIMEOUT_MIN = 5
+TIMEOUT_MAX = 600
+# 관측 지연 p99 대비 타임아웃 여유 배수
+TIMEOUT_MULTIPLIER = 3.0
+# 학습 전 최소 관측 수
+TIMEOUT_MIN_SAMPLES = 20
+# 전체 요청 대비 헤지(중복) 요청 최대 비율
+DEFAULT_MAX_HEDGE_RATIO = 0.05
+
+# ============================================
+# 적응형 동시성 / 서킷 브레이커 설정
+# ============================================
+# 동시 요청 수 초기값 / 하한 / 상한
+CONCURRENCY_INITIAL = 4
+CONCURRENCY_MIN = 1
+CONCURRENCY_MAX = 32
+# 과부하(429/5xx/타임아웃/지연 증가) 시 동시 요청 수 감소 배수
+CONCURRENCY_DECREASE_FACTOR = 0.5
+# 최근 최소 지연 대비 이 배수를 넘으면 과부하로 판단
+CONCURRENCY_LATENCY_TOLERANCE = 2.0
+# 연속 실패 횟수가 이 값에 도달하면 서킷 차단
+BREAKER_FAILURE_THRESHOLD = 5
+# 차단 후 시험 요청을 보내기까지 대기 시간 (초)
+BREAKER_RECOVERY_TIME = 30.0
+
 # ============================================
 # 출력 설정
 # ============================================
 DEFAULT_OUTPUT_FORMATS = ['json', 'text', 'dataframe']
+# 출력 파일 동시 저장 스레드 수
+DEFAULT_WRITER_WORKERS = 4
+# 스트리밍 모드에서 한 번에 OCR 요청할 페이지 수
+DEFAULT_STREAM_CHUNK_PAGES = 10
+# LLM/임베딩용 청크 내보내기: 청크 최대 길이 / 이전 청크와 겹치는 길이 (length_fn 단위)
+DEFAULT_CHUNK_LENGTH = 1000
+DEFAULT_CHUNK_OVERLAP = 100
+# 병렬 변환을 사용할 최소 페이지 수 (이보다 작으면 프로세스 풀 비용이 더 커서 순차 처리)
+PARALLEL_MIN_PAGES = 200
+
+# ============================================
+# 파이프라인 처리 설정
+# ============================================
+# 단계별 워커 수 (읽기 / API 대기 / 변환 / 저장)
+PIPELINE_READ_WORKERS = 2
+PIPELINE_API_WORKERS = 8
+PIPELINE_CONVERT_WORKERS = 2
+PIPELINE_WRITE_WORKERS = 2
+# 단계 사이 대기열 크기 (가득 차면 앞 단계가 멈춰 메모리 사용량 제한)
+PIPELINE_QUEUE_SIZE = 4
+
+# ============================================
+# 저신뢰 영역 재인식 설정
+# ============================================
+# 이 신뢰도 미만 필드를 재인식 (to_markdown/filter_by_confidence 기준과 동일)
+REFINE_CONFIDENCE = 0.9
+# 영역을 잘라낼 해상도 (DPI)
+REFINE_DPI = 300
+# 영역 주변 여백 (OCR 좌표 단위)
+REFINE_PADDING = 4
+
+# ============================================
+# 배치 사전 점검 설정
+# ============================================
+# 한 변이 이 크기(PDF 포인트, 약 70cm)를 넘는 페이지는 과대 페이지로 표시
+PREFLIGHT_MAX_PAGE_SIDE = 2000
+# 페이지당 예상 비용 (원, 요금제에 맞게 조정)
+OCR_COST_PER_PAGE = 3.0
+
+# ============================================
+# 관심 영역(ROI) 템플릿 설정
+# ============================================
+# 템플릿 영역을 잘라낼 해상도 (DPI)
+TEMPLATE_DPI = 200
+
+# ============================================
+# 결과 캐시 설정
+# ============================================
+# load_saved_result 캐시의 최대 메모리 (bytes, 초과 시 가장 오래 사용하지 않은 프로젝트부터 제거)
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+# 미리 불러오기 스레드 수
+CACHE_PREFETCH_WORKERS = 4
@@ -0,0 +1,355 @@
+"""
+유사(near-duplicate) 문서 탐지
+추출 텍스트의 MinHash/LSH와 렌더링한 페이지의 지각 해시(dHash)로 재제출 문서 검색
+"""
+import json
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from .processor import OCRProcessor
+from .storage import OutputStorage, DirectoryStorage
+
+# MinHash 순열 계산용 메르센 소수 (2^61 - 1)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# dHash 렌더링 크기 (가로 9 x 세로 8 → 64비트)
+_DHASH_COLS, _DHASH_ROWS = 9, 8
+
+
+def page_hash(page: fitz.Page) -> int:
+    """
+    페이지 지각 해시(dHash, 64비트) 계산
+
+    페이지를 작은 흑백 이미지로 렌더링한 뒤 9x8 평균 격자의 좌우 밝기 차이를 비트로 기록합니다.
+    재스캔/재출력으로 생긴 작은 차이에는 해밍 거리가 작게 유지됩니다.
+
+    Args:
+        page: PyMuPDF 페이지
+
+    Returns:
+        64비트 정수 해시
+    """
+    zoom = 64 / max(page.rect.width, 1)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+    pixels = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+    pixels = pixels[:, :pix.width].astype(np.float64)
+
+    # 격자 평균 (area 축소)
+    row_edges = np.linspace(0, pix.height, _DHASH_ROWS + 1).astype(int)
+    col_edges = np.linspace(0, pix.width, _DHASH_COLS + 1).astype(int)
+    sums = np.add.reduceat(pixels, row_edges[:-1], axis=0)
+    sums = np.add.reduceat(sums, col_edges[:-1], axis=1)
+    counts = np.outer(np.diff(row_edges), np.diff(col_edges))
+    grid = sums / np.maximum(counts, 1)
+
+    bits = (grid[:, 1:] > grid[:, :-1]).ravel()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def result_text(ocr_result: Dict[str, Any]) -> str:
+    """인덱싱용 OCR 결과 텍스트 (페이지 구분자 제외)"""
+    return '\n'.join(OCRProcessor.page_to_text(image) for image in ocr_result.get('images', []))
+
+
+def pdf_page_hashes(pdf_path: str, max_pages: Optional[int] = None) -> List[int]:
+    """
+    PDF 각 페이지의 지각 해시 계산 (열 수 없는 파일은 빈 리스트)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        max_pages: 앞에서부터 계산할 최대 페이지 수
+
+    Returns:
+        페이지별 64비트 해시 리스트
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            pages = range(min(doc.page_count, max_pages or doc.page_count))
+            return [page_hash(doc[idx]) for idx in pages]
+    except Exception:
+        return []
+
+
+def pdf_text_layer(pdf_path: str) -> str:
+    """OCR 전 조회용 PDF 텍스트 레이어 (스캔 문서면 빈 문자열)"""
+    try:
+        with fitz.open(pdf_path) as doc:
+            return '\n'.join(page.get_text() for page in doc)
+    except Exception:
+        return ''
+
+
+class DuplicateIndex:
+    """MinHash/LSH 및 dHash 밴드 인덱스 기반 유사 문서 검색"""
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        max_distance: int = 5,
+        text_threshold: float = 0.8,
+        page_threshold: float = 0.8,
+        seed: int = 1
+    ):
+        """
+        Args:
+            num_perm: MinHash 순열 수 (서명 길이)
+            bands: LSH 밴드 수 (num_perm의 약수)
+            shingle_size: 문자 n-gram 크기
+            max_distance: 같은 페이지로 볼 dHash 최대 해밍 거리
+            text_threshold: 유사 문서로 볼 추정 Jaccard 유사도 하한
+            page_threshold: 유사 문서로 볼 페이지 일치 비율 하한
+            seed: MinHash 순열 시드
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.max_distance = max_distance
+        self.text_threshold = text_threshold
+        self.page_threshold = page_threshold
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64)
+
+        # 해밍 거리 d 이내면 d+1개 밴드 중 하나는 반드시 일치 (비둘기집 원리)
+        edges = np.linspace(0, 64, max_distance + 2).astype(int)
+        self._page_masks = [
+            (int(lo), ((1 << int(hi - lo)) - 1)) for lo, hi in zip(edges[:-1], edges[1:])
+        ]
+
+        self.doc_ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._signatures: List[Optional[np.ndarray]] = []
+        self._page_hashes: List[List[int]] = []
+        self._text_buckets = defaultdict(list)
+        self._page_buckets = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    # ============================================
+    # 서명 계산
+    # ============================================
+
+    def text_signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        텍스트의 MinHash 서명 계산
+
+        Args:
+            text: 문서 텍스트
+
+        Returns:
+            uint32 서명 배열 (텍스트가 shingle보다 짧으면 None)
+        """
+        normalized = re.sub(r'\s+', '', text).lower()
+        if len(normalized) < self.shingle_size:
+            return None
+
+        shingles = {
+            normalized[i:i + self.shingle_size]
+            for i in range(len(normalized) - self.shingle_size + 1)
+        }
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _text_keys(self, signature: np.ndarray) -> List[int]:
+        rows = self.num_perm // self.bands
+        return [
+            hash((band, signature[band * rows:(band + 1) * rows].tobytes()))
+            for band in range(self.bands)
+        ]
+
+    def _page_keys(self, value: int) -> List[tuple]:
+        return [(band, (value >> shift) & mask)
+                for band, (shift, mask) in enumerate(self._page_masks)]
+
+    # ============================================
+    # 추가 / 조회
+    # ============================================
+
+    def add(
+        self,
+        doc_id: str,
+        text: Optional[str] = None,
+        page_hashes: Optional[Sequence[int]] = None
+    ) -> None:
+        """
+        문서를 인덱스에 추가 (같은 doc_id는 무시)
+
+        Args:
+            doc_id: 문서 ID (프로젝트명)
+            text: 추출 텍스트
+            page_hashes: 페이지별 지각 해시
+        """
+        if doc_id in self._positions:
+            return
+        signature = self.text_signature(text) if text else None
+        self._insert(doc_id, signature, list(page_hashes or []))
+
+    def _insert(self, doc_id: str, signature: Optional[np.ndarray], hashes: List[int]) -> None:
+        position = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self._positions[doc_id] = position
+        self._signatures.append(signature)
+        self._page_hashes.append(hashes)
+
+        if signature is not None:
+            for key in self._text_keys(signature):
+                self._text_buckets[key].append(position)
+        for value in set(hashes):
+            for key in self._page_keys(value):
+                self._page_buckets[key].append(position)
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        page_hashes: Optional[Sequence[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        유사 문서 검색 (LSH 버킷에 걸린 후보만 비교하므로 코퍼스 크기에 준선형)
+
+        Args:
+            text: 조회할 문서 텍스트 (OCR 전이면 PDF 텍스트 레이어).
+                비어 있거나 shingle보다 짧으면 텍스트 조회를 건너뛰고 페이지 해시로만 찾음
+            page_hashes: 조회할 문서의 페이지별 지각 해시
+
+        Returns:
+            유사도 내림차순 매치 리스트
+            [{'doc_id': ..., 'text_similarity': 0.93, 'page_similarity': 1.0}, ...]
+        """
+        signature = self.text_signature(text) if text else None
+        hashes = list(page_hashes or [])
+        scores: Dict[int, Dict[str, float]] = defaultdict(
+            lambda: {'text_similarity': 0.0, 'page_similarity': 0.0}
+        )
+
+        if signature is not None:
+            candidates = {pos for key in self._text_keys(signature)
+                          for pos in self._text_buckets.get(key, [])}
+            for pos in candidates:
+                similarity = float(np.mean(self._signatures[pos] == signature))
+                if similarity >= self.text_threshold:
+                    scores[pos]['text_similarity'] = similarity
+
+        if hashes:
+            matched = defaultdict(int)
+            for value in hashes:
+                candidates = {pos for key in self._page_keys(value)
+                              for pos in self._page_buckets.get(key, [])}
+                for pos in candidates:
+                    if any((value ^ other).bit_count() <= self.max_distance
+                           for other in self._page_hashes[pos]):
+                        matched[pos] += 1
+            for pos, count in matched.items():
+                similarity = count / max(len(hashes), len(self._page_hashes[pos]))
+                if similarity >= self.page_threshold:
+                    scores[pos]['page_similarity'] = similarity
+
+        matches = [{'doc_id': self.doc_ids[pos], **score} for pos, score in scores.items()]
+        return sorted(
+            matches, key=lambda m: max(m['text_similarity'], m['page_similarity']), reverse=True
+        )
+
+    # ============================================
+    # 생성 / 저장
+    # ============================================
+
+    @classmethod
+    def build_from_saved(
+        cls,
+        output_base: str = "./output",
+        storage: Optional[OutputStorage] = None,
+        **kwargs
+    ) -> 'DuplicateIndex':
+        """
+        저장된 프로젝트들로 인덱스 생성
+
+        텍스트는 ocr_result.json에서, 페이지 해시는 완료 마커에 기록된 원본 PDF에서 계산합니다.
+        완료 마커에 ocr_result.json이 없는 문서(저장 중 실패)는 건너뜁니다.
+
+        Args:
+            output_base: 출력 루트 디렉토리
+            storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리,
+                ShardedDirectoryStorage/SQLiteStorage 사용 가능)
+            **kwargs: DuplicateIndex 생성 인자
+
+        Returns:
+            생성된 인덱스
+        """
+        storage = storage or DirectoryStorage(output_base)
+        index = cls(**kwargs)
+        for doc_id in sorted(storage.iter_documents()):
+            manifest = storage.read_manifest(doc_id)
+            if manifest is not None and 'ocr_result.json' not in manifest['artifacts']:
+                continue
+            try:
+                with storage.open(doc_id, 'ocr_result.json') as f:
+                    result = json.load(f)
+            except FileNotFoundError:
+                continue
+            text = result_text(result)
+
+            source_pdf = (manifest or {}).get('source_pdf')
+            hashes = pdf_page_hashes(source_pdf) if source_pdf and Path(source_pdf).exists() else []
+
+            index.add(doc_id, text=text, page_hashes=hashes)
+
+        print(f"🗂️ 유사 문서 인덱스 생성: {len(index)}개 문서")
+        return index
+
+    def save(self, path: str) -> None:
+        """인덱스를 .npz 파일로 저장"""
+        has_signature = np.array([sig is not None for sig in self._signatures], dtype=bool)
+        signatures = np.zeros((len(self), self.num_perm), dtype=np.uint32)
+        for pos, sig in enumerate(self._signatures):
+            if sig is not None:
+                signatures[pos] = sig
+        page_counts = np.array([len(hashes) for hashes in self._page_hashes], dtype=np.int64)
+        page_hashes = np.array(
+            [value for hashes in self._page_hashes for value in hashes], dtype=np.uint64
+        )
+        params = {
+            'num_perm': self.num_perm, 'bands': self.bands, 'shingle_size': self.shingle_size,
+            'max_distance': self.max_distance, 'text_threshold': self.text_threshold,
+            'page_threshold': self.page_threshold, 'seed': self.seed,
+        }
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                params=np.array(json.dumps(params)),
+                doc_ids=np.array(self.doc_ids, dtype=str),
+                has_signature=has_signature,
+                signatures=signatures,
+                page_counts=page_counts,
+                page_hashes=page_hashes,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> 'DuplicateIndex':
+        """save()로 저장한 인덱스 불러오기 (LSH 버킷은 다시 생성)"""
+        with np.load(path, allow_pickle=False) as data:
+            index = cls(**json.loads(str(data['params'])))
+            offsets = np.concatenate([[0], np.cumsum(data['page_counts'])])
+            page_hashes = data['page_hashes']
+            for pos, doc_id in enumerate(data['doc_ids']):
+                signature = data['signatures'][pos] if data['has_signature'][pos] else None
+                hashes = [int(v) for v in page_hashes[offsets[pos]:offsets[pos + 1]]]
+                index._insert(str(doc_id), signature, hashes)
+        return index
@@ -0,0 +1,304 @@
+"""
+두 OCR 실행 결과 비교
+같은 문서의 두 결과(언어/테이블 옵션 변경, 재스캔 등)에서 필드를 페이지별로 정렬·매칭하여
+텍스트, 신뢰도, 위치가 바뀐 필드를 찾음
+"""
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .main import load_saved_result
+
+# 매칭 점수 = (1 - TEXT_WEIGHT) * IoU + TEXT_WEIGHT * 텍스트 유사도
+TEXT_WEIGHT = 0.5
+# 매칭으로 인정할 최소 점수
+MIN_MATCH_SCORE = 0.3
+# 신뢰도 변화로 보고할 최소 차이
+CONFIDENCE_TOLERANCE = 0.05
+# 위치 변화로 보고할 최소 중심 이동 거리 (픽셀)
+POSITION_TOLERANCE = 3.0
+
+
+def _page_arrays(image: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """페이지 필드의 (N, 4) 박스 배열, 신뢰도 배열, 텍스트 리스트"""
+    fields = image.get('fields', [])
+    boxes = np.zeros((len(fields), 4), dtype=np.float64)
+    for idx, field in enumerate(fields):
+        vertices = field.get('boundingPoly', {}).get('vertices', [])
+        if vertices:
+            xs = [v.get('x', 0) for v in vertices]
+            ys = [v.get('y', 0) for v in vertices]
+            boxes[idx] = (min(xs), min(ys), max(xs), max(ys))
+    confidences = np.array([f.get('inferConfidence', 0) for f in fields], dtype=np.float64)
+    texts = [f.get('inferText', '') for f in fields]
+    return boxes, confidences, texts
+
+
+def _grid_cells(boxes: np.ndarray, cell: float, cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """박스가 걸치는 격자 칸 번호와 박스 인덱스를 펼친 배열"""
+    x0, y0, x1, y1 = np.floor(boxes / cell).astype(np.int64).T
+    ncols, nrows = x1 - x0 + 1, y1 - y0 + 1
+    counts = ncols * nrows
+    box_idx = np.repeat(np.arange(len(boxes)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    col = np.repeat(x0, counts) + offsets % np.repeat(ncols, counts)
+    row = np.repeat(y0, counts) + offsets // np.repeat(ncols, counts)
+    return row * cols + col, box_idx
+
+
+def _candidate_indices(old_boxes: np.ndarray, new_boxes: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    균일 격자로 겹칠 수 있는 (old, new) 후보 쌍 찾기
+
+    박스를 걸치는 격자 칸마다 등록하고 같은 칸을 공유하는 쌍만 후보로 삼습니다.
+    칸 크기는 박스 크기의 중앙값(칸 수가 박스 수를 넘지 않도록 하한 적용)이므로, 페이지 전체 너비의
+    머리글/표 테두리 같은 큰 박스가 있어도 후보 수는 실제로 겹치는 박스 수에 비례합니다.
+    """
+    boxes = np.vstack([old_boxes, new_boxes])
+    origin = boxes[:, :2].min(axis=0)
+    old_boxes = old_boxes - np.tile(origin, 2)
+    new_boxes = new_boxes - np.tile(origin, 2)
+    extent = boxes[:, 2:].max(axis=0) - origin
+    sizes = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    cell = max(float(np.median(sizes)), float(np.sqrt(extent.prod() / len(boxes))), 1.0)
+    cols = int(extent[0] // cell) + 1
+
+    old_cells, old_idx = _grid_cells(old_boxes, cell, cols)
+    new_cells, new_idx = _grid_cells(new_boxes, cell, cols)
+    order = np.argsort(old_cells, kind='stable')
+    old_cells, old_idx = old_cells[order], old_idx[order]
+
+    lo = np.searchsorted(old_cells, new_cells, side='left')
+    hi = np.searchsorted(old_cells, new_cells, side='right')
+    counts = hi - lo
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    pair_old = old_idx[np.repeat(lo, counts) + offsets]
+    pair_new = np.repeat(new_idx, counts)
+
+    # 여러 칸을 공유하는 쌍은 한 번만
+    keys = np.unique(pair_old * len(new_boxes) + pair_new)
+    return keys // len(new_boxes), keys % len(new_boxes)
+
+
+def _candidate_pairs(old_boxes: np.ndarray, new_boxes: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """박스가 겹치는 (old, new) 후보 쌍과 IoU 계산"""
+    if not len(old_boxes) or not len(new_boxes):
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float64)
+
+    old_idx, new_idx = _candidate_indices(old_boxes, new_boxes)
+    a, b = old_boxes[old_idx], new_boxes[new_idx]
+    inter_w = np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])
+    inter_h = np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    overlap = (inter_w > 0) & (inter_h > 0)
+
+    inter = (inter_w * inter_h)[overlap]
+    area_a = ((a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1]))[overlap]
+    area_b = ((b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1]))[overlap]
+    iou = inter / (area_a + area_b - inter)
+    return old_idx[overlap], new_idx[overlap], iou
+
+
+def _match_page(
+    old_image: Dict[str, Any],
+    new_image: Dict[str, Any],
+    text_weight: float,
+    min_score: float
+) -> Tuple[List[Tuple[int, int]], Tuple]:
+    """한 페이지의 필드를 탐욕적으로 1:1 매칭"""
+    old = _page_arrays(old_image)
+    new = _page_arrays(new_image)
+    old_texts, new_texts = old[2], new[2]
+
+    old_idx, new_idx, iou = _candidate_pairs(old[0], new[0])
+    # 텍스트가 같은 쌍(대부분)은 SequenceMatcher를 건너뜀
+    similarity = np.array([
+        1.0 if old_texts[i] == new_texts[j]
+        else SequenceMatcher(None, old_texts[i], new_texts[j]).ratio()
+        for i, j in zip(old_idx.tolist(), new_idx.tolist())
+    ])
+    scores = (1 - text_weight) * iou + text_weight * similarity
+
+    pairs = []
+    old_used = np.zeros(len(old_texts), dtype=bool)
+    new_used = np.zeros(len(new_texts), dtype=bool)
+    ranked = np.argsort(-scores, kind='stable')
+    ranked = ranked[scores[ranked] >= min_score]
+    for i, j in zip(old_idx[ranked].tolist(), new_idx[ranked].tolist()):
+        if not old_used[i] and not new_used[j]:
+            old_used[i] = new_used[j] = True
+            pairs.append((i, j))
+
+    # 겹치지 않는 위치로 크게 이동한 필드는 동일 텍스트로 매칭
+    unmatched_old: Dict[str, List[int]] = {}
+    for i in np.flatnonzero(~old_used).tolist():
+        unmatched_old.setdefault(old_texts[i], []).append(i)
+    for j in np.flatnonzero(~new_used).tolist():
+        candidates = unmatched_old.get(new_texts[j])
+        if new_texts[j] and candidates:
+            i = candidates.pop(0)
+            old_used[i] = new_used[j] = True
+            pairs.append((i, j))
+
+    return pairs, (old, new, old_used, new_used)
+
+
+def _field_info(arrays: Tuple, idx: int, prefix: str) -> Dict[str, Any]:
+    boxes, confidences, texts = arrays
+    return {
+        f'{prefix}_index': idx,
+        f'{prefix}_text': texts[idx],
+        f'{prefix}_confidence': float(confidences[idx]),
+        f'{prefix}_bbox': [float(v) for v in boxes[idx]],
+    }
+
+
+def diff_results(
+    old_result: Dict[str, Any],
+    new_result: Dict[str, Any],
+    text_weight: float = TEXT_WEIGHT,
+    min_score: float = MIN_MATCH_SCORE,
+    confidence_tolerance: float = CONFIDENCE_TOLERANCE,
+    position_tolerance: float = POSITION_TOLERANCE
+) -> Dict[str, Any]:
+    """
+    두 OCR 결과의 필드 단위 변경 사항 계산
+
+    페이지마다 박스 겹침(IoU)과 텍스트 유사도로 필드를 매칭합니다.
+    후보 쌍은 균일 격자에서 같은 칸을 공유하는 박스만 구하므로(_candidate_indices),
+    페이지 전체 너비의 큰 박스가 섞여 있어도 비교 횟수가 실제로 겹치는 박스 수에 비례합니다.
+
+    Args:
+        old_result: 기준 OCR 결과
+        new_result: 비교할 OCR 결과
+        text_weight: 매칭 점수에서 텍스트 유사도 가중치 (0~1)
+        min_score: 매칭으로 인정할 최소 점수
+        confidence_tolerance: 신뢰도 변화로 보고할 최소 차이
+        position_tolerance: 위치 변화로 보고할 최소 중심 이동 거리 (픽셀)
+
+    Returns:
+        {'changes': [...], 'summary': {...}}
+        변경 항목: {'page', 'kind': 'added'|'removed'|'changed',
+                   'attributes': ['text', 'confidence', 'position'] 중 해당 항목,
+                   'old_index', 'old_text', 'old_confidence', 'old_bbox', 'new_...'}
+
+    Example:
+        >>> diff = diff_results(result_ko, result_ja)
+        >>> diff['summary']['text_changed']
+    """
+    old_images = old_result.get('images', [])
+    new_images = new_result.get('images', [])
+
+    changes = []
+    summary = {
+        'pages': max(len(old_images), len(new_images)),
+        'old_fields': 0, 'new_fields': 0, 'matched': 0, 'unchanged': 0,
+        'added': 0, 'removed': 0, 'text_changed': 0, 'confidence_changed': 0, 'moved': 0,
+    }
+    confidence_deltas = []
+
+    for page_idx in range(summary['pages']):
+        old_image = old_images[page_idx] if page_idx < len(old_images) else {}
+        new_image = new_images[page_idx] if page_idx < len(new_images) else {}
+        pairs, (old, new, old_used, new_used) = _match_page(
+            old_image, new_image, text_weight, min_score
+        )
+        page_num = page_idx + 1
+        summary['old_fields'] += len(old[2])
+        summary['new_fields'] += len(new[2])
+        summary['matched'] += len(pairs)
+
+        old_pos = np.array([i for i, _ in pairs], dtype=np.int64)
+        new_pos = np.array([j for _, j in pairs], dtype=np.int64)
+        text_changed = np.array([old[2][i] != new[2][j] for i, j in pairs], dtype=bool)
+        delta = new[1][new_pos] - old[1][old_pos]
+        confidence_changed = np.abs(delta) >= confidence_tolerance
+        shift = (new[0][new_pos, :2] + new[0][new_pos, 2:]) / 2 \
+            - (old[0][old_pos, :2] + old[0][old_pos, 2:]) / 2
+        moved = np.hypot(shift[:, 0], shift[:, 1]) >= position_tolerance
+
+        confidence_deltas.append(delta)
+        summary['text_changed'] += int(text_changed.sum())
+        summary['confidence_changed'] += int(confidence_changed.sum())
+        summary['moved'] += int(moved.sum())
+        summary['unchanged'] += int((~(text_changed | confidence_changed | moved)).sum())
+
+        page_changes = []
+        for k in np.flatnonzero(text_changed | confidence_changed | moved).tolist():
+            i, j = pairs[k]
+            attributes = [
+                name for name, flags in [
+                    ('text', text_changed), ('confidence', confidence_changed),
+                    ('position', moved),
+                ] if flags[k]
+            ]
+            page_changes.append({
+                'page': page_num, 'kind': 'changed', 'attributes': attributes,
+                **_field_info(old, i, 'old'), **_field_info(new, j, 'new'),
+            })
+
+        for i in np.flatnonzero(~old_used).tolist():
+            summary['removed'] += 1
+            page_changes.append({
+                'page': page_num, 'kind': 'removed', 'attributes': [],
+                **_field_info(old, i, 'old'),
+            })
+        for j in np.flatnonzero(~new_used).tolist():
+            summary['added'] += 1
+            page_changes.append({
+                'page': page_num, 'kind': 'added', 'attributes': [],
+                **_field_info(new, j, 'new'),
+            })
+
+        page_changes.sort(key=lambda c: c.get('old_index', c.get('new_index')))
+        changes.extend(page_changes)
+
+    confidence_deltas = np.concatenate(confidence_deltas) if confidence_deltas else np.array([])
+    summary['mean_confidence_delta'] = (
+        float(confidence_deltas.mean()) if confidence_deltas.size else 0.0
+    )
+    return {'changes': changes, 'summary': summary}
+
+
+def diff_projects(
+    old_project: str,
+    new_project: str,
+    output_base: str = "./output",
+    **kwargs
+) -> Optional[Dict[str, Any]]:
+    """
+    저장된 두 프로젝트의 OCR 결과 비교
+
+    Args:
+        old_project: 기준 프로젝트 폴더명
+        new_project: 비교할 프로젝트 폴더명
+        output_base: 출력 루트 디렉토리
+        **kwargs: diff_results 옵션
+
+    Returns:
+        diff_results 결과 (불러오기 실패 시 None)
+
+    Example:
+        >>> diff = diff_projects('resume_ko', 'resume_ko_table')
+        >>> print_diff_summary(diff)
+    """
+    old_result, _ = load_saved_result(old_project, output_base)
+    new_result, _ = load_saved_result(new_project, output_base)
+    if old_result is None or new_result is None:
+        return None
+    return diff_results(old_result, new_result, **kwargs)
+
+
+def print_diff_summary(diff: Dict[str, Any]) -> None:
+    """diff_results 요약 출력"""
+    summary = diff['summary']
+    print("\n🔍 OCR 결과 비교")
+    print(f"   - 페이지: {summary['pages']}")
+    print(f"   - 필드: {summary['old_fields']} → {summary['new_fields']}")
+    print(f"   - 변경 없음: {summary['unchanged']}")
+    print(f"   - 텍스트 변경: {summary['text_changed']}")
+    print(f"   - 신뢰도 변경: {summary['confidence_changed']} "
+          f"(평균 {summary['mean_confidence_delta']:+.3f})")
+    print(f"   - 위치 변경: {summary['moved']}")
+    print(f"   - 추가/삭제: +{summary['added']} / -{summary['removed']}")
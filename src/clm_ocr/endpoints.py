@@ -0,0 +1,255 @@
+"""
+다중 엔드포인트 부하 분산
+여러 CLOVA OCR 도메인/키 중 진행 중인 요청이 가장 적은 곳으로 요청을 보내고, 장애 엔드포인트는 서킷 브레이커로 제외
+"""
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+from .config import BREAKER_FAILURE_THRESHOLD, BREAKER_RECOVERY_TIME
+from .concurrency import CircuitBreaker, is_overload_error
+
+# 키 문제로 보는 상태 코드 (과부하 코드와 함께 다른 엔드포인트로 전환)
+FAILOVER_STATUS = {401, 403}
+
+# 지연 이동 평균 가중치
+LATENCY_SMOOTHING = 0.2
+
+
+def is_failover_error(error: Exception) -> bool:
+    """다른 엔드포인트로 다시 보내야 하는 오류인지 (과부하/장애 또는 키 거부)"""
+    if is_overload_error(error):
+        return True
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code in FAILOVER_STATUS
+
+
+class Endpoint:
+    """
+    엔드포인트(도메인 URL + Secret Key) 하나와 상태
+
+    Args:
+        api_url: CLOVA OCR API URL
+        secret_key: 해당 도메인의 Secret Key
+        weight: 가중치 (도메인 처리 한도에 비례하게 지정)
+        breaker: 서킷 브레이커 (기본값: CircuitBreaker())
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        secret_key: str,
+        weight: float = 1.0,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        if weight <= 0:
+            raise ValueError(f"weight는 0보다 커야 합니다: {weight}")
+        self.api_url = api_url
+        self.secret_key = secret_key
+        self.weight = weight
+        self.breaker = breaker or CircuitBreaker()
+
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.api_url!r}, weight={self.weight})"
+
+
+EndpointSpec = Union[Endpoint, Tuple, Dict[str, Any]]
+
+
+class EndpointPool:
+    """
+    가중치 기반 최소 진행 요청(least outstanding requests) 부하 분산
+
+    (진행 중인 요청 + 1) / 가중치가 가장 작은 엔드포인트를 고르고, 같으면 누적 요청이 적은 쪽을 고릅니다.
+    엔드포인트마다 서킷 브레이커가 있어 연속 실패한 곳은 recovery_time 동안 제외되고,
+    이후 시험 요청 1건으로 복구를 확인합니다.
+
+    Example:
+        >>> pool = EndpointPool([
+        ...     ('https://a.apigw.ntruss.com/...', 'KEY_A', 2),
+        ...     ('https://b.apigw.ntruss.com/...', 'KEY_B'),
+        ... ])
+        >>> client = ClovaOCRClient(endpoints=pool)
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[EndpointSpec],
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_time: float = BREAKER_RECOVERY_TIME,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            endpoints: Endpoint, (api_url, secret_key[, weight]) 튜플,
+                또는 {'api_url', 'secret_key', 'weight'} 딕셔너리 이터러블
+            failure_threshold: 엔드포인트 차단까지의 연속 실패 횟수
+            recovery_time: 차단 후 시험 요청까지 대기 시간 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self.endpoints: List[Endpoint] = []
+        for spec in endpoints:
+            if not isinstance(spec, Endpoint):
+                kwargs = dict(spec) if isinstance(spec, dict) else \
+                    dict(zip(('api_url', 'secret_key', 'weight'), spec))
+                spec = Endpoint(
+                    breaker=CircuitBreaker(failure_threshold, recovery_time, clock), **kwargs
+                )
+            self.endpoints.append(spec)
+        if not self.endpoints:
+            raise ValueError("엔드포인트가 하나 이상 필요합니다")
+
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def acquire(
+        self,
+        exclude: Iterable[Endpoint] = (),
+        timeout: Optional[float] = None
+    ) -> Endpoint:
+        """
+        요청을 보낼 엔드포인트 선택 (결과는 release로 반드시 보고)
+
+        사용 가능한 엔드포인트가 없으면(모두 차단) 복구되거나 요청이 끝날 때까지 대기합니다.
+
+        Args:
+            exclude: 제외할 엔드포인트 (이미 실패한 곳)
+            timeout: 최대 대기 시간 (초, None이면 무한 대기)
+
+        Returns:
+            선택한 엔드포인트
+
+        Raises:
+            requests.exceptions.ConnectionError: 대기 시간 안에 사용 가능한 엔드포인트가 없을 때
+        """
+        return self._acquire(exclude, timeout)[0]
+
+    def _acquire(
+        self,
+        exclude: Iterable[Endpoint] = (),
+        timeout: Optional[float] = None
+    ) -> Tuple[Endpoint, int]:
+        """acquire와 같되 서킷 브레이커 토큰도 반환 (release에 넘겨 이전 세대 결과를 구분)"""
+        excluded = set(map(id, exclude))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                candidates = sorted(
+                    (ep for ep in self.endpoints if id(ep) not in excluded),
+                    key=lambda ep: ((ep.outstanding + 1) / ep.weight, ep.requests)
+                )
+                for endpoint in candidates:
+                    token = endpoint.breaker.acquire()
+                    if token is not None:
+                        endpoint.outstanding += 1
+                        endpoint.requests += 1
+                        return endpoint, token
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not candidates or (remaining is not None and remaining <= 0):
+                    raise requests.exceptions.ConnectionError(
+                        "사용 가능한 OCR 엔드포인트가 없습니다"
+                    )
+                # 요청 종료 알림 또는 차단 시간 경과를 주기적으로 확인
+                self._cond.wait(0.1 if remaining is None else min(0.1, remaining))
+
+    def release(
+        self,
+        endpoint: Endpoint,
+        latency: Optional[float] = None,
+        error: Optional[Exception] = None,
+        token: Optional[int] = None
+    ) -> None:
+        """
+        요청 결과 보고
+
+        Args:
+            endpoint: acquire로 받은 엔드포인트
+            latency: 성공한 요청의 소요 시간 (초)
+            error: 실패 시 예외 (엔드포인트 장애로 볼 오류만 서킷 브레이커에 실패로 집계)
+            token: 서킷 브레이커 토큰 (차단 전에 시작된 요청의 결과는 무시)
+        """
+        if error is None:
+            endpoint.breaker.record_success(token)
+        elif is_failover_error(error):
+            endpoint.breaker.record_failure(token)
+        else:
+            endpoint.breaker.record_ignored(token)
+
+        with self._cond:
+            endpoint.outstanding -= 1
+            if error is not None and is_failover_error(error):
+                endpoint.failures += 1
+            if latency is not None:
+                endpoint.latency = latency if endpoint.latency is None else (
+                    LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * endpoint.latency
+                )
+            self._cond.notify_all()
+
+    def call(
+        self,
+        send: Callable[[Endpoint], Tuple[Any, float]],
+        timeout: Optional[float] = None
+    ) -> Tuple[Any, float]:
+        """
+        엔드포인트를 골라 send를 호출하고, 장애 오류면 다른 엔드포인트로 전환해 재시도
+
+        엔드포인트마다 최대 1번씩 시도하며, 키/요청 자체 문제(400 등)는 바로 예외를 올립니다.
+
+        Args:
+            send: 엔드포인트를 받아 (결과, 소요 시간)을 반환하는 함수
+            timeout: 사용 가능한 엔드포인트를 기다리는 최대 시간 (초)
+
+        Returns:
+            send 반환값
+        """
+        tried: List[Endpoint] = []
+        last_error: Optional[Exception] = None
+        for _ in range(len(self.endpoints)):
+            try:
+                endpoint, token = self._acquire(exclude=tried, timeout=timeout)
+            except requests.exceptions.ConnectionError:
+                if last_error is not None:
+                    raise last_error
+                raise
+            try:
+                result, latency = send(endpoint)
+            except Exception as e:
+                self.release(endpoint, error=e, token=token)
+                if not is_failover_error(e):
+                    raise
+                print(f"🔀 엔드포인트 전환: {endpoint.api_url} ({e})")
+                tried.append(endpoint)
+                last_error = e
+                continue
+            self.release(endpoint, latency=latency, token=token)
+            return result, latency
+        raise last_error
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """
+        엔드포인트별 상태
+
+        Returns:
+            [{'api_url', 'weight', 'state', 'outstanding', 'requests', 'failures',
+              'latency'(이동 평균, 초)}, ...]
+        """
+        with self._cond:
+            return [{
+                'api_url': ep.api_url,
+                'weight': ep.weight,
+                'state': ep.breaker.state,
+                'outstanding': ep.outstanding,
+                'requests': ep.requests,
+                'failures': ep.failures,
+                'latency': ep.latency,
+            } for ep in self.endpoints]
@@ -0,0 +1,275 @@
+"""
+LLM/임베딩 파이프라인용 청크 내보내기
+OCR 필드를 페이지 순서대로 길이 제한 청크로 묶고, 페이지/필드 범위/신뢰도 출처와 함께 JSON Lines로 저장
+"""
+import json
+import os
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .config import DEFAULT_CHUNK_LENGTH, DEFAULT_CHUNK_OVERLAP
+from .regions import field_rect
+from .storage import OutputStorage, DirectoryStorage
+
+CHUNKS_FILENAME = 'chunks.jsonl'
+
+PageSource = Union[Dict[str, Any], Iterable[Tuple[int, Dict[str, Any]]]]
+
+
+class ChunkBuilder:
+    """
+    페이지를 하나씩 받아 완성된 청크를 바로 반환하는 청크 생성기
+
+    필드 단위로 청크를 채우므로 단어가 잘리지 않습니다. 길이는 필드별 length_fn 합으로 누적하고
+    (토크나이저는 경계에서 근사), 각 청크의 'length'는 완성된 텍스트에 length_fn을 적용한 값입니다.
+    메모리에는 현재 청크의 필드만 유지합니다.
+
+    Example:
+        >>> builder = ChunkBuilder(max_length=500, overlap=50, doc_id='resume')
+        >>> for page_num, image in iter_pages('data/big.pdf'):
+        ...     for chunk in builder.add_page(page_num, image):
+        ...         send(chunk)
+        >>> for chunk in builder.flush():
+        ...     send(chunk)
+    """
+
+    def __init__(
+        self,
+        max_length: int = DEFAULT_CHUNK_LENGTH,
+        overlap: int = DEFAULT_CHUNK_OVERLAP,
+        length_fn: Callable[[str], int] = len,
+        doc_id: str = ''
+    ):
+        """
+        Args:
+            max_length: 청크 최대 길이 (length_fn 단위, 단일 필드가 더 길면 그 필드만 담음)
+            overlap: 다음 청크 앞에 반복할 이전 청크 끝부분 길이
+            length_fn: 길이 함수 (문자 수: len, 토큰 수: lambda s: len(tokenizer.encode(s)))
+            doc_id: 청크 ID에 사용할 문서 ID
+        """
+        if not 0 <= overlap < max_length:
+            raise ValueError(f"overlap은 0 이상 max_length 미만이어야 합니다: {overlap}")
+        self.max_length = max_length
+        self.overlap = overlap
+        self.length_fn = length_fn
+        self.doc_id = doc_id
+
+        # (page, field_idx, text, length, confidence, rect)
+        self._buffer: deque = deque()
+        self._buffer_length = 0
+        self._has_new = False
+        self._chunk_index = 0
+
+    def add_page(self, page_num: int, image: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        페이지 하나를 추가하고 완성된 청크 반환
+
+        Args:
+            page_num: 페이지 번호 (1부터 시작)
+            image: OCR 응답의 images 항목
+
+        Returns:
+            이 페이지로 완성된 청크 리스트
+        """
+        chunks = []
+        fields = image.get('fields', [])
+        for field_idx, field in enumerate(fields):
+            # 페이지 마지막 필드 뒤에는 줄바꿈 (to_text의 필드 구분 규칙과 동일)
+            line_break = field.get('lineBreak', False) or field_idx == len(fields) - 1
+            text = field.get('inferText', '') + ('\n' if line_break else ' ')
+            length = self.length_fn(text)
+
+            if self._buffer and self._buffer_length + length > self.max_length:
+                if self._has_new:
+                    chunks.append(self._emit())
+                # 겹침 구간만으로도 넘치면 앞에서부터 버림
+                while self._buffer and self._buffer_length + length > self.max_length:
+                    self._buffer_length -= self._buffer.popleft()[3]
+
+            self._buffer.append((
+                page_num, field_idx, text, length,
+                float(field.get('inferConfidence', 0)), field_rect(field),
+            ))
+            self._buffer_length += length
+            self._has_new = True
+        return chunks
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """남은 필드로 마지막 청크 생성"""
+        if not self._has_new:
+            return []
+        chunk = self._emit()
+        self._buffer.clear()
+        self._buffer_length = 0
+        return [chunk]
+
+    def _emit(self) -> Dict[str, Any]:
+        """현재 버퍼로 청크를 만들고 겹침 구간만 남김"""
+        entries = list(self._buffer)
+        text = ''.join(entry[2] for entry in entries).strip()
+
+        spans = []
+        for page, field_idx, _, _, _, rect in entries:
+            if spans and spans[-1]['page'] == page and spans[-1]['field_end'] == field_idx:
+                span = spans[-1]
+                span['field_end'] = field_idx + 1
+                if rect is not None:
+                    span['bbox'] = _union(span['bbox'], rect)
+            else:
+                spans.append({
+                    'page': page, 'field_start': field_idx, 'field_end': field_idx + 1,
+                    'bbox': list(rect) if rect is not None else None,
+                })
+
+        chunk = {
+            'id': f"{self.doc_id}:{self._chunk_index}" if self.doc_id else str(self._chunk_index),
+            'doc_id': self.doc_id,
+            'chunk_index': self._chunk_index,
+            'text': text,
+            'length': self.length_fn(text),
+            'pages': sorted({span['page'] for span in spans}),
+            'spans': spans,
+            'mean_confidence': sum(entry[4] for entry in entries) / len(entries),
+        }
+        self._chunk_index += 1
+
+        while self._buffer and self._buffer_length > self.overlap:
+            self._buffer_length -= self._buffer.popleft()[3]
+        self._has_new = False
+        return chunk
+
+
+def _union(bbox: Optional[List[float]], rect: Tuple[float, ...]) -> List[float]:
+    if bbox is None:
+        return list(rect)
+    return [min(bbox[0], rect[0]), min(bbox[1], rect[1]),
+            max(bbox[2], rect[2]), max(bbox[3], rect[3])]
+
+
+def _iter_source(source: PageSource) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    if hasattr(source, 'get'):
+        return ((idx + 1, image) for idx, image in enumerate(source.get('images', [])))
+    return iter(source)
+
+
+def iter_chunks(
+    source: PageSource,
+    max_length: int = DEFAULT_CHUNK_LENGTH,
+    overlap: int = DEFAULT_CHUNK_OVERLAP,
+    length_fn: Callable[[str], int] = len,
+    doc_id: str = ''
+) -> Iterator[Dict[str, Any]]:
+    """
+    OCR 결과 또는 페이지 스트림에서 청크를 순서대로 생성
+
+    Args:
+        source: OCR 결과 딕셔너리, 또는 (페이지 번호, images 항목) 이터러블 (예: iter_pages)
+        max_length: 청크 최대 길이 (length_fn 단위)
+        overlap: 이전 청크와 겹치는 길이
+        length_fn: 길이 함수 (기본값: 문자 수)
+        doc_id: 문서 ID
+
+    Yields:
+        {'id', 'doc_id', 'chunk_index', 'text', 'length', 'pages',
+         'spans': [{'page', 'field_start', 'field_end'(미포함), 'bbox'}], 'mean_confidence'}
+
+    Example:
+        >>> for chunk in iter_chunks(iter_pages('data/big.pdf'), max_length=512, doc_id='big'):
+        ...     index.add(chunk['text'], metadata=chunk)
+    """
+    builder = ChunkBuilder(max_length, overlap, length_fn, doc_id)
+    for page_num, image in _iter_source(source):
+        yield from builder.add_page(page_num, image)
+    yield from builder.flush()
+
+
+def write_chunks(f, chunks: Iterable[Dict[str, Any]]) -> int:
+    """청크를 JSON Lines로 기록하고 개수 반환"""
+    count = 0
+    for chunk in chunks:
+        f.write(json.dumps(chunk, ensure_ascii=False))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def export_chunks(
+    source: PageSource,
+    output_path: str,
+    doc_id: str = '',
+    **options
+) -> int:
+    """
+    청크를 JSON Lines 파일로 저장 (완료 후 원자적으로 교체)
+
+    Args:
+        source: OCR 결과 딕셔너리 또는 (페이지 번호, images 항목) 이터러블
+        output_path: 출력 .jsonl 경로
+        doc_id: 문서 ID
+        **options: iter_chunks 옵션 (max_length, overlap, length_fn)
+
+    Returns:
+        저장한 청크 수
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{uuid.uuid4().hex}.{output_path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            count = write_chunks(f, iter_chunks(source, doc_id=doc_id, **options))
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    print(f"✅ 청크 {count}개 저장: {output_path}")
+    return count
+
+
+def export_corpus(
+    output_path: str,
+    output_base: str = "./output",
+    storage: Optional[OutputStorage] = None,
+    **options
+) -> int:
+    """
+    저장된 전체 문서를 하나의 JSON Lines 파일로 내보내기
+
+    문서를 하나씩 읽어 바로 기록하므로 메모리 사용량은 코퍼스 크기와 무관합니다
+    (가장 큰 문서 하나 분량). 완료 마커에 ocr_result.json이 없는 문서는 건너뜁니다.
+
+    Args:
+        output_path: 출력 .jsonl 경로
+        output_base: 출력 루트 디렉토리
+        storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리)
+        **options: iter_chunks 옵션 (max_length, overlap, length_fn)
+
+    Returns:
+        저장한 전체 청크 수
+
+    Example:
+        >>> export_corpus('corpus.jsonl', max_length=512, overlap=64)
+    """
+    storage = storage or DirectoryStorage(output_base)
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(f".{uuid.uuid4().hex}.{output_path.name}.tmp")
+
+    total = documents = 0
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for doc_id in storage.iter_documents():
+                manifest = storage.read_manifest(doc_id)
+                if manifest is not None and 'ocr_result.json' not in manifest['artifacts']:
+                    continue
+                try:
+                    with storage.open(doc_id, 'ocr_result.json') as src:
+                        ocr_result = json.load(src)
+                except FileNotFoundError:
+                    continue
+                total += write_chunks(f, iter_chunks(ocr_result, doc_id=doc_id, **options))
+                documents += 1
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    print(f"✅ {documents}개 문서에서 청크 {total}개 저장: {output_path}")
+    return total
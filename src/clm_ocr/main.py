@@ -3,13 +3,25 @@
 PDF OCR 처리 워크플로우 조율
 """
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Callable
 import pandas as pd
 
-from .config import API_URL, SECRET_KEY, DEFAULT_OUTPUT_FORMATS, DEFAULT_LANG, DEFAULT_ENABLE_TABLE
+from .config import (
+    API_URL, SECRET_KEY, DEFAULT_OUTPUT_FORMATS, DEFAULT_LANG, DEFAULT_ENABLE_TABLE,
+    DEFAULT_WRITER_WORKERS,
+)
 from .client import ClovaOCRClient, OCROutputManager
+from .storage import OutputStorage, DirectoryStorage
 from .processor import OCRProcessor
+from .dedup import DuplicateIndex, pdf_page_hashes, pdf_text_layer, result_text
+from .redaction import redact_result, redact_pdf
+from .export import CHUNKS_FILENAME, iter_chunks, write_chunks
+from .refine import refine_low_confidence
+from .cache import default_cache
 
 
 def process_pdf(
@@ -20,23 +32,41 @@ def process_pdf(
     api_url: str = API_URL,
     secret_key: str = SECRET_KEY,
     lang: str = DEFAULT_LANG,
-    enable_table: bool = DEFAULT_ENABLE_TABLE
+    enable_table: bool = DEFAULT_ENABLE_TABLE,
+    dedup_index: Optional[DuplicateIndex] = None,
+    reuse_duplicates: bool = False,
+    redact: bool = False,
+    storage: Optional[OutputStorage] = None,
+    refine: bool = False,
+    overwrite: bool = False
 ) -> Tuple[Optional[Dict[str, Any]], Optional[pd.DataFrame]]:
     """
     PDF OCR 처리 메인 함수
 
     Args:
         pdf_path: 처리할 PDF 파일 경로
-        output_formats: 출력 형식 리스트 ['json', 'text', 'dataframe', 'markdown', 'searchable_pdf']
+        output_formats: 출력 형식 리스트
+            ['json', 'text', 'dataframe', 'markdown', 'searchable_pdf', 'redacted_pdf', 'tables',
+             'chunks']
         output_base: 출력 루트 디렉토리 (기본값: ./output)
         project_name: 프로젝트 폴더명 (None이면 PDF 파일명 사용)
         api_url: CLOVA OCR API URL
         secret_key: CLOVA OCR Secret Key
         lang: 언어 코드 (기본값: 'ko')
         enable_table: 테이블 인식 활성화 (기본값: False)
+        dedup_index: 유사 문서 인덱스 (지정하면 API 호출 전 조회하고, 처리 후 문서를 추가)
+        reuse_duplicates: 유사 문서가 있으면 API를 호출하지 않고 저장된 결과 재사용
+        redact: 개인정보(주민등록번호, 전화번호, 이메일, 계좌번호) 마스킹 여부.
+            True이면 모든 출력(JSON 포함)과 반환값이 마스킹되고,
+            searchable_pdf/redacted_pdf는 해당 영역을 가린 PDF로 생성
+        storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리,
+            ShardedDirectoryStorage/SQLiteStorage 사용 가능)
+        refine: 신뢰도 0.9 미만 영역을 고해상도로 잘라 다시 OCR해 개선 (영역만 묶어서 요청)
+        overwrite: 프로젝트에 다른 원본의 결과가 있어도 덮어쓰기 (기본값: False이면 실패 처리,
+            원본 파일을 옮기거나 교체한 뒤 같은 프로젝트로 다시 처리할 때 사용)
 
     Returns:
-        (ocr_result, df_result) 튜플
+        (ocr_result, df_result) 튜플 (실패 시 (None, None))
 
     Example:
         >>> ocr_result, df = process_pdf('data/test.pdf')
@@ -51,8 +81,7 @@ def process_pdf(
     # ============================================
     # 1. 출력 관리자 생성 및 디렉토리 준비
     # ============================================
-    output_mgr = OCROutputManager(pdf_path, output_base, project_name)
-    output_mgr.setup_directories()
+    output_mgr = OCROutputManager(pdf_path, output_base, project_name, storage)
 
     # ============================================
     # 2. OCR 클라이언트 생성 및 실행
@@ -60,8 +89,32 @@ def process_pdf(
     client = ClovaOCRClient(api_url, secret_key)
 
     try:
+        output_mgr.setup_directories(overwrite)
+
+        # 유사 문서 조회 (API 호출 전)
+        duplicates, page_hashes, result = [], [], None
+        if dedup_index is not None:
+            duplicates, page_hashes = find_duplicates(
+                dedup_index, pdf_path, output_mgr.project_name
+            )
+            if duplicates and reuse_duplicates:
+                result, _ = load_saved_result(
+                    duplicates[0]['doc_id'], output_base, storage=output_mgr.storage
+                )
+
         # OCR 실행
-        result = client.ocr_from_file(pdf_path, lang=lang, enable_table=enable_table)
+        refine_report = None
+        if result is None:
+            result = client.ocr_from_file(pdf_path, lang=lang, enable_table=enable_table)
+
+            # 저신뢰 영역 재인식
+            if refine:
+                result, refine_report = refine_low_confidence(pdf_path, result, client, lang=lang)
+
+        # 개인정보 마스킹 (이후 모든 변환은 마스킹된 결과 사용)
+        result, findings = prepare_redactions(result, output_formats, redact)
+        if redact:
+            print(f"🔒 개인정보 {len(findings)}건 마스킹")
 
         # 요약 출력
         OCRProcessor.print_summary(result)
@@ -74,50 +127,22 @@ def process_pdf(
         # ============================================
         print(f"\n💾 결과 저장 중...")
 
-        # JSON 저장
-        if 'json' in output_formats:
-            json_path = output_mgr.get_path('ocr_result.json')
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            print(f"  ✅ JSON: {json_path}")
-
-        # 텍스트 저장
-        if 'text' in output_formats:
-            full_text = OCRProcessor.to_text(result)
-            txt_path = output_mgr.get_path('extracted_text.txt')
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(full_text)
-            print(f"  ✅ 텍스트: {txt_path}")
-
-        # DataFrame CSV 저장
-        if 'dataframe' in output_formats:
-            csv_path = output_mgr.get_path('ocr_data.csv')
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            print(f"  ✅ DataFrame: {csv_path}")
-
-        # Markdown 저장
-        if 'markdown' in output_formats:
-            markdown = OCRProcessor.to_markdown(result, include_confidence=False)
-            md_path = output_mgr.get_path('document.md')
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown)
-            print(f"  ✅ Markdown: {md_path}")
-
-        # Searchable PDF 생성
-        if 'searchable_pdf' in output_formats:
-            pdf_out_path = output_mgr.get_path('searchable.pdf')
-            OCRProcessor.to_searchable_pdf(pdf_path, result, str(pdf_out_path))
-
-        # 테이블 저장 (enable_table=True일 때만)
-        if enable_table and 'tables' in output_formats:
-            tables = OCRProcessor.extract_tables(result)
-            for table_info in tables:
-                table_filename = f"page{table_info['page']}_table{table_info['table_idx']}.csv"
-                table_path = output_mgr.get_path(table_filename)
-                table_info['dataframe'].to_csv(table_path, index=False, encoding='utf-8-sig')
-                print(f"  ✅ 테이블: {table_path}")
-
-        print(f"\n✨ 모든 결과가 저장되었습니다: {output_mgr.project_dir}")
+        # 저장 중에는 이전 완료 마커를 제거해 부분 결과가 완료로 읽히지 않도록 함
+        output_mgr.invalidate_manifest()
+
+        writers = build_writers(
+            result, output_formats, pdf_path, output_mgr.project_name, findings,
+            redact=redact, enable_table=enable_table, df=df
+        )
+        manifest_extra = _manifest_extra(duplicates, findings, refine_report)
+        completed = write_outputs(output_mgr, writers, manifest_extra=manifest_extra)
+        _check_written(completed, writers)
+
+        if dedup_index is not None:
+            dedup_index.add(output_mgr.project_name, text=result_text(result),
+                            page_hashes=page_hashes)
+
+        print(f"\n✨ 모든 결과가 저장되었습니다: {output_mgr.location()}")
 
         return result, df
 
@@ -128,42 +153,308 @@ def process_pdf(
         return None, None
 
 
+def find_duplicates(
+    dedup_index: DuplicateIndex,
+    pdf_path: str,
+    doc_id: str,
+    lock: Optional[threading.Lock] = None
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """
+    OCR 전 유사 문서 조회 (PDF 텍스트 레이어와 페이지 해시 사용)
+
+    텍스트 레이어가 없는 스캔 PDF는 텍스트(MinHash) 조회를 건너뛰므로,
+    재스캔 문서는 페이지 지각 해시(dHash)로만 찾습니다.
+
+    Args:
+        dedup_index: 유사 문서 인덱스
+        pdf_path: 원본 PDF 파일 경로
+        doc_id: 처리 중인 문서 ID (결과에서 제외)
+        lock: 지정하면 인덱스 조회 중 잡을 잠금 (여러 스레드가 인덱스를 공유할 때)
+
+    Returns:
+        (유사 문서 리스트, 페이지 해시 리스트) 튜플
+    """
+    page_hashes = pdf_page_hashes(pdf_path)
+    text = pdf_text_layer(pdf_path)
+    with lock or nullcontext():
+        matches = dedup_index.query(text, page_hashes)
+    duplicates = [match for match in matches if match['doc_id'] != doc_id]
+    for match in duplicates:
+        print(f"🔁 유사 문서 발견: {match['doc_id']} "
+              f"(텍스트 {match['text_similarity']:.0%}, 페이지 {match['page_similarity']:.0%})")
+    return duplicates, page_hashes
+
+
+def prepare_redactions(
+    result: Dict[str, Any],
+    output_formats: List[str],
+    redact: bool = False
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    출력 전 개인정보 처리
+
+    마스킹 모드면 마스킹된 결과를, 아니면 원본을 그대로 반환하며,
+    redacted_pdf가 요청된 경우에는 마스킹하지 않아도 가릴 영역을 찾습니다.
+
+    Returns:
+        (출력에 사용할 결과, 발견 항목 리스트) 튜플
+    """
+    if redact:
+        return redact_result(result)
+    if 'redacted_pdf' in output_formats:
+        return result, redact_result(result)[1]
+    return result, []
+
+
+def build_writers(
+    result: Dict[str, Any],
+    output_formats: List[str],
+    pdf_path: str,
+    doc_id: str,
+    findings: Optional[List[Dict[str, Any]]] = None,
+    redact: bool = False,
+    enable_table: bool = DEFAULT_ENABLE_TABLE,
+    df: Optional[pd.DataFrame] = None,
+    prerender: bool = False
+) -> Dict[str, Callable[[Path], None]]:
+    """
+    출력 형식별 저장 함수 생성 (process_pdf와 OCRPipeline 공용)
+
+    Args:
+        result: OCR 결과 (마스킹 모드에서는 마스킹된 결과)
+        output_formats: 출력 형식 리스트
+        pdf_path: 원본 PDF 파일 경로 (searchable_pdf/redacted_pdf용)
+        doc_id: 문서 ID (청크 메타데이터)
+        findings: prepare_redactions의 발견 항목 리스트
+        redact: 마스킹 모드 여부 (searchable_pdf도 개인정보 영역을 가린 뒤 텍스트 삽입)
+        enable_table: 테이블 인식 활성화 여부 (tables 저장 조건)
+        df: 이미 변환한 DataFrame (없으면 저장할 때 변환)
+        prerender: JSON/텍스트/CSV/Markdown/테이블 내용을 지금 만들어 두고 저장 함수는 쓰기만 수행
+            (파이프라인 변환 단계용). 청크는 저장할 때 스트리밍하고, PDF는 저장할 때 생성
+
+    Returns:
+        {파일명: 임시 경로를 받아 파일을 쓰는 함수} (write_outputs에 전달)
+    """
+    findings = findings or []
+    writers: Dict[str, Callable[[Path], None]] = {}
+
+    def text_writer(render: Callable[[], str]) -> Callable[[Path], None]:
+        if prerender:
+            text = render()
+            return lambda path: _write_text(path, text)
+        return lambda path: _write_text(path, render())
+
+    def csv_writer(frame: Callable[[], pd.DataFrame]) -> Callable[[Path], None]:
+        if prerender:
+            text = frame().to_csv(index=False)
+            return lambda path: _write_text(path, text, 'utf-8-sig', newline='')
+        return lambda path: frame().to_csv(path, index=False, encoding='utf-8-sig')
+
+    # JSON 저장
+    if 'json' in output_formats:
+        writers['ocr_result.json'] = text_writer(
+            lambda: json.dumps(result, ensure_ascii=False, indent=2)
+        ) if prerender else lambda path: _write_json(path, result)
+
+    # 텍스트 저장
+    if 'text' in output_formats:
+        writers['extracted_text.txt'] = text_writer(lambda: OCRProcessor.to_text(result))
+
+    # DataFrame CSV 저장
+    if 'dataframe' in output_formats:
+        writers['ocr_data.csv'] = csv_writer(
+            lambda: df if df is not None else OCRProcessor.to_dataframe(result)
+        )
+
+    # Markdown 저장
+    if 'markdown' in output_formats:
+        writers['document.md'] = text_writer(
+            lambda: OCRProcessor.to_markdown(result, include_confidence=False)
+        )
+
+    # Searchable PDF 생성 (마스킹 모드에서는 개인정보 영역을 가린 뒤 텍스트 삽입)
+    if 'searchable_pdf' in output_formats:
+        if redact:
+            writers['searchable.pdf'] = lambda path: _write_redacted_pdf(
+                path, pdf_path, findings, result
+            )
+        else:
+            writers['searchable.pdf'] = lambda path: _write_searchable_pdf(
+                path, pdf_path, result
+            )
+
+    # 개인정보 가림 PDF 생성
+    if 'redacted_pdf' in output_formats:
+        writers['redacted.pdf'] = lambda path: _write_redacted_pdf(
+            path, pdf_path, findings, ocr_result=result
+        )
+
+    # LLM/임베딩용 청크 (JSON Lines)
+    if 'chunks' in output_formats:
+        writers[CHUNKS_FILENAME] = lambda path: _write_chunks(path, result, doc_id)
+
+    # 테이블 저장 (enable_table=True일 때만)
+    if enable_table and 'tables' in output_formats:
+        for table_info in OCRProcessor.extract_tables(result):
+            table_filename = f"page{table_info['page']}_table{table_info['table_idx']}.csv"
+            writers[table_filename] = csv_writer(lambda table_df=table_info['dataframe']: table_df)
+
+    return writers
+
+
+def _manifest_extra(
+    duplicates: List[Dict[str, Any]],
+    findings: List[Dict[str, Any]],
+    refine_report: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """완료 마커에 함께 기록할 처리 정보"""
+    extra: Dict[str, Any] = {}
+    if duplicates:
+        extra['duplicate_of'] = [match['doc_id'] for match in duplicates]
+    if findings:
+        extra['redactions'] = len(findings)
+    if refine_report is not None:
+        extra['refined'] = refine_report
+    return extra
+
+
+def write_outputs(
+    output_mgr: OCROutputManager,
+    writers: Dict[str, Callable[[Path], None]],
+    max_workers: int = DEFAULT_WRITER_WORKERS,
+    manifest_extra: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    출력 파일을 스레드 풀에서 동시에 원자적으로 저장하고 완료 마커 기록
+
+    각 writer는 임시 경로에 파일을 쓰고, 성공한 경우에만 최종 파일명으로 교체됩니다.
+
+    Args:
+        output_mgr: 출력 관리자
+        writers: {파일명: 임시 경로를 받아 파일을 쓰는 함수}
+        max_workers: 동시 저장 스레드 수
+        manifest_extra: 완료 마커에 함께 기록할 추가 정보
+
+    Returns:
+        저장이 완료된 파일명 리스트
+    """
+    def run(filename: str) -> str:
+        with output_mgr.atomic_path(filename) as tmp_path:
+            writers[filename](tmp_path)
+        return filename
+
+    completed = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(writers)))) as executor:
+        futures = {filename: executor.submit(run, filename) for filename in writers}
+        for filename, future in futures.items():
+            try:
+                future.result()
+                completed.append(filename)
+                print(f"  ✅ {filename}: {output_mgr.location(filename)}")
+            except Exception as e:
+                print(f"  ❌ {filename} 저장 실패: {e}")
+
+    output_mgr.write_manifest(completed, extra=manifest_extra)
+    return completed
+
+
+def _check_written(completed: List[str], writers: Dict[str, Callable[[Path], None]]) -> None:
+    """일부 출력 저장에 실패했으면 예외 (완료 마커에는 성공한 파일만 기록된 상태)"""
+    if len(completed) < len(writers):
+        raise RuntimeError(f"{len(writers) - len(completed)}개 파일 저장 실패")
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _write_text(
+    path: Path,
+    text: str,
+    encoding: str = 'utf-8',
+    newline: Optional[str] = None
+) -> None:
+    with open(path, 'w', encoding=encoding, newline=newline) as f:
+        f.write(text)
+
+
+def _write_chunks(path: Path, result: Dict[str, Any], doc_id: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        write_chunks(f, iter_chunks(result, doc_id=doc_id))
+
+
+def _write_searchable_pdf(path: Path, pdf_path: str, result: Dict[str, Any]) -> None:
+    if not OCRProcessor.to_searchable_pdf(pdf_path, result, str(path)):
+        raise RuntimeError("Searchable PDF 생성 실패")
+
+
+def _write_redacted_pdf(
+    path: Path,
+    pdf_path: str,
+    findings: List[Dict[str, Any]],
+    masked_result: Optional[Dict[str, Any]] = None,
+    ocr_result: Optional[Dict[str, Any]] = None
+) -> None:
+    if not redact_pdf(pdf_path, findings, str(path), masked_result, ocr_result):
+        raise RuntimeError("개인정보 가림 PDF 생성 실패")
+
+
 def load_saved_result(
     project_name: str,
-    output_base: str = "./output"
+    output_base: str = "./output",
+    storage: Optional[OutputStorage] = None,
+    use_cache: bool = False
 ) -> Tuple[Optional[Dict], Optional[pd.DataFrame]]:
     """
     저장된 OCR 결과 불러오기
 
     Args:
-        project_name: 프로젝트 폴더명 (예: 'test2' 또는 '자소서_분석_v1')
+        project_name: 프로젝트 폴더명/문서 ID (예: 'test2' 또는 '자소서_분석_v1')
         output_base: 출력 루트 디렉토리 (기본값: ./output)
+        storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리)
+        use_cache: 프로세스 전역 캐시 사용 여부. True이면 파일이 바뀌지 않은 동안 불러온 결과를
+            재사용하며, 반환값은 캐시와 공유되므로 수정하지 않아야 함
 
     Returns:
         (ocr_result, df_result) 튜플
 
     Example:
         >>> ocr_result, df = load_saved_result('test2')
+        >>> ocr_result, df = load_saved_result('test2', use_cache=True)   # 반복 조회
         >>> ocr_result, df = load_saved_result('프로젝트A', output_base='./my_output')
+        >>> ocr_result, df = load_saved_result('resume-3f2a9c1d', storage=SQLiteStorage('ocr.db'))
     """
-    project_dir = Path(output_base) / project_name
+    storage = storage or DirectoryStorage(output_base)
+    if use_cache:
+        return default_cache().get(project_name, storage=storage)
+    location = storage.location(project_name)
+
+    # 완료 마커가 있으면 마커에 기록된 산출물만 신뢰
+    manifest = storage.read_manifest(project_name)
+    completed = manifest['artifacts'] if manifest is not None else None
+
+    def available(filename: str) -> bool:
+        if completed is not None:
+            return filename in completed
+        return storage.exists(project_name, filename)
 
     # JSON 불러오기
-    json_path = project_dir / 'ocr_result.json'
-    if not json_path.exists():
-        print(f"❌ {json_path} 파일이 없습니다")
+    if not available('ocr_result.json'):
+        print(f"❌ {storage.location(project_name, 'ocr_result.json')} 파일이 없습니다")
         return None, None
 
-    with open(json_path, 'r', encoding='utf-8') as f:
+    with storage.open(project_name, 'ocr_result.json') as f:
         ocr_result = json.load(f)
 
     # CSV 불러오기
-    csv_path = project_dir / 'ocr_data.csv'
-    if csv_path.exists():
-        df_result = pd.read_csv(csv_path)
+    if available('ocr_data.csv'):
+        with storage.open(project_name, 'ocr_data.csv') as f:
+            df_result = pd.read_csv(f)
     else:
-        print(f"⚠️ {csv_path} 파일이 없어 DataFrame을 재생성합니다")
+        print(f"⚠️ {storage.location(project_name, 'ocr_data.csv')} 파일이 없어 "
+              f"DataFrame을 재생성합니다")
         df_result = OCRProcessor.to_dataframe(ocr_result)
 
-    print(f"✅ 결과 로딩 완료: {project_dir}")
+    print(f"✅ 결과 로딩 완료: {location}")
     return ocr_result, df_result
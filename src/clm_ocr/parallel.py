@@ -0,0 +1,156 @@
+"""
+페이지 병렬 변환
+큰 OCR 결과의 페이지를 프로세스 풀에 나눠 변환하고, 페이지 순서대로 이어 붙여 순차 결과와 동일한 출력 생성
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .arrays import ResultArrays, ResultView
+from .config import PARALLEL_MIN_PAGES
+from .processor import OCRProcessor, PAGE_SEPARATOR
+
+# 지원하는 변환 종류
+KINDS = ('text', 'markdown', 'dataframe', 'tables')
+
+# 워커 프로세스가 initializer에서 연결한 원본 (view, 공유 메모리) - 부모 프로세스에서는 사용하지 않음
+_worker_source: Optional[Tuple[ResultView, Any]] = None
+
+
+def _init_worker(shm_name: str) -> None:
+    """워커: 공유 메모리의 ResultArrays에 연결"""
+    global _worker_source
+    arrays, shm = ResultArrays.attach(shm_name)
+    _worker_source = (arrays.view(), shm)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """
+    워커 시작 방식 (forkserver, 없으면 spawn)
+
+    fork는 호출 프로세스의 다른 스레드(파이프라인 워커, 캐시 미리 불러오기 등)가 잡고 있던
+    잠금을 상속해 교착될 수 있으므로 사용하지 않습니다.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    # 서버가 모듈을 한 번만 불러 두고 워커는 서버에서 fork하므로 풀을 새로 만들어도 빠름
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _convert_range(kind: str, start: int, stop: int, options: Dict[str, Any]) -> List[Any]:
+    """워커: [start, stop) 페이지를 변환해 페이지별 결과 반환"""
+    images = _worker_source[0].get('images', [])
+    outputs = []
+    for page_idx in range(start, stop):
+        image, page_num = images[page_idx], page_idx + 1
+        if kind == 'text':
+            outputs.append(OCRProcessor.page_to_text(image))
+        elif kind == 'markdown':
+            outputs.append(OCRProcessor.page_to_markdown(
+                image, page_num, options.get('include_confidence', False)
+            ))
+        elif kind == 'dataframe':
+            # 행 딕셔너리보다 직렬화 비용이 작은 열 단위 리스트로 반환
+            rows = OCRProcessor.page_to_rows(image, page_num)
+            outputs.append({
+                column: [row[column] for row in rows] for column in OCRProcessor.DATAFRAME_COLUMNS
+            } if rows else None)
+        else:
+            outputs.append(OCRProcessor.page_to_tables(image, page_num))
+    return outputs
+
+
+def _serial(ocr_result: Dict[str, Any], kind: str, options: Dict[str, Any]) -> Any:
+    if kind == 'text':
+        return OCRProcessor.to_text(ocr_result)
+    if kind == 'markdown':
+        return OCRProcessor.to_markdown(ocr_result, options.get('include_confidence', False))
+    if kind == 'dataframe':
+        return OCRProcessor.to_dataframe(ocr_result)
+    return OCRProcessor.extract_tables(ocr_result)
+
+
+def _merge(kind: str, pages: List[Any]) -> Any:
+    if kind == 'text':
+        return PAGE_SEPARATOR.join(pages)
+    if kind == 'markdown':
+        return '\n'.join(pages)
+    if kind == 'dataframe':
+        data: Dict[str, List[Any]] = {column: [] for column in OCRProcessor.DATAFRAME_COLUMNS}
+        for columns in pages:
+            if columns is not None:
+                for column, values in columns.items():
+                    data[column].extend(values)
+        return pd.DataFrame(data) if data[OCRProcessor.DATAFRAME_COLUMNS[0]] else pd.DataFrame()
+    return [table for tables in pages for table in tables]
+
+
+def _shards(num_pages: int, workers: int) -> List[Tuple[int, int]]:
+    """연속된 페이지 구간으로 분할 (부하 균형을 위해 워커당 4개)"""
+    num_shards = min(num_pages, workers * 4)
+    bounds = [num_pages * i // num_shards for i in range(num_shards + 1)]
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+
+def convert_pages(
+    ocr_result: Union[Dict[str, Any], ResultArrays, ResultView],
+    kind: str,
+    workers: Optional[int] = None,
+    min_pages: int = PARALLEL_MIN_PAGES,
+    **options
+) -> Any:
+    """
+    OCRProcessor 변환을 페이지 단위로 병렬 실행
+
+    원본은 ResultArrays 공유 메모리로 한 번만 전달하고(initializer), 워커는 forkserver/spawn으로
+    시작하므로 다른 스레드가 실행 중인 프로세스에서도 안전하며 동시에 여러 변환을 실행할 수 있습니다.
+    워커는 페이지별 결과만 반환하며, 부모가 페이지 순서대로 이어 붙입니다.
+
+    Args:
+        ocr_result: CLOVA OCR API 응답 (또는 ResultArrays / 그 view)
+        kind: 'text' | 'markdown' | 'dataframe' | 'tables'
+        workers: 워커 프로세스 수 (기본값: CPU 수)
+        min_pages: 병렬 처리할 최소 페이지 수 (미만이면 순차 처리)
+        **options: 변환 옵션 (markdown의 include_confidence)
+
+    Returns:
+        순차 변환(to_text/to_markdown/to_dataframe/extract_tables)과 동일한 결과
+
+    Example:
+        >>> text = convert_pages(ocr_result, 'text', workers=32)
+        >>> df = OCRProcessor.to_dataframe(ocr_result, workers=32)
+    """
+    if kind not in KINDS:
+        raise ValueError(f"지원하지 않는 변환입니다: {kind} (가능: {', '.join(KINDS)})")
+
+    arrays = ocr_result if isinstance(ocr_result, ResultArrays) else (
+        ocr_result.arrays if isinstance(ocr_result, ResultView) else None
+    )
+    source = arrays.view() if arrays is not None else ocr_result
+    num_pages = len(source.get('images', []))
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or num_pages < max(min_pages, 2):
+        return _serial(source, kind, options)
+
+    shards = _shards(num_pages, workers)
+    shm = (arrays or ResultArrays.from_result(source)).to_shared_memory()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)), mp_context=_pool_context(),
+            initializer=_init_worker, initargs=(shm.name,)
+        ) as executor:
+            futures = [
+                executor.submit(_convert_range, kind, lo, hi, options) for lo, hi in shards
+            ]
+            pages = [page for future in futures for page in future.result()]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return _merge(kind, pages)
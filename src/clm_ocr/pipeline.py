@@ -0,0 +1,359 @@
+"""
+다중 문서 파이프라인 처리
+읽기 -> API 대기 -> 변환 -> 저장 단계를 크기 제한 대기열로 연결해 문서 간 네트워크 대기와 후처리를 겹침
+"""
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterable, List, Optional, Union
+
+from .config import (
+    API_URL, SECRET_KEY, DEFAULT_OUTPUT_FORMATS, DEFAULT_LANG, DEFAULT_ENABLE_TABLE,
+    PIPELINE_READ_WORKERS, PIPELINE_API_WORKERS, PIPELINE_CONVERT_WORKERS,
+    PIPELINE_WRITE_WORKERS, PIPELINE_QUEUE_SIZE,
+)
+from .client import ClovaOCRClient, OCROutputManager, _count_pages
+from .storage import OutputStorage
+from .dedup import DuplicateIndex, result_text
+from .refine import refine_low_confidence
+from .main import (
+    build_writers, find_duplicates, load_saved_result, prepare_redactions, write_outputs,
+    _check_written, _manifest_extra,
+)
+
+# 단계 종료 신호
+_DONE = object()
+
+
+class _Stage:
+    """단계 하나: 입력 대기열에서 작업을 꺼내 처리하고 다음 대기열로 전달"""
+
+    def __init__(self, name: str, fn: Callable[[Dict[str, Any]], None], workers: int):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.inbox: Optional[queue.Queue] = None
+        self.next: Optional['_Stage'] = None
+
+        self.items = 0
+        self.failures = 0
+        self.busy = 0.0      # 처리 시간 합
+        self.starved = 0.0   # 입력을 기다린 시간 합
+        self.blocked = 0.0   # 다음 대기열이 가득 차 기다린 시간 합
+        self._alive = self.workers
+        self._lock = threading.Lock()
+
+    def run(self, finish: Callable[[Dict[str, Any]], None]) -> None:
+        """워커 스레드 본체 (종료 신호를 받으면 마지막 워커가 다음 단계에 전달)"""
+        while True:
+            start = time.perf_counter()
+            job = self.inbox.get()
+            waited = time.perf_counter() - start
+            if job is _DONE:
+                with self._lock:
+                    self.starved += waited
+                    self._alive -= 1
+                    last = self._alive == 0
+                if last and self.next is not None:
+                    for _ in range(self.next.workers):
+                        self.next.inbox.put(_DONE)
+                return
+
+            start = time.perf_counter()
+            try:
+                self.fn(job)
+                failed = False
+            except Exception as e:
+                job['error'] = f"{self.name}: {e}"
+                failed = True
+            busy = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if failed or self.next is None:
+                finish(job)
+            else:
+                self.next.inbox.put(job)
+            with self._lock:
+                self.items += 1
+                self.failures += failed
+                self.busy += busy
+                self.starved += waited
+                self.blocked += time.perf_counter() - start
+
+    def stats(self, elapsed: float) -> Dict[str, Any]:
+        capacity = self.workers * elapsed
+        return {
+            'workers': self.workers,
+            'items': self.items,
+            'failures': self.failures,
+            'busy': self.busy,
+            'utilization': self.busy / capacity if capacity else 0.0,
+            'starved': self.starved / capacity if capacity else 0.0,
+            'blocked': self.blocked / capacity if capacity else 0.0,
+        }
+
+
+class OCRPipeline:
+    """
+    여러 PDF를 단계별 워커로 동시에 처리하는 파이프라인
+
+    단계:
+        - read: 파일 확인, 페이지 수 계산, 출력 위치 준비, 유사 문서 조회, 파일 미리 읽기(read-ahead)
+        - api: 업로드 및 OCR 응답 대기, 저신뢰 영역 재인식 (네트워크 대기 단계)
+        - convert: 마스킹, 텍스트/CSV/Markdown 등 출력 내용 생성 (CPU 단계)
+        - write: 원자적 저장 및 완료 마커 기록 (청크 스트리밍, 검색 가능 PDF 생성 포함)
+
+    출력 형식별 저장 내용은 process_pdf와 같은 build_writers로 만듭니다.
+
+    단계 사이 대기열은 크기가 제한되어 있어, 느린 단계가 있으면 앞 단계가 멈춥니다.
+    따라서 동시에 메모리에 있는 문서 수는 워커 수 + 대기열 크기 합을 넘지 않습니다.
+
+    Example:
+        >>> pipeline = OCRPipeline(output_formats=['json', 'text', 'dataframe'], api_workers=16)
+        >>> results = pipeline.run(Path('data').glob('*.pdf'))
+        >>> print_pipeline_stats(pipeline.stats())
+    """
+
+    STAGES = ('read', 'api', 'convert', 'write')
+
+    def __init__(
+        self,
+        client: Optional[ClovaOCRClient] = None,
+        output_formats: Optional[List[str]] = None,
+        output_base: str = "./output",
+        storage: Optional[OutputStorage] = None,
+        lang: str = DEFAULT_LANG,
+        enable_table: bool = DEFAULT_ENABLE_TABLE,
+        redact: bool = False,
+        refine: bool = False,
+        dedup_index: Optional[DuplicateIndex] = None,
+        reuse_duplicates: bool = False,
+        overwrite: bool = False,
+        dispatcher=None,
+        read_workers: int = PIPELINE_READ_WORKERS,
+        api_workers: int = PIPELINE_API_WORKERS,
+        convert_workers: int = PIPELINE_CONVERT_WORKERS,
+        write_workers: int = PIPELINE_WRITE_WORKERS,
+        queue_size: int = PIPELINE_QUEUE_SIZE
+    ):
+        """
+        Args:
+            client: OCR 클라이언트 (기본값: 환경 변수 설정으로 생성)
+            output_formats: 출력 형식 리스트 (process_pdf와 동일)
+            output_base: 출력 루트 디렉토리
+            storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리)
+            lang: 언어 코드
+            enable_table: 테이블 인식 활성화
+            redact: 개인정보 마스킹 여부 (process_pdf와 동일)
+            refine: 저신뢰 영역 재인식 여부 (process_pdf와 동일)
+            dedup_index: 유사 문서 인덱스 (process_pdf와 동일, 파이프라인 안에서 잠금으로 공유)
+            reuse_duplicates: 유사 문서가 있으면 API를 호출하지 않고 저장된 결과 재사용
+            overwrite: 프로젝트에 다른 원본의 결과가 있어도 덮어쓰기 (process_pdf와 동일)
+            dispatcher: AdaptiveDispatcher (지정하면 API 요청 동시성을 AIMD로 조정)
+            read_workers: 읽기 단계 워커 수
+            api_workers: API 단계 워커 수 (동시 요청 상한)
+            convert_workers: 변환 단계 워커 수
+            write_workers: 저장 단계 워커 수
+            queue_size: 단계 사이 대기열 크기
+        """
+        self.client = client or ClovaOCRClient(API_URL, SECRET_KEY)
+        self.output_formats = output_formats or DEFAULT_OUTPUT_FORMATS
+        self.output_base = output_base
+        self.storage = storage
+        self.lang = lang
+        self.enable_table = enable_table
+        self.redact = redact
+        self.refine = refine
+        self.dedup_index = dedup_index
+        self.reuse_duplicates = reuse_duplicates
+        self.overwrite = overwrite
+        self.dispatcher = dispatcher
+        self.queue_size = queue_size
+        self.workers = {
+            'read': read_workers,
+            'api': api_workers,
+            'convert': convert_workers,
+            'write': write_workers,
+        }
+        self._stages: List[_Stage] = []
+        self._elapsed = 0.0
+        self._dedup_lock = threading.Lock()
+
+    def run(self, pdf_paths: Iterable[Union[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        PDF들을 파이프라인으로 처리
+
+        입력 이터러블은 대기열에 자리가 날 때만 읽으므로 제너레이터도 그대로 사용할 수 있습니다.
+        실패한 문서는 이후 단계를 건너뛰고 'error'에 원인을 기록합니다.
+
+        Args:
+            pdf_paths: PDF 파일 경로 이터러블, 또는 사전 점검 기록 이터러블 (plan_documents,
+                기록의 페이지 수/크기를 재사용)
+
+        Returns:
+            입력 순서대로의 처리 요약 리스트
+            [{'pdf_path', 'doc_id', 'location', 'pages', 'artifacts', 'error'}, ...]
+        """
+        fns = {
+            'read': self._read, 'api': self._call_api,
+            'convert': self._convert, 'write': self._write,
+        }
+        self._stages = [_Stage(name, fns[name], self.workers[name]) for name in self.STAGES]
+        for stage, next_stage in zip(self._stages, self._stages[1:] + [None]):
+            stage.inbox = queue.Queue(maxsize=self.queue_size)
+            stage.next = next_stage
+
+        results: Dict[int, Dict[str, Any]] = {}
+        results_lock = threading.Lock()
+
+        def finish(job: Dict[str, Any]) -> None:
+            summary = {
+                'pdf_path': job['pdf_path'],
+                'doc_id': job.get('doc_id'),
+                'location': job.get('location'),
+                'pages': job.get('pages'),
+                'artifacts': job.get('artifacts', []),
+                'error': job.get('error'),
+            }
+            if summary['error']:
+                print(f"❌ {job['pdf_path']} 처리 실패 ({summary['error']})")
+            with results_lock:
+                results[job['index']] = summary
+
+        threads = [
+            threading.Thread(target=stage.run, args=(finish,), daemon=True,
+                             name=f"ocr-pipeline-{stage.name}-{i}")
+            for stage in self._stages for i in range(stage.workers)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        first = self._stages[0]
+        count = 0
+        try:
+            for index, item in enumerate(pdf_paths):
+                if isinstance(item, dict):
+                    job = {'index': index, 'pdf_path': str(item['path']),
+                           'pages': item.get('pages'), 'size': item.get('size_bytes')}
+                else:
+                    job = {'index': index, 'pdf_path': str(item)}
+                first.inbox.put(job)
+                count += 1
+        finally:
+            # 입력 순회 중 예외가 나도 워커가 끝나도록 종료 신호 전달
+            for _ in range(first.workers):
+                first.inbox.put(_DONE)
+
+        for thread in threads:
+            thread.join()
+        self._elapsed = time.perf_counter() - start
+
+        failed = sum(1 for summary in results.values() if summary['error'])
+        print(f"\n✨ 파이프라인 완료: {count - failed}/{count}개 문서 ({self._elapsed:.1f}초)")
+        return [results[index] for index in range(count)]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        마지막 실행의 단계별 통계
+
+        Returns:
+            {단계 이름: {'workers', 'items', 'failures', 'busy'(초),
+                         'utilization', 'starved', 'blocked'}}
+            utilization/starved/blocked는 (워커 수 x 전체 시간) 대비 처리/입력 대기/출력 대기 비율.
+            utilization이 1에 가까운 단계가 병목이며, blocked가 큰 단계는 다음 단계가 느린 것입니다.
+        """
+        return {stage.name: stage.stats(self._elapsed) for stage in self._stages}
+
+    # ============================================
+    # 단계 구현 (작업 딕셔너리를 채워 다음 단계로 전달)
+    # ============================================
+
+    def _read(self, job: Dict[str, Any]) -> None:
+        path = Path(job['pdf_path'])
+        if not path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+        if job.get('pages') is None or job.get('size') is None:
+            job['pages'] = _count_pages(path)
+            job['size'] = path.stat().st_size
+
+        output_mgr = OCROutputManager(str(path), self.output_base, storage=self.storage)
+        output_mgr.setup_directories(self.overwrite)
+        job['output_mgr'] = output_mgr
+        job['doc_id'] = output_mgr.project_name
+        job['location'] = output_mgr.location()
+
+        if self.dedup_index is not None:
+            job['duplicates'], job['page_hashes'] = find_duplicates(
+                self.dedup_index, str(path), output_mgr.project_name, self._dedup_lock
+            )
+            if job['duplicates'] and self.reuse_duplicates:
+                job['result'], _ = load_saved_result(
+                    job['duplicates'][0]['doc_id'], storage=output_mgr.storage
+                )
+
+        # 업로드 시 디스크 대기가 없도록 OS 페이지 캐시에 미리 읽기 요청
+        if hasattr(os, 'posix_fadvise'):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+
+    def _call_api(self, job: Dict[str, Any]) -> None:
+        if job.get('result') is not None:
+            return
+        kwargs = {'lang': self.lang, 'enable_table': self.enable_table, 'use_cache': False}
+        if self.dispatcher is None:
+            job['result'] = self.client.ocr_from_file(job['pdf_path'], **kwargs)
+        else:
+            cost = self.client.timeout_policy.estimate(job['pages'], job['size'])
+            job['result'] = self.dispatcher.call(
+                self.client.ocr_from_file, job['pdf_path'], cost=cost, **kwargs
+            )
+        if self.refine:
+            job['result'], job['refine_report'] = refine_low_confidence(
+                job['pdf_path'], job['result'], self.client, lang=self.lang
+            )
+
+    def _convert(self, job: Dict[str, Any]) -> None:
+        """출력 내용을 미리 만들어 두고, 저장 단계에는 쓰기만 남김"""
+        result, findings = prepare_redactions(job.pop('result'), self.output_formats, self.redact)
+        job['writers'] = build_writers(
+            result, self.output_formats, job['pdf_path'], job['doc_id'], findings,
+            redact=self.redact, enable_table=self.enable_table, prerender=True
+        )
+        job['manifest_extra'] = _manifest_extra(
+            job.get('duplicates', []), findings, job.get('refine_report')
+        )
+        if self.dedup_index is not None:
+            job['dedup_text'] = result_text(result)
+
+    def _write(self, job: Dict[str, Any]) -> None:
+        output_mgr = job.pop('output_mgr')
+        output_mgr.invalidate_manifest()
+        writers = job.pop('writers')
+        job['artifacts'] = write_outputs(
+            output_mgr, writers, max_workers=1, manifest_extra=job.pop('manifest_extra')
+        )
+        _check_written(job['artifacts'], writers)
+        if self.dedup_index is not None:
+            with self._dedup_lock:
+                self.dedup_index.add(
+                    job['doc_id'], text=job.pop('dedup_text'), page_hashes=job['page_hashes']
+                )
+
+
+def print_pipeline_stats(stats: Dict[str, Dict[str, Any]]) -> None:
+    """단계별 통계 출력 (가장 바쁜 단계를 병목으로 표시)"""
+    if not stats:
+        return
+    bottleneck = max(stats, key=lambda name: stats[name]['utilization'])
+    print("\n📈 파이프라인 단계별 사용률")
+    for name, stage in stats.items():
+        marker = " ← 병목" if name == bottleneck else ""
+        print(f"  {name:8s} 워커 {stage['workers']:2d}개 | 처리 {stage['items']}건 "
+              f"(실패 {stage['failures']}) | 사용률 {stage['utilization']:.0%} "
+              f"| 입력 대기 {stage['starved']:.0%} | 출력 대기 {stage['blocked']:.0%}{marker}")
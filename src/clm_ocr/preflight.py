@@ -0,0 +1,229 @@
+"""
+배치 사전 점검
+렌더링 없이 PDF 메타데이터와 페이지 구조만 프로세스 풀에서 읽어 페이지 수, 문제 파일, 예상 요청 수/비용을 계획 파일로 저장
+"""
+import json
+import math
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Union
+
+import fitz  # PyMuPDF
+
+from .config import PREFLIGHT_MAX_PAGE_SIDE, OCR_COST_PER_PAGE
+from .client import AdaptiveTimeout
+
+# 문서 상태
+STATUS_OK = 'ok'
+STATUS_MISSING = 'missing'
+STATUS_BROKEN = 'broken'
+STATUS_ENCRYPTED = 'encrypted'
+STATUS_EMPTY = 'empty'
+
+# 확장자가 이미지인 파일은 1페이지로 취급
+IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.tif', '.tiff')
+
+
+def scan_document(
+    path: str,
+    max_page_side: float = PREFLIGHT_MAX_PAGE_SIDE,
+    pages_per_request: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    문서 하나 점검 (페이지를 렌더링하거나 텍스트를 추출하지 않음)
+
+    텍스트 레이어는 페이지가 사용하는 글꼴 리소스로 판단합니다 (페이지 객체를 만들지 않는 조회).
+
+    Args:
+        path: PDF/이미지 파일 경로
+        max_page_side: 과대 페이지 기준 (PDF 포인트)
+        pages_per_request: 요청당 페이지 수 (None이면 파일당 1회 요청)
+
+    Returns:
+        {'path', 'status', 'error', 'size_bytes', 'pages', 'text_layer_pages',
+         'oversized_pages': [페이지 번호], 'repaired', 'api_calls'}
+    """
+    record = {
+        'path': str(path), 'status': STATUS_OK, 'error': None, 'size_bytes': 0, 'pages': 0,
+        'text_layer_pages': 0, 'oversized_pages': [], 'repaired': False, 'api_calls': 0,
+    }
+    try:
+        record['size_bytes'] = os.stat(path).st_size
+    except OSError as e:
+        record.update(status=STATUS_MISSING, error=str(e))
+        return record
+
+    if Path(path).suffix.lower() in IMAGE_SUFFIXES:
+        record.update(pages=1, api_calls=1)
+        return record
+
+    try:
+        with fitz.open(path) as doc:
+            if doc.needs_pass:
+                record['status'] = STATUS_ENCRYPTED
+                return record
+            record['pages'] = doc.page_count
+            record['repaired'] = bool(doc.is_repaired)
+            for pno in range(doc.page_count):
+                box = doc.page_cropbox(pno)
+                if max(box.width, box.height) > max_page_side:
+                    record['oversized_pages'].append(pno + 1)
+                if doc.get_page_fonts(pno):
+                    record['text_layer_pages'] += 1
+    except Exception as e:
+        record.update(status=STATUS_BROKEN, error=str(e))
+        return record
+
+    if record['pages'] == 0:
+        record['status'] = STATUS_EMPTY
+    else:
+        record['api_calls'] = (
+            math.ceil(record['pages'] / pages_per_request) if pages_per_request else 1
+        )
+    return record
+
+
+def _iter_inputs(inputs: Union[str, Iterable[str]]) -> Iterator[str]:
+    """디렉토리면 하위 PDF/이미지를 재귀적으로 (확장자 대소문자 무시), 아니면 경로를 그대로 순회"""
+    if isinstance(inputs, (str, Path)):
+        if Path(inputs).is_dir():
+            suffixes = ('.pdf',) + IMAGE_SUFFIXES
+            return (str(path) for path in sorted(Path(inputs).rglob('*'))
+                    if path.suffix.lower() in suffixes and path.is_file())
+        return iter([str(inputs)])
+    return (str(path) for path in inputs)
+
+
+def preflight(
+    inputs: Union[str, Iterable[str]],
+    plan_path: str = "./output/plan.jsonl",
+    workers: Optional[int] = None,
+    pages_per_request: Optional[int] = None,
+    max_page_side: float = PREFLIGHT_MAX_PAGE_SIDE,
+    cost_per_page: float = OCR_COST_PER_PAGE,
+    timeout_policy: Optional[AdaptiveTimeout] = None,
+    chunksize: int = 64
+) -> Dict[str, Any]:
+    """
+    문서 묶음을 프로세스 풀에서 점검하고 계획 파일(JSON Lines, 문서당 한 줄) 저장
+
+    파일을 chunksize개씩 워커에 넘겨 프로세스 간 통신 비용을 줄이고, 결과는 입력 순서대로
+    도착하는 즉시 기록합니다 (문서 기록을 모아 두지 않음). 계획 파일은 완료 후 원자적으로 교체됩니다.
+
+    Args:
+        inputs: PDF가 들어 있는 디렉토리 또는 파일 경로 이터러블
+        plan_path: 계획 파일 경로
+        workers: 워커 프로세스 수 (기본값: CPU 수)
+        pages_per_request: 요청당 페이지 수 (None이면 파일당 1회 요청, 스트리밍은 chunk_size)
+        max_page_side: 과대 페이지 기준 (PDF 포인트)
+        cost_per_page: 페이지당 예상 비용
+        timeout_policy: 소요 시간 추정에 사용할 정책 (기본값: AdaptiveTimeout())
+        chunksize: 워커에 한 번에 넘길 파일 수
+
+    Returns:
+        요약 {'documents', 'status': {상태: 문서 수}, 'pages', 'text_layer_pages',
+              'text_layer_documents', 'oversized_pages', 'repaired', 'upload_bytes',
+              'api_calls', 'estimated_cost', 'estimated_seconds', 'plan_path', 'elapsed'}
+
+    Example:
+        >>> summary = preflight('data/', plan_path='plan.jsonl', workers=16)
+        >>> print_plan_summary(summary)
+        >>> OCRPipeline().run(plan_documents('plan.jsonl'))
+    """
+    timeout_policy = timeout_policy or AdaptiveTimeout()
+    scan = partial(scan_document, max_page_side=max_page_side,
+                   pages_per_request=pages_per_request)
+
+    summary = {
+        'documents': 0, 'status': {}, 'pages': 0, 'text_layer_pages': 0,
+        'text_layer_documents': 0, 'oversized_pages': 0, 'repaired': 0, 'upload_bytes': 0,
+        'api_calls': 0, 'estimated_cost': 0.0, 'estimated_seconds': 0.0,
+        'plan_path': str(plan_path),
+    }
+
+    plan_path = Path(plan_path)
+    plan_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = plan_path.with_name(f".{uuid.uuid4().hex}.{plan_path.name}.tmp")
+    start = time.perf_counter()
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f, \
+                ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            for record in executor.map(scan, _iter_inputs(inputs), chunksize=chunksize):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+
+                summary['documents'] += 1
+                summary['status'][record['status']] = \
+                    summary['status'].get(record['status'], 0) + 1
+                summary['oversized_pages'] += len(record['oversized_pages'])
+                summary['repaired'] += record['repaired']
+                if record['status'] != STATUS_OK:
+                    continue
+                summary['pages'] += record['pages']
+                summary['text_layer_pages'] += record['text_layer_pages']
+                summary['text_layer_documents'] += \
+                    record['text_layer_pages'] == record['pages']
+                summary['upload_bytes'] += record['size_bytes']
+                summary['api_calls'] += record['api_calls']
+                summary['estimated_cost'] += record['pages'] * cost_per_page
+                summary['estimated_seconds'] += timeout_policy.estimate(
+                    record['pages'], record['size_bytes']
+                )
+        os.replace(tmp_path, plan_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+
+def read_plan(plan_path: str) -> Iterator[Dict[str, Any]]:
+    """계획 파일의 문서 기록 순회"""
+    with open(plan_path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def plan_documents(
+    plan_path: str,
+    skip_text_layer: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    계획 파일에서 처리 가능한 문서만 순회 (OCRPipeline.run에 그대로 전달 가능)
+
+    Args:
+        plan_path: preflight가 저장한 계획 파일
+        skip_text_layer: 모든 페이지에 텍스트 레이어가 있는 문서 제외
+
+    Yields:
+        상태가 'ok'인 문서 기록
+    """
+    for record in read_plan(plan_path):
+        if record['status'] != STATUS_OK:
+            continue
+        if skip_text_layer and record['text_layer_pages'] == record['pages']:
+            continue
+        yield record
+
+
+def print_plan_summary(summary: Dict[str, Any]) -> None:
+    """사전 점검 요약 출력"""
+    status = summary['status']
+    problems = {name: count for name, count in status.items() if name != STATUS_OK}
+    print(f"\n🧭 사전 점검: {summary['documents']}개 문서 ({summary['elapsed']:.1f}초)")
+    print(f"  - 처리 가능: {status.get(STATUS_OK, 0)}개, {summary['pages']}페이지 "
+          f"(업로드 {summary['upload_bytes'] / (1024 * 1024):.1f}MB)")
+    if problems:
+        print("  - ⚠️ 문제 파일: " + ", ".join(f"{k} {v}개" for k, v in problems.items()))
+    print(f"  - 텍스트 레이어: {summary['text_layer_pages']}페이지 "
+          f"(전체 페이지에 있는 문서 {summary['text_layer_documents']}개)")
+    if summary['oversized_pages'] or summary['repaired']:
+        print(f"  - 과대 페이지 {summary['oversized_pages']}개, 복구된 파일 {summary['repaired']}개")
+    print(f"  - 예상 API 호출 {summary['api_calls']}회, 비용 {summary['estimated_cost']:,.0f}원, "
+          f"순차 소요 {summary['estimated_seconds'] / 60:.0f}분")
+    print(f"  - 계획 파일: {summary['plan_path']}")
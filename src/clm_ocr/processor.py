@@ -4,83 +4,128 @@ OCR JSON을 다양한 형식으로 변환하는 비즈니스 로직
 """
 import pandas as pd
 import fitz  # PyMuPDF
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+# to_text 페이지 구분자
+PAGE_SEPARATOR = '\n\n--- 페이지 구분 ---\n\n'
 
 
 class OCRProcessor:
     """OCR 결과 처리 클래스"""
 
+    # to_dataframe 열 순서
+    DATAFRAME_COLUMNS = ['페이지', '필드_번호', '텍스트', '신뢰도', '타입', '줄바꿈', 'X1', 'Y1']
+
     @staticmethod
-    def to_dataframe(ocr_result: Dict[str, Any]) -> pd.DataFrame:
+    def to_dataframe(ocr_result: Dict[str, Any], workers: Optional[int] = None) -> pd.DataFrame:
         """
         OCR 결과를 DataFrame으로 변환
 
         Args:
             ocr_result: CLOVA OCR API 응답
+            workers: 지정하면 페이지를 프로세스 풀에서 병렬 변환 (작은 결과는 순차 처리)
 
         Returns:
             파싱된 결과 DataFrame
         """
+        if workers is not None:
+            from .parallel import convert_pages
+            return convert_pages(ocr_result, 'dataframe', workers)
+
         data = []
 
         for img_idx, image in enumerate(ocr_result.get('images', [])):
-            for field_idx, field in enumerate(image.get('fields', [])):
-                # boundingPoly 좌표 안전하게 추출
-                x1, y1 = 0, 0
-                try:
-                    vertices = field.get('boundingPoly', {}).get('vertices', [])
-                    if vertices and len(vertices) > 0:
-                        x1 = float(vertices[0].get('x', 0))
-                        y1 = float(vertices[0].get('y', 0))
-                except (TypeError, ValueError, IndexError):
-                    pass
-
-                data.append({
-                    '페이지': img_idx + 1,
-                    '필드_번호': field_idx + 1,
-                    '텍스트': str(field.get('inferText', '')),
-                    '신뢰도': float(field.get('inferConfidence', 0)),
-                    '타입': str(field.get('type', 'NORMAL')),
-                    '줄바꿈': bool(field.get('lineBreak', False)),
-                    'X1': x1,
-                    'Y1': y1,
-                })
+            data.extend(OCRProcessor.page_to_rows(image, img_idx + 1))
 
         return pd.DataFrame(data)
 
     @staticmethod
-    def to_text(ocr_result: Dict[str, Any]) -> str:
+    def page_to_rows(image: Dict[str, Any], page_num: int) -> List[Dict[str, Any]]:
+        """
+        한 페이지의 필드를 DataFrame 행 딕셔너리 리스트로 변환
+
+        Args:
+            image: OCR 응답의 images 항목 (한 페이지)
+            page_num: 페이지 번호 (1부터 시작)
+
+        Returns:
+            DATAFRAME_COLUMNS 순서의 행 딕셔너리 리스트
+        """
+        rows = []
+
+        for field_idx, field in enumerate(image.get('fields', [])):
+            # boundingPoly 좌표 안전하게 추출
+            x1, y1 = 0, 0
+            try:
+                vertices = field.get('boundingPoly', {}).get('vertices', [])
+                if vertices and len(vertices) > 0:
+                    x1 = float(vertices[0].get('x', 0))
+                    y1 = float(vertices[0].get('y', 0))
+            except (TypeError, ValueError, IndexError):
+                pass
+
+            rows.append({
+                '페이지': page_num,
+                '필드_번호': field_idx + 1,
+                '텍스트': str(field.get('inferText', '')),
+                '신뢰도': float(field.get('inferConfidence', 0)),
+                '타입': str(field.get('type', 'NORMAL')),
+                '줄바꿈': bool(field.get('lineBreak', False)),
+                'X1': x1,
+                'Y1': y1,
+            })
+
+        return rows
+
+    @staticmethod
+    def to_text(ocr_result: Dict[str, Any], workers: Optional[int] = None) -> str:
         """
         OCR 결과에서 전체 텍스트 추출
 
         Args:
             ocr_result: CLOVA OCR API 응답
+            workers: 지정하면 페이지를 프로세스 풀에서 병렬 변환 (작은 결과는 순차 처리)
 
         Returns:
             추출된 전체 텍스트
         """
-        texts = []
+        if workers is not None:
+            from .parallel import convert_pages
+            return convert_pages(ocr_result, 'text', workers)
 
-        for image in ocr_result.get('images', []):
-            page_text = []
-            for field in image.get('fields', []):
-                text = field.get('inferText', '')
-                page_text.append(text)
+        texts = [OCRProcessor.page_to_text(image) for image in ocr_result.get('images', [])]
 
-                # lineBreak가 true면 줄바꿈 추가
-                if field.get('lineBreak', False):
-                    page_text.append('\n')
-                else:
-                    page_text.append(' ')
+        return PAGE_SEPARATOR.join(texts)
 
-            texts.append(''.join(page_text))
+    @staticmethod
+    def page_to_text(image: Dict[str, Any]) -> str:
+        """
+        한 페이지의 텍스트 추출
 
-        return '\n\n--- 페이지 구분 ---\n\n'.join(texts)
+        Args:
+            image: OCR 응답의 images 항목 (한 페이지)
+
+        Returns:
+            페이지 텍스트
+        """
+        page_text = []
+        for field in image.get('fields', []):
+            text = field.get('inferText', '')
+            page_text.append(text)
+
+            # lineBreak가 true면 줄바꿈 추가
+            if field.get('lineBreak', False):
+                page_text.append('\n')
+            else:
+                page_text.append(' ')
+
+        return ''.join(page_text)
 
     @staticmethod
     def to_markdown(
         ocr_result: Dict[str, Any],
-        include_confidence: bool = False
+        include_confidence: bool = False,
+        workers: Optional[int] = None
     ) -> str:
         """
         OCR 결과를 Markdown으로 변환
@@ -88,39 +133,67 @@ class OCRProcessor:
         Args:
             ocr_result: CLOVA OCR API 응답
             include_confidence: 낮은 신뢰도 텍스트에 신뢰도 표시 여부
+            workers: 지정하면 페이지를 프로세스 풀에서 병렬 변환 (작은 결과는 순차 처리)
 
         Returns:
             Markdown 형식 문자열
         """
-        md_lines = []
+        if workers is not None:
+            from .parallel import convert_pages
+            return convert_pages(
+                ocr_result, 'markdown', workers, include_confidence=include_confidence
+            )
 
-        for page_idx, image in enumerate(ocr_result.get('images', [])):
-            md_lines.append(f"## 페이지 {page_idx + 1}\n")
+        pages = [
+            OCRProcessor.page_to_markdown(image, page_idx + 1, include_confidence)
+            for page_idx, image in enumerate(ocr_result.get('images', []))
+        ]
+
+        return '\n'.join(pages)
+
+    @staticmethod
+    def page_to_markdown(
+        image: Dict[str, Any],
+        page_num: int,
+        include_confidence: bool = False
+    ) -> str:
+        """
+        한 페이지를 Markdown으로 변환
+
+        Args:
+            image: OCR 응답의 images 항목 (한 페이지)
+            page_num: 페이지 번호 (1부터 시작)
+            include_confidence: 낮은 신뢰도 텍스트에 신뢰도 표시 여부
 
-            current_paragraph = []
-            for field in image.get('fields', []):
-                text = field.get('inferText', '').strip()
-                confidence = field.get('inferConfidence', 0)
+        Returns:
+            페이지 Markdown 문자열 (to_markdown은 페이지들을 줄바꿈으로 연결)
+        """
+        md_lines = [f"## 페이지 {page_num}\n"]
 
-                if not text:
-                    continue
+        current_paragraph = []
+        for field in image.get('fields', []):
+            text = field.get('inferText', '').strip()
+            confidence = field.get('inferConfidence', 0)
 
-                # 낮은 신뢰도 표시
-                if include_confidence and confidence < 0.9:
-                    text = f"*{text}* ({confidence:.1%})"
+            if not text:
+                continue
 
-                # 줄바꿈 처리
-                if field.get('lineBreak', False):
-                    current_paragraph.append(text)
-                    md_lines.append(' '.join(current_paragraph) + '\n')
-                    current_paragraph = []
-                else:
-                    current_paragraph.append(text)
+            # 낮은 신뢰도 표시
+            if include_confidence and confidence < 0.9:
+                text = f"*{text}* ({confidence:.1%})"
 
-            if current_paragraph:
+            # 줄바꿈 처리
+            if field.get('lineBreak', False):
+                current_paragraph.append(text)
                 md_lines.append(' '.join(current_paragraph) + '\n')
+                current_paragraph = []
+            else:
+                current_paragraph.append(text)
 
-            md_lines.append('\n---\n\n')
+        if current_paragraph:
+            md_lines.append(' '.join(current_paragraph) + '\n')
+
+        md_lines.append('\n---\n\n')
 
         return '\n'.join(md_lines)
 
@@ -148,22 +221,7 @@ class OCRProcessor:
                 if page_num >= len(doc):
                     break
 
-                page = doc[page_num]
-
-                for field in image_result.get('fields', []):
-                    text = field.get('inferText', '')
-                    vertices = field.get('boundingPoly', {}).get('vertices', [])
-
-                    if not vertices or len(vertices) < 4:
-                        continue
-
-                    x0 = min(v.get('x', 0) for v in vertices)
-                    y0 = min(v.get('y', 0) for v in vertices)
-                    x1 = max(v.get('x', 0) for v in vertices)
-                    y1 = max(v.get('y', 0) for v in vertices)
-
-                    rect = fitz.Rect(x0, y0, x1, y1)
-                    page.insert_textbox(rect, text, fontsize=11, render_mode=3)
+                OCRProcessor.insert_page_text(doc[page_num], image_result)
 
             doc.save(output_path)
             doc.close()
@@ -175,49 +233,99 @@ class OCRProcessor:
             return False
 
     @staticmethod
-    def extract_tables(ocr_result: Dict[str, Any]) -> List[Dict]:
+    def insert_page_text(
+        page: fitz.Page,
+        image_result: Dict[str, Any],
+        scale: float = 1.0
+    ) -> None:
+        """
+        PDF 페이지에 OCR 텍스트를 보이지 않는 텍스트 레이어로 삽입
+
+        Args:
+            page: PyMuPDF 페이지
+            image_result: OCR 응답의 images 항목 (한 페이지)
+            scale: PDF 포인트당 OCR 좌표 단위 (좌표를 이 값으로 나눠 삽입, 기본값: 좌표 = 포인트)
+        """
+        for field in image_result.get('fields', []):
+            text = field.get('inferText', '')
+            vertices = field.get('boundingPoly', {}).get('vertices', [])
+
+            if not vertices or len(vertices) < 4:
+                continue
+
+            x0 = min(v.get('x', 0) for v in vertices)
+            y0 = min(v.get('y', 0) for v in vertices)
+            x1 = max(v.get('x', 0) for v in vertices)
+            y1 = max(v.get('y', 0) for v in vertices)
+
+            rect = fitz.Rect(x0 / scale, y0 / scale, x1 / scale, y1 / scale)
+            page.insert_textbox(rect, text, fontsize=11, render_mode=3)
+
+    @staticmethod
+    def extract_tables(ocr_result: Dict[str, Any], workers: Optional[int] = None) -> List[Dict]:
         """
         OCR 결과에서 테이블 추출하여 DataFrame으로 변환
 
         Args:
             ocr_result: CLOVA OCR API 응답
+            workers: 지정하면 페이지를 프로세스 풀에서 병렬 변환 (작은 결과는 순차 처리)
 
         Returns:
             테이블 정보 딕셔너리 리스트
             [{'page': 1, 'table_idx': 1, 'dataframe': DataFrame}, ...]
         """
+        if workers is not None:
+            from .parallel import convert_pages
+            return convert_pages(ocr_result, 'tables', workers)
+
         tables_list = []
 
         for page_idx, image in enumerate(ocr_result.get('images', [])):
-            tables = image.get('tables', [])
-
-            for table_idx, table in enumerate(tables):
-                cells = table.get('cells', [])
-                if not cells:
-                    continue
-
-                # 테이블 크기 파악
-                max_row = max(cell.get('rowIndex', 0) for cell in cells) + 1
-                max_col = max(cell.get('columnIndex', 0) for cell in cells) + 1
-
-                # 2D 배열 생성
-                grid = [[''] * max_col for _ in range(max_row)]
-
-                # 셀 배치
-                for cell in cells:
-                    row = cell.get('rowIndex', 0)
-                    col = cell.get('columnIndex', 0)
-                    text_lines = cell.get('cellTextLines', [])
-                    text = text_lines[0].get('text', '') if text_lines else ''
-                    grid[row][col] = text
-
-                # DataFrame 생성
-                df = pd.DataFrame(grid[1:], columns=grid[0] if grid else [])
-                tables_list.append({
-                    'page': page_idx + 1,
-                    'table_idx': table_idx + 1,
-                    'dataframe': df
-                })
+            tables_list.extend(OCRProcessor.page_to_tables(image, page_idx + 1))
+
+        return tables_list
+
+    @staticmethod
+    def page_to_tables(image: Dict[str, Any], page_num: int) -> List[Dict]:
+        """
+        한 페이지의 테이블을 DataFrame으로 변환
+
+        Args:
+            image: OCR 응답의 images 항목 (한 페이지)
+            page_num: 페이지 번호 (1부터 시작)
+
+        Returns:
+            [{'page': page_num, 'table_idx': 1, 'dataframe': DataFrame}, ...]
+        """
+        tables_list = []
+
+        for table_idx, table in enumerate(image.get('tables', [])):
+            cells = table.get('cells', [])
+            if not cells:
+                continue
+
+            # 테이블 크기 파악
+            max_row = max(cell.get('rowIndex', 0) for cell in cells) + 1
+            max_col = max(cell.get('columnIndex', 0) for cell in cells) + 1
+
+            # 2D 배열 생성
+            grid = [[''] * max_col for _ in range(max_row)]
+
+            # 셀 배치
+            for cell in cells:
+                row = cell.get('rowIndex', 0)
+                col = cell.get('columnIndex', 0)
+                text_lines = cell.get('cellTextLines', [])
+                text = text_lines[0].get('text', '') if text_lines else ''
+                grid[row][col] = text
+
+            # DataFrame 생성
+            df = pd.DataFrame(grid[1:], columns=grid[0] if grid else [])
+            tables_list.append({
+                'page': page_num,
+                'table_idx': table_idx + 1,
+                'dataframe': df
+            })
 
         return tables_list
 
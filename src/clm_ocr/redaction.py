@@ -0,0 +1,219 @@
+"""
+개인정보(PII) 마스킹
+주민등록번호, 전화번호, 이메일, 계좌번호를 하나의 정규식으로 찾아 텍스트와 PDF에서 가림
+"""
+import bisect
+import re
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from .processor import OCRProcessor
+from .regions import field_rect, result_scale
+
+# 하나의 컴파일된 정규식으로 모든 유형을 한 번에 탐색 (앞선 대안이 우선)
+# 계좌번호는 날짜(YYYY-MM-DD) 형태를 제외
+PII_PATTERN = re.compile(
+    r"""
+    (?P<rrn>(?<!\d)\d{6}\s?-\s?[1-8]\d{6}(?!\d))
+    |(?P<phone>(?<!\d)(?:01[016789]|0[2-6]\d?|070)[-.\s]?\d{3,4}[-.\s]?\d{4}(?!\d))
+    |(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)
+    |(?P<account>(?<!\d)(?!\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])(?!\d))
+        \d{2,6}-\d{2,6}-\d{2,7}(?:-\d{1,3})?(?!\d))
+    """,
+    re.VERBOSE
+)
+
+DEFAULT_MASK_CHAR = '*'
+
+
+def _mask(text: str, start: int, end: int, mask_char: str) -> str:
+    """text[start:end]의 공백 외 문자를 마스킹"""
+    masked = ''.join(ch if ch.isspace() else mask_char for ch in text[start:end])
+    return text[:start] + masked + text[end:]
+
+
+def redact_page(
+    image: Dict[str, Any],
+    page_num: int,
+    mask_char: str = DEFAULT_MASK_CHAR
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    한 페이지의 필드/테이블 텍스트에서 개인정보 마스킹
+
+    필드 텍스트를 to_text와 같은 방식(공백/줄바꿈)으로 이어 붙여 정규식을 한 번만 실행하므로,
+    '010 1234 5678'처럼 여러 필드에 나뉜 번호도 찾습니다.
+    변경된 필드만 복사하고 나머지는 원본 객체를 공유합니다.
+
+    Args:
+        image: OCR 응답의 images 항목 (한 페이지)
+        page_num: 페이지 번호 (1부터 시작)
+        mask_char: 마스킹 문자
+
+    Returns:
+        (마스킹된 페이지, 발견 항목 리스트) 튜플
+        발견 항목: {'page', 'kind', 'fields': [필드 인덱스], 'rects': [(x0, y0, x1, y1)]}
+    """
+    fields = image.get('fields', [])
+    starts, pieces, offset = [], [], 0
+    for field in fields:
+        text = field.get('inferText', '')
+        starts.append(offset)
+        pieces.append(text)
+        pieces.append('\n' if field.get('lineBreak', False) else ' ')
+        offset += len(text) + 1
+    page_text = ''.join(pieces)
+
+    masked_texts: Dict[int, str] = {}
+    findings = []
+    for match in PII_PATTERN.finditer(page_text):
+        first = bisect.bisect_right(starts, match.start()) - 1
+        last = bisect.bisect_right(starts, match.end() - 1) - 1
+        for idx in range(first, last + 1):
+            text = masked_texts.get(idx, fields[idx].get('inferText', ''))
+            lo = max(0, match.start() - starts[idx])
+            hi = min(len(text), match.end() - starts[idx])
+            masked_texts[idx] = _mask(text, lo, hi, mask_char)
+        rects = (field_rect(fields[idx]) for idx in range(first, last + 1))
+        findings.append({
+            'page': page_num,
+            'kind': match.lastgroup,
+            'fields': list(range(first, last + 1)),
+            'rects': [rect for rect in rects if rect is not None],
+        })
+
+    tables, tables_changed = [], False
+    for table in image.get('tables', []):
+        cells = []
+        for cell in table.get('cells', []):
+            lines = []
+            for line in cell.get('cellTextLines', []):
+                text = line.get('text', '')
+                masked = PII_PATTERN.sub(
+                    lambda m: ''.join(ch if ch.isspace() else mask_char for ch in m.group()), text
+                )
+                lines.append({**line, 'text': masked} if masked != text else line)
+            original = cell.get('cellTextLines', [])
+            changed = any(new is not old for new, old in zip(lines, original))
+            cells.append({**cell, 'cellTextLines': lines} if changed else cell)
+            tables_changed = tables_changed or changed
+        tables.append({**table, 'cells': cells})
+
+    if not masked_texts and not tables_changed:
+        return image, findings
+
+    masked_image = dict(image)
+    masked_image['fields'] = [
+        {**field, 'inferText': masked_texts[idx]} if idx in masked_texts else field
+        for idx, field in enumerate(fields)
+    ]
+    if tables_changed:
+        masked_image['tables'] = tables
+    return masked_image, findings
+
+
+def redact_result(
+    ocr_result: Dict[str, Any],
+    mask_char: str = DEFAULT_MASK_CHAR
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    OCR 결과 전체의 개인정보 마스킹
+
+    마스킹된 결과를 OCRProcessor 변환에 그대로 넘기면 마스킹된 텍스트/Markdown/CSV가 생성됩니다.
+
+    Args:
+        ocr_result: CLOVA OCR API 응답
+        mask_char: 마스킹 문자
+
+    Returns:
+        (마스킹된 OCR 결과, 발견 항목 리스트) 튜플
+    """
+    images, findings = [], []
+    for page_idx, image in enumerate(ocr_result.get('images', [])):
+        masked, page_findings = redact_page(image, page_idx + 1, mask_char)
+        images.append(masked)
+        findings.extend(page_findings)
+    return {**ocr_result, 'images': images}, findings
+
+
+def apply_page_redactions(
+    page: fitz.Page,
+    findings: List[Dict[str, Any]],
+    masked_image: Optional[Dict[str, Any]] = None,
+    scale: Optional[float] = None
+) -> int:
+    """
+    PDF 페이지 하나에 가림 주석을 모아 추가하고 한 번에 적용
+
+    발견 항목의 영역과 마스킹된 텍스트 레이어는 OCR 좌표이므로 같은 scale로 나눠 PDF 포인트로 변환합니다.
+
+    Args:
+        page: PyMuPDF 페이지
+        findings: 해당 페이지의 발견 항목 리스트
+        masked_image: 지정하면 적용 후 마스킹된 텍스트 레이어를 삽입 (검색 가능 PDF)
+        scale: PDF 포인트당 OCR 좌표 단위 (기본값: masked_image로 계산한 result_scale, 없으면 1.0)
+
+    Returns:
+        가린 영역 수
+    """
+    if scale is None:
+        scale = result_scale(page, masked_image) if masked_image is not None else 1.0
+    count = 0
+    for finding in findings:
+        for x0, y0, x1, y1 in finding['rects']:
+            rect = fitz.Rect(x0 / scale, y0 / scale, x1 / scale, y1 / scale)
+            page.add_redact_annot(rect, fill=(0, 0, 0))
+            count += 1
+    if count:
+        page.apply_redactions()
+    if masked_image is not None:
+        OCRProcessor.insert_page_text(page, masked_image, scale)
+    return count
+
+
+def redact_pdf(
+    original_pdf: str,
+    findings: List[Dict[str, Any]],
+    output_path: str,
+    masked_result: Optional[Dict[str, Any]] = None,
+    ocr_result: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    개인정보 영역을 가린 PDF 생성
+
+    Args:
+        original_pdf: 원본 PDF 파일 경로
+        findings: redact_result의 발견 항목 리스트
+        output_path: 출력 PDF 파일 경로
+        masked_result: 지정하면 마스킹된 텍스트 레이어도 삽입 (검색 가능한 가림 PDF)
+        ocr_result: 좌표 변환에 사용할 OCR 결과 (기본값: masked_result)
+
+    Returns:
+        성공 여부
+    """
+    by_page = defaultdict(list)
+    for finding in findings:
+        by_page[finding['page']].append(finding)
+    masked_images = masked_result.get('images', []) if masked_result else []
+    scale_images = (ocr_result or masked_result or {}).get('images', [])
+
+    try:
+        with fitz.open(original_pdf) as doc:
+            total = 0
+            for page_idx in range(len(doc)):
+                masked_image = masked_images[page_idx] if page_idx < len(masked_images) else None
+                if page_idx + 1 in by_page or masked_image is not None:
+                    page = doc[page_idx]
+                    scale = result_scale(page, scale_images[page_idx]) \
+                        if page_idx < len(scale_images) else 1.0
+                    total += apply_page_redactions(
+                        page, by_page.get(page_idx + 1, []), masked_image, scale
+                    )
+            doc.save(output_path, garbage=3, deflate=True)
+        print(f"✅ 개인정보 가림 PDF 생성: {output_path} ({total}개 영역)")
+        return True
+
+    except Exception as e:
+        print(f"❌ 개인정보 가림 PDF 생성 실패: {e}")
+        return False
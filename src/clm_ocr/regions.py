@@ -0,0 +1,105 @@
+"""
+페이지 영역 자르기 및 좌표 변환
+원본 PDF 페이지의 일부를 고해상도 이미지로 렌더링하고, 그 이미지의 OCR 좌표를 원래 페이지 좌표로 변환
+"""
+import copy
+from typing import Dict, Any, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+Rect = Tuple[float, float, float, float]
+
+
+def result_scale(page: fitz.Page, image: Dict[str, Any]) -> float:
+    """
+    PDF 포인트 1개당 OCR 좌표 단위 수
+
+    응답의 convertedImageInfo(OCR이 사용한 이미지 크기)가 있으면 페이지 폭과 비교하고,
+    없으면 OCR 좌표를 PDF 포인트로 간주합니다 (insert_page_text와 같은 가정).
+
+    Args:
+        page: PyMuPDF 페이지
+        image: 해당 페이지의 OCR 응답 images 항목
+    """
+    width = image.get('convertedImageInfo', {}).get('width')
+    if not width or not page.rect.width:
+        return 1.0
+    return width / page.rect.width
+
+
+def field_rect(field: Dict[str, Any]) -> Optional[Rect]:
+    """필드 boundingPoly의 외접 사각형 (x0, y0, x1, y1), 좌표가 없으면 None"""
+    vertices = field.get('boundingPoly', {}).get('vertices', [])
+    if not vertices:
+        return None
+    xs = [v.get('x', 0) for v in vertices]
+    ys = [v.get('y', 0) for v in vertices]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def render_region(
+    page: fitz.Page,
+    rect: Rect,
+    scale: float = 1.0,
+    dpi: int = 300,
+    padding: float = 0.0
+) -> Tuple[fitz.Pixmap, fitz.Rect]:
+    """
+    OCR 좌표 영역을 잘라 고해상도 이미지로 렌더링
+
+    Args:
+        page: PyMuPDF 페이지
+        rect: 자를 영역 (OCR 좌표)
+        scale: result_scale 값 (PDF 포인트당 OCR 좌표 단위)
+        dpi: 렌더링 해상도
+        padding: 영역 주변 여백 (OCR 좌표)
+
+    Returns:
+        (이미지, 실제로 자른 영역(PDF 포인트, 페이지 경계로 잘림)) 튜플
+    """
+    x0, y0, x1, y1 = rect
+    clip = fitz.Rect(
+        (x0 - padding) / scale, (y0 - padding) / scale,
+        (x1 + padding) / scale, (y1 + padding) / scale,
+    ) & page.rect
+    return page.get_pixmap(clip=clip, dpi=dpi), clip
+
+
+def map_fields(
+    fields: List[Dict[str, Any]],
+    crop_image: Dict[str, Any],
+    pixmap_size: Tuple[int, int],
+    clip: fitz.Rect,
+    scale: float = 1.0
+) -> List[Dict[str, Any]]:
+    """
+    잘라낸 이미지의 OCR 필드 좌표를 원래 페이지의 OCR 좌표로 변환
+
+    잘라낸 이미지 응답 좌표 -> 이미지 픽셀 -> PDF 포인트 -> 원래 페이지 OCR 좌표 순으로 변환합니다.
+
+    Args:
+        fields: 잘라낸 이미지의 OCR 필드 리스트
+        crop_image: 잘라낸 이미지의 OCR 응답 images 항목 (convertedImageInfo 사용)
+        pixmap_size: 잘라낸 이미지 크기 (폭, 높이) 픽셀
+        clip: render_region이 반환한 영역 (PDF 포인트)
+        scale: 원래 페이지의 result_scale 값
+
+    Returns:
+        좌표를 변환한 필드 복사본 리스트
+    """
+    info = crop_image.get('convertedImageInfo', {})
+    to_pixel_x = pixmap_size[0] / info['width'] if info.get('width') else 1.0
+    to_pixel_y = pixmap_size[1] / info['height'] if info.get('height') else 1.0
+    # 픽셀 수는 정수로 올림되므로 dpi 대신 실제 영역/이미지 크기 비율 사용
+    points_per_pixel_x = clip.width / pixmap_size[0]
+    points_per_pixel_y = clip.height / pixmap_size[1]
+
+    mapped = []
+    for field in fields:
+        field = copy.deepcopy(field)
+        for vertex in field.get('boundingPoly', {}).get('vertices', []):
+            x = clip.x0 + vertex.get('x', 0) * to_pixel_x * points_per_pixel_x
+            y = clip.y0 + vertex.get('y', 0) * to_pixel_y * points_per_pixel_y
+            vertex['x'], vertex['y'] = round(x * scale, 2), round(y * scale, 2)
+        mapped.append(field)
+    return mapped
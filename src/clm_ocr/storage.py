@@ -0,0 +1,458 @@
+"""
+OCR 산출물 저장소 백엔드
+문서 ID별 산출물(파일명 -> 바이트)을 디렉토리, 해시 샤딩 디렉토리, SQLite 파일 중 하나에 저장
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, IO, Iterator, List, Optional, Tuple
+
+# 완료된 산출물 목록을 기록하는 마커 파일
+MANIFEST_FILENAME = '_complete.json'
+
+# 문서 ID를 사용하는 원본 경로를 기록하는 파일 (디렉토리 저장소)
+SOURCE_FILENAME = '_source.txt'
+
+# SQLite BLOB에 스트리밍할 때 한 번에 복사하는 크기
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+
+class OutputStorage(ABC):
+    """
+    산출물 저장소 인터페이스
+
+    모든 쓰기는 atomic_path로 받은 임시 파일에 한 뒤, 블록이 성공하면 한 번에 반영됩니다.
+    문서 ID 조회는 백엔드와 무관하게 O(1)입니다 (경로 계산 또는 기본 키 조회).
+    추상 메서드를 모두 구현하지 않은 백엔드는 생성 시점에 TypeError로 실패합니다.
+    """
+
+    def document_id(self, source_pdf: str) -> str:
+        """원본 파일 경로로 기본 문서 ID 결정"""
+        return Path(source_pdf).stem
+
+    def prepare(self, doc_id: str) -> None:
+        """문서 저장 준비 (디렉토리 생성 등)"""
+
+    @abstractmethod
+    def location(self, doc_id: str, filename: Optional[str] = None) -> str:
+        """출력 메시지용 저장 위치"""
+        raise NotImplementedError
+
+    def claim(self, doc_id: str, source_pdf: str, overwrite: bool = False) -> None:
+        """
+        문서 ID를 원본 파일에 연결 (prepare 후, 저장 전 호출)
+
+        Args:
+            doc_id: 문서 ID
+            source_pdf: 원본 파일 경로
+            overwrite: 다른 원본에 연결된 문서 ID도 이 원본으로 다시 연결 (원본을 옮긴 경우 등)
+
+        Raises:
+            FileExistsError: 같은 문서 ID에 다른 원본의 결과가 있을 때 (overwrite=False)
+        """
+        if overwrite:
+            return
+        manifest = self.read_manifest(doc_id)
+        _check_owner(doc_id, manifest.get('source_pdf') if manifest else None, source_pdf)
+
+    @abstractmethod
+    def atomic_path(self, doc_id: str, filename: str):
+        """
+        임시 파일 경로를 제공하고, 블록이 성공하면 산출물로 반영하는 컨텍스트 매니저
+
+        블록에서 예외가 발생하면 임시 파일만 삭제하고 기존 산출물은 그대로 둡니다.
+
+        Args:
+            doc_id: 문서 ID
+            filename: 산출물 파일명
+
+        Yields:
+            임시 파일 경로
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, doc_id: str, filename: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def size(self, doc_id: str, filename: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stat(self, doc_id: str, filename: str) -> Optional[Tuple[int, int]]:
+        """
+        산출물 크기와 수정 시각 (변경 감지용)
+
+        Returns:
+            (크기 bytes, 수정 시각 ns) 튜플 (없으면 None)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(self, doc_id: str, filename: str) -> IO[bytes]:
+        """산출물을 바이너리 읽기 모드로 열기 (없으면 FileNotFoundError)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, doc_id: str, filename: str) -> None:
+        """산출물 삭제 (없으면 무시)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_artifacts(self, doc_id: str) -> List[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_documents(self) -> Iterator[str]:
+        """저장된 문서 ID 순회"""
+        raise NotImplementedError
+
+    def read_bytes(self, doc_id: str, filename: str) -> bytes:
+        with self.open(doc_id, filename) as f:
+            return f.read()
+
+    def read_manifest(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        완료 마커 읽기
+
+        Returns:
+            마커 내용 (마커가 없으면 None)
+        """
+        try:
+            return json.loads(self.read_bytes(doc_id, MANIFEST_FILENAME))
+        except FileNotFoundError:
+            return None
+
+
+class DirectoryStorage(OutputStorage):
+    """
+    output_base/<문서 ID>/<파일명> 레이아웃 (기본값, 기존 출력 구조와 동일)
+
+    Args:
+        output_base: 출력 루트 디렉토리
+    """
+
+    def __init__(self, output_base: str = "./output"):
+        self.output_base = Path(output_base)
+
+    def project_dir(self, doc_id: str) -> Path:
+        return self.output_base / doc_id
+
+    def prepare(self, doc_id: str) -> None:
+        self.project_dir(doc_id).mkdir(parents=True, exist_ok=True)
+
+    def location(self, doc_id: str, filename: Optional[str] = None) -> str:
+        path = self.project_dir(doc_id)
+        return str(path / filename if filename else path)
+
+    def claim(self, doc_id: str, source_pdf: str, overwrite: bool = False) -> None:
+        """
+        문서 ID(기본값: 파일명)를 원본 파일에 연결
+
+        원본 경로 파일을 os.link로 원자적으로 만들어, 파일명이 같은 두 PDF를 동시에 처리해도
+        한쪽만 성공하고 다른 쪽은 덮어쓰지 않고 실패합니다. overwrite=True이면 원본 경로를 교체합니다.
+        """
+        super().claim(doc_id, source_pdf, overwrite)
+
+        path = self.project_dir(doc_id) / SOURCE_FILENAME
+        tmp_path = path.with_name(f".{uuid.uuid4().hex}.{path.name}.tmp")
+        tmp_path.write_text(str(Path(source_pdf).resolve()), encoding='utf-8')
+        try:
+            if overwrite:
+                os.replace(tmp_path, path)
+            else:
+                os.link(tmp_path, path)
+        except FileExistsError:
+            _check_owner(doc_id, path.read_text(encoding='utf-8'), source_pdf)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def atomic_path(self, doc_id: str, filename: str) -> Iterator[Path]:
+        final_path = self.project_dir(doc_id) / filename
+        tmp_path = final_path.with_name(f".{uuid.uuid4().hex}.{final_path.name}.tmp")
+        try:
+            yield tmp_path
+            os.replace(tmp_path, final_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def exists(self, doc_id: str, filename: str) -> bool:
+        return (self.project_dir(doc_id) / filename).exists()
+
+    def size(self, doc_id: str, filename: str) -> int:
+        return (self.project_dir(doc_id) / filename).stat().st_size
+
+    def stat(self, doc_id: str, filename: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = (self.project_dir(doc_id) / filename).stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def open(self, doc_id: str, filename: str) -> IO[bytes]:
+        return open(self.project_dir(doc_id) / filename, 'rb')
+
+    def delete(self, doc_id: str, filename: str) -> None:
+        (self.project_dir(doc_id) / filename).unlink(missing_ok=True)
+
+    def list_artifacts(self, doc_id: str) -> List[str]:
+        project_dir = self.project_dir(doc_id)
+        if not project_dir.is_dir():
+            return []
+        return sorted(
+            entry.name for entry in os.scandir(project_dir)
+            if entry.is_file() and not entry.name.endswith('.tmp')
+            and entry.name != SOURCE_FILENAME
+        )
+
+    def iter_documents(self) -> Iterator[str]:
+        if not self.output_base.is_dir():
+            return
+        with os.scandir(self.output_base) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry.name
+
+
+class ShardedDirectoryStorage(DirectoryStorage):
+    """
+    output_base/<해시 2자리>/<해시 2자리>/<문서 ID>/<파일명> 레이아웃
+
+    문서 ID의 SHA-1 앞부분으로 디렉토리를 나눠 한 디렉토리의 항목 수를 제한합니다
+    (levels=2이면 65,536개 샤드). 기본 문서 ID는 '파일명-경로해시'로,
+    파일명이 같은 서로 다른 PDF가 같은 위치에 저장되지 않습니다.
+
+    Args:
+        output_base: 출력 루트 디렉토리
+        levels: 샤드 디렉토리 깊이
+    """
+
+    SHARD_WIDTH = 2
+
+    def __init__(self, output_base: str = "./output", levels: int = 2):
+        super().__init__(output_base)
+        self.levels = levels
+
+    def document_id(self, source_pdf: str) -> str:
+        return unique_document_id(source_pdf)
+
+    def project_dir(self, doc_id: str) -> Path:
+        digest = hashlib.sha1(doc_id.encode('utf-8')).hexdigest()
+        width = self.SHARD_WIDTH
+        shards = [digest[i * width:(i + 1) * width] for i in range(self.levels)]
+        return self.output_base.joinpath(*shards, doc_id)
+
+    def iter_documents(self) -> Iterator[str]:
+        pattern = '/'.join(['?' * self.SHARD_WIDTH] * self.levels + ['*'])
+        for path in self.output_base.glob(pattern):
+            if path.is_dir():
+                yield path.name
+
+
+class SQLiteStorage(OutputStorage):
+    """
+    모든 문서의 산출물을 SQLite 파일 하나에 BLOB으로 저장
+
+    (doc_id, name) 기본 키로 조회하며, 각 산출물은 트랜잭션 하나로 교체됩니다.
+    산출물은 zeroblob으로 자리를 잡은 뒤 BLOB I/O로 나눠 쓰고 읽으므로 전체를 메모리에 올리지 않습니다.
+    WAL 모드를 사용하므로 여러 프로세스가 동시에 읽고 쓸 수 있습니다.
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        timeout: 잠금 대기 시간(초)
+    """
+
+    # BLOB I/O(blobopen)는 rowid 테이블에서만 가능
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS artifacts ('
+        ' doc_id TEXT NOT NULL, name TEXT NOT NULL, data BLOB NOT NULL,'
+        ' size INTEGER NOT NULL, updated_at INTEGER NOT NULL,'
+        ' PRIMARY KEY (doc_id, name))'
+    )
+
+    def __init__(self, db_path: str = "./output/ocr_outputs.sqlite", timeout: float = 30.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            str(self.db_path), timeout=self.timeout, check_same_thread=False,
+            isolation_level=None
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def document_id(self, source_pdf: str) -> str:
+        return unique_document_id(source_pdf)
+
+    def location(self, doc_id: str, filename: Optional[str] = None) -> str:
+        return f"{self.db_path}::{doc_id}" + (f"/{filename}" if filename else "")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """쓰기 잠금을 잡은 트랜잭션 (예외 시 롤백)"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    @contextmanager
+    def atomic_path(self, doc_id: str, filename: str) -> Iterator[Path]:
+        tmp_dir = Path(tempfile.mkdtemp(prefix='clm_ocr_'))
+        tmp_path = tmp_dir / filename
+        try:
+            yield tmp_path
+            size = tmp_path.stat().st_size
+            with self._transaction(), open(tmp_path, 'rb') as f:
+                rowid = self._conn.execute(
+                    'INSERT OR REPLACE INTO artifacts (doc_id, name, data, size, updated_at)'
+                    ' VALUES (?, ?, zeroblob(?), ?, ?)',
+                    (doc_id, filename, size, size, int(round(time.time() * 1000)))
+                ).lastrowid
+                with self._conn.blobopen('artifacts', 'data', rowid) as blob:
+                    for chunk in iter(lambda: f.read(BLOB_CHUNK_SIZE), b''):
+                        blob.write(chunk)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def exists(self, doc_id: str, filename: str) -> bool:
+        return bool(self._query(
+            'SELECT 1 FROM artifacts WHERE doc_id = ? AND name = ?', (doc_id, filename)
+        ))
+
+    def size(self, doc_id: str, filename: str) -> int:
+        rows = self._query(
+            'SELECT size FROM artifacts WHERE doc_id = ? AND name = ?', (doc_id, filename)
+        )
+        if not rows:
+            raise FileNotFoundError(self.location(doc_id, filename))
+        return rows[0][0]
+
+    def stat(self, doc_id: str, filename: str) -> Optional[Tuple[int, int]]:
+        rows = self._query(
+            'SELECT size, updated_at FROM artifacts WHERE doc_id = ? AND name = ?',
+            (doc_id, filename)
+        )
+        if not rows:
+            return None
+        return rows[0][0], rows[0][1] * 1_000_000
+
+    def open(self, doc_id: str, filename: str) -> IO[bytes]:
+        """
+        산출물을 BLOB I/O로 나눠 읽는 파일 객체 반환
+
+        읽기 전용 연결을 따로 열어 읽기 트랜잭션을 유지하므로, 읽는 동안 다른 쓰기가
+        같은 산출물을 교체해도 연 시점의 내용을 끝까지 읽습니다 (WAL 스냅샷).
+        """
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN')
+            row = conn.execute(
+                'SELECT rowid FROM artifacts WHERE doc_id = ? AND name = ?', (doc_id, filename)
+            ).fetchone()
+            if row is None:
+                raise FileNotFoundError(self.location(doc_id, filename))
+            blob = conn.blobopen('artifacts', 'data', row[0], readonly=True)
+        except BaseException:
+            conn.close()
+            raise
+        return io.BufferedReader(_BlobReader(conn, blob), BLOB_CHUNK_SIZE)
+
+    def delete(self, doc_id: str, filename: str) -> None:
+        self._query('DELETE FROM artifacts WHERE doc_id = ? AND name = ?', (doc_id, filename))
+
+    def list_artifacts(self, doc_id: str) -> List[str]:
+        rows = self._query('SELECT name FROM artifacts WHERE doc_id = ? ORDER BY name', (doc_id,))
+        return [name for name, in rows]
+
+    def iter_documents(self) -> Iterator[str]:
+        for doc_id, in self._query('SELECT DISTINCT doc_id FROM artifacts ORDER BY doc_id'):
+            yield doc_id
+
+
+class _BlobReader(io.RawIOBase):
+    """SQLite BLOB 핸들을 읽기 전용 파일 객체로 감싼 것 (닫을 때 전용 연결도 닫음)"""
+
+    def __init__(self, conn: sqlite3.Connection, blob: sqlite3.Blob):
+        self._conn = conn
+        self._blob = blob
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._blob.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._blob.seek(offset, whence)
+        return self._blob.tell()
+
+    def tell(self) -> int:
+        return self._blob.tell()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._blob.close()
+            self._conn.close()
+        super().close()
+
+
+def _check_owner(doc_id: str, owner: Optional[str], source_pdf: str) -> None:
+    if owner and Path(owner).resolve() != Path(source_pdf).resolve():
+        raise FileExistsError(
+            f"'{doc_id}'에 다른 원본({owner})의 결과가 있습니다. "
+            f"project_name을 지정하거나 ShardedDirectoryStorage/SQLiteStorage를 사용하세요"
+        )
+
+
+def unique_document_id(source_pdf: str) -> str:
+    """
+    파일명이 같은 서로 다른 원본을 구분하는 문서 ID ('파일명-경로해시 8자리')
+
+    Example:
+        >>> unique_document_id('data/2024/resume.pdf')
+        'resume-3f2a9c1d'
+    """
+    path = Path(source_pdf)
+    digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:8]
+    return f"{path.stem}-{digest}"
@@ -0,0 +1,261 @@
+"""
+대용량 문서 스트리밍 처리
+PDF를 페이지 묶음 단위로 OCR하고 결과를 출력 파일에 점진적으로 추가
+"""
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Dict, Any
+
+import fitz  # PyMuPDF
+import pandas as pd
+
+from .config import (
+    API_URL, SECRET_KEY, DEFAULT_OUTPUT_FORMATS, DEFAULT_LANG, DEFAULT_ENABLE_TABLE,
+    DEFAULT_STREAM_CHUNK_PAGES,
+)
+from .client import ClovaOCRClient, OCROutputManager
+from .storage import OutputStorage
+from .processor import OCRProcessor, PAGE_SEPARATOR
+from .redaction import redact_page, apply_page_redactions
+from .regions import result_scale
+from .export import CHUNKS_FILENAME, ChunkBuilder, write_chunks
+
+
+def iter_pages(
+    pdf_path: str,
+    client: Optional[ClovaOCRClient] = None,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_PAGES,
+    lang: str = DEFAULT_LANG,
+    enable_table: bool = DEFAULT_ENABLE_TABLE
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    PDF를 chunk_size 페이지씩 나눠 OCR하고 페이지 단위로 반환
+
+    현재 묶음을 소비하는 동안 다음 묶음의 OCR 요청을 미리 보내므로,
+    메모리에는 최대 두 묶음 분량의 결과만 유지됩니다.
+
+    Args:
+        pdf_path: PDF/이미지 파일 경로 (이미지는 한 묶음으로 처리)
+        client: OCR 클라이언트 (기본값: 설정의 API URL/Key로 생성)
+        chunk_size: 요청당 페이지 수
+        lang: 언어 코드
+        enable_table: 테이블 인식 활성화
+
+    Yields:
+        (페이지 번호(1부터 시작), OCR 응답의 images 항목) 튜플
+
+    Example:
+        >>> for page_num, image in iter_pages('data/big.pdf', chunk_size=20):
+        ...     print(page_num, OCRProcessor.page_to_text(image)[:50])
+    """
+    client = client or ClovaOCRClient(API_URL, SECRET_KEY)
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {pdf_path}")
+
+    def ocr(path: Path) -> Dict[str, Any]:
+        return client.ocr_from_file(str(path), lang=lang, enable_table=enable_table,
+                                    use_cache=False)
+
+    if pdf_path.suffix.lower() != '.pdf':
+        for page_idx, image in enumerate(ocr(pdf_path).get('images', [])):
+            yield page_idx + 1, image
+        return
+
+    with fitz.open(pdf_path) as src, tempfile.TemporaryDirectory() as tmp_dir, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        page_count = src.page_count
+        starts = list(range(0, page_count, chunk_size))
+
+        def submit(start: int):
+            end = min(start + chunk_size, page_count)
+            chunk_path = Path(tmp_dir) / f"{pdf_path.stem}_p{start + 1}-{end}.pdf"
+            with fitz.open() as chunk:
+                chunk.insert_pdf(src, from_page=start, to_page=end - 1)
+                chunk.save(chunk_path)
+            return executor.submit(ocr, chunk_path), chunk_path
+
+        pending = submit(starts[0]) if starts else None
+        for idx, start in enumerate(starts):
+            future, chunk_path = pending
+            pending = submit(starts[idx + 1]) if idx + 1 < len(starts) else None
+
+            result = future.result()
+            chunk_path.unlink(missing_ok=True)
+            print(f"📄 페이지 {start + 1}-{start + len(result.get('images', []))} OCR 완료")
+
+            for offset, image in enumerate(result.get('images', [])):
+                yield start + offset + 1, image
+
+
+def process_pdf_streaming(
+    pdf_path: str,
+    output_formats: Optional[List[str]] = None,
+    output_base: str = "./output",
+    project_name: Optional[str] = None,
+    api_url: str = API_URL,
+    secret_key: str = SECRET_KEY,
+    lang: str = DEFAULT_LANG,
+    enable_table: bool = DEFAULT_ENABLE_TABLE,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_PAGES,
+    client: Optional[ClovaOCRClient] = None,
+    redact: bool = False,
+    storage: Optional[OutputStorage] = None,
+    overwrite: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    메모리 사용량이 문서 크기가 아닌 묶음 크기에 비례하는 process_pdf 스트리밍 버전
+
+    페이지가 도착하는 대로 JSON/텍스트/CSV/Markdown/청크 파일에 추가하고,
+    모든 페이지가 끝나면 파일을 원자적으로 교체한 뒤 완료 마커를 기록합니다.
+
+    Args:
+        pdf_path: 처리할 PDF 파일 경로
+        output_formats: 출력 형식 리스트 (process_pdf와 동일)
+        output_base: 출력 루트 디렉토리
+        project_name: 프로젝트 폴더명 (None이면 PDF 파일명 사용)
+        api_url: CLOVA OCR API URL
+        secret_key: CLOVA OCR Secret Key
+        lang: 언어 코드
+        enable_table: 테이블 인식 활성화
+        chunk_size: 요청당 페이지 수
+        client: OCR 클라이언트 (기본값: api_url/secret_key로 생성)
+        redact: 페이지마다 개인정보를 마스킹한 뒤 저장 (process_pdf와 동일)
+        storage: 산출물 저장소 (기본값: output_base 아래 문서별 디렉토리)
+        overwrite: 프로젝트에 다른 원본의 결과가 있어도 덮어쓰기 (process_pdf와 동일)
+
+    Returns:
+        처리 요약 {'pages': ..., 'fields': ..., 'artifacts': [...]} (실패 시 None)
+
+    Example:
+        >>> summary = process_pdf_streaming('data/1000pages.pdf', chunk_size=20)
+    """
+    if output_formats is None:
+        output_formats = DEFAULT_OUTPUT_FORMATS
+
+    print("🔧 CLOVA OCR 스트리밍 처리 시작\n")
+
+    output_mgr = OCROutputManager(pdf_path, output_base, project_name, storage)
+    client = client or ClovaOCRClient(api_url, secret_key)
+
+    try:
+        output_mgr.setup_directories(overwrite)
+        output_mgr.invalidate_manifest()
+
+        with ExitStack() as stack:
+            def open_output(filename: str, encoding: str = 'utf-8'):
+                tmp_path = stack.enter_context(output_mgr.atomic_path(filename))
+                return stack.enter_context(open(tmp_path, 'w', encoding=encoding, newline=''))
+
+            json_f = open_output('ocr_result.json') if 'json' in output_formats else None
+            text_f = open_output('extracted_text.txt') if 'text' in output_formats else None
+            csv_f = (open_output('ocr_data.csv', 'utf-8-sig')
+                     if 'dataframe' in output_formats else None)
+            md_f = open_output('document.md') if 'markdown' in output_formats else None
+            chunks_f = open_output(CHUNKS_FILENAME) if 'chunks' in output_formats else None
+            chunk_builder = ChunkBuilder(doc_id=output_mgr.project_name)
+
+            pdf_doc = None
+            if 'searchable_pdf' in output_formats:
+                pdf_tmp = stack.enter_context(output_mgr.atomic_path('searchable.pdf'))
+                pdf_doc = stack.enter_context(fitz.open(pdf_path))
+
+            redacted_doc = None
+            if 'redacted_pdf' in output_formats:
+                redacted_tmp = stack.enter_context(output_mgr.atomic_path('redacted.pdf'))
+                redacted_doc = stack.enter_context(fitz.open(pdf_path))
+
+            if json_f:
+                json_f.write('{\n"images": [\n')
+
+            artifacts = [
+                name for name, handle in [
+                    ('ocr_result.json', json_f), ('extracted_text.txt', text_f),
+                    ('ocr_data.csv', csv_f), ('document.md', md_f), ('searchable.pdf', pdf_doc),
+                    ('redacted.pdf', redacted_doc), (CHUNKS_FILENAME, chunks_f),
+                ] if handle is not None
+            ]
+            num_pages = num_fields = num_redactions = 0
+
+            for page_num, image in iter_pages(pdf_path, client, chunk_size, lang, enable_table):
+                first = num_pages == 0
+                num_pages += 1
+                num_fields += len(image.get('fields', []))
+
+                findings = []
+                if redact or redacted_doc is not None:
+                    masked, findings = redact_page(image, page_num)
+                    num_redactions += len(findings)
+                    if redact:
+                        image = masked
+
+                if json_f:
+                    if not first:
+                        json_f.write(',\n')
+                    json_f.write(json.dumps(image, ensure_ascii=False, indent=2))
+
+                if text_f:
+                    if not first:
+                        text_f.write(PAGE_SEPARATOR)
+                    text_f.write(OCRProcessor.page_to_text(image))
+
+                if csv_f:
+                    rows = OCRProcessor.page_to_rows(image, page_num)
+                    pd.DataFrame(rows, columns=OCRProcessor.DATAFRAME_COLUMNS).to_csv(
+                        csv_f, index=False, header=first
+                    )
+
+                if md_f:
+                    if not first:
+                        md_f.write('\n')
+                    md_f.write(OCRProcessor.page_to_markdown(image, page_num))
+
+                if chunks_f:
+                    write_chunks(chunks_f, chunk_builder.add_page(page_num, image))
+
+                if pdf_doc is not None and page_num <= len(pdf_doc):
+                    if redact:
+                        apply_page_redactions(pdf_doc[page_num - 1], findings, image)
+                    else:
+                        OCRProcessor.insert_page_text(pdf_doc[page_num - 1], image)
+
+                if redacted_doc is not None and page_num <= len(redacted_doc):
+                    page = redacted_doc[page_num - 1]
+                    apply_page_redactions(page, findings, scale=result_scale(page, image))
+
+                # 테이블은 페이지 단위로 바로 저장
+                if enable_table and 'tables' in output_formats:
+                    for table_info in OCRProcessor.page_to_tables(image, page_num):
+                        filename = f"page{table_info['page']}_table{table_info['table_idx']}.csv"
+                        with output_mgr.atomic_path(filename) as table_tmp:
+                            table_info['dataframe'].to_csv(
+                                table_tmp, index=False, encoding='utf-8-sig'
+                            )
+                        artifacts.append(filename)
+
+            if json_f:
+                json_f.write('\n]\n}\n')
+            if chunks_f:
+                write_chunks(chunks_f, chunk_builder.flush())
+            if pdf_doc is not None:
+                pdf_doc.save(pdf_tmp)
+            if redacted_doc is not None:
+                redacted_doc.save(redacted_tmp, garbage=3, deflate=True)
+
+        # ExitStack 종료 시 모든 파일이 닫히고 최종 경로로 교체됨
+        output_mgr.write_manifest(
+            artifacts, extra={'redactions': num_redactions} if num_redactions else None
+        )
+
+        print(f"\n✨ 스트리밍 처리 완료: {num_pages} 페이지, {num_fields} 필드")
+        print(f"   저장 위치: {output_mgr.location()}")
+        return {'pages': num_pages, 'fields': num_fields, 'artifacts': artifacts}
+
+    except Exception as e:
+        print(f"❌ 처리 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
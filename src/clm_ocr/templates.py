@@ -0,0 +1,167 @@
+"""
+관심 영역(ROI) 템플릿
+고정 양식 문서에서 필요한 영역만 잘라 OCR하고, 영역 이름별 결과를 원래 페이지 좌표로 반환
+"""
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from .config import DEFAULT_LANG, MAX_IMAGES_PER_REQUEST, TEMPLATE_DPI
+from .processor import OCRProcessor
+from .regions import map_fields, render_region
+
+
+class RegionTemplate:
+    """
+    문서 양식별 관심 영역 정의
+
+    영역 좌표는 페이지 크기 대비 비율(0~1)이므로 페이지 크기가 달라도 같은 템플릿을 사용합니다.
+    페이지 번호는 1부터 시작하며, 음수는 뒤에서부터 셉니다 (-1: 마지막 페이지).
+
+    Example:
+        >>> template = RegionTemplate('이력서', {
+        ...     'header': {'page': 1, 'rect': (0.0, 0.0, 1.0, 0.15)},
+        ...     'signature': {'page': -1, 'rect': (0.55, 0.85, 1.0, 1.0)},
+        ... })
+        >>> template = RegionTemplate.load('templates/resume.json')
+    """
+
+    def __init__(self, name: str, regions: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            name: 템플릿 이름
+            regions: {영역 이름: {'page': 페이지 번호, 'rect': (x0, y0, x1, y1) 비율}}
+
+        Raises:
+            ValueError: 페이지 번호가 0이거나 좌표가 0~1 범위의 올바른 사각형이 아닐 때
+        """
+        self.name = name
+        self.regions: Dict[str, Dict[str, Any]] = {}
+        for region_name, spec in regions.items():
+            page, rect = int(spec.get('page', 1)), tuple(float(v) for v in spec['rect'])
+            if page == 0:
+                raise ValueError(f"{region_name}: 페이지 번호는 1부터 시작합니다")
+            if len(rect) != 4 or not (0 <= rect[0] < rect[2] <= 1 and 0 <= rect[1] < rect[3] <= 1):
+                raise ValueError(f"{region_name}: 좌표는 0~1 범위의 (x0, y0, x1, y1)이어야 합니다")
+            self.regions[region_name] = {'page': page, 'rect': rect}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RegionTemplate':
+        return cls(data.get('name', ''), data['regions'])
+
+    @classmethod
+    def load(cls, path: str) -> 'RegionTemplate':
+        """JSON 파일에서 템플릿 불러오기 ({'name': ..., 'regions': {...}})"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'regions': {
+                name: {'page': spec['page'], 'rect': list(spec['rect'])}
+                for name, spec in self.regions.items()
+            },
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def extract_regions(
+    pdf_path: str,
+    template: RegionTemplate,
+    client,
+    dpi: int = TEMPLATE_DPI,
+    lang: str = DEFAULT_LANG,
+    max_images: int = MAX_IMAGES_PER_REQUEST
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+    """
+    템플릿 영역만 잘라 OCR
+
+    영역마다 원본 페이지의 해당 부분만 dpi 해상도 PNG로 렌더링해 ocr_batch로 묶어 보내므로,
+    업로드 크기와 API 처리 시간이 전체 페이지 대비 영역 면적만큼 줄어듭니다.
+    필드 좌표는 원래 페이지의 PDF 포인트 좌표로 변환됩니다.
+
+    Args:
+        pdf_path: 원본 PDF 파일 경로
+        template: 관심 영역 템플릿
+        client: ClovaOCRClient (ocr_batch 사용)
+        dpi: 영역 렌더링 해상도
+        lang: 언어 코드
+        max_images: 요청당 최대 이미지 수
+
+    Returns:
+        (영역 결과, 보고서) 튜플
+        영역 결과: {영역 이름: {'page', 'bbox': [x0, y0, x1, y1] 포인트, 'text', 'fields',
+                              'confidence': 평균 신뢰도 (필드가 없으면 None)}}
+        보고서: {'regions', 'missing': [문서에 없는 페이지의 영역 이름],
+                 'upload_bytes', 'area_ratio': 대상 페이지 면적 대비 영역 면적 비율}
+
+    Example:
+        >>> regions, report = extract_regions('data/resume.pdf', template, client)
+        >>> regions['header']['text']
+        '홍길동 010-1234-5678 ...'
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    report = {'regions': 0, 'missing': [], 'upload_bytes': 0, 'area_ratio': 0.0}
+
+    with fitz.open(pdf_path) as doc, tempfile.TemporaryDirectory(prefix='clm_ocr_') as tmp_dir:
+        crops = []
+        region_area, page_area = 0.0, {}
+        for region_idx, (name, spec) in enumerate(template.regions.items()):
+            page_idx = spec['page'] - 1 if spec['page'] > 0 else len(doc) + spec['page']
+            if not 0 <= page_idx < len(doc):
+                report['missing'].append(name)
+                continue
+            page = doc[page_idx]
+            x0, y0, x1, y1 = spec['rect']
+            width, height = page.rect.width, page.rect.height
+            rect = (x0 * width, y0 * height, x1 * width, y1 * height)
+            pixmap, clip = render_region(page, rect, dpi=dpi)
+
+            crop_path = Path(tmp_dir) / f"region{region_idx:04d}.png"
+            pixmap.save(str(crop_path))
+            report['upload_bytes'] += crop_path.stat().st_size
+            region_area += clip.width * clip.height
+            page_area[page_idx] = width * height
+            crops.append((name, page_idx, crop_path, (pixmap.width, pixmap.height), clip))
+
+        if crops:
+            print(f"✂️ 관심 영역 {len(crops)}개 OCR ({template.name})")
+            responses = client.ocr_batch(
+                [str(crop[2]) for crop in crops], lang=lang, max_images=max_images,
+                use_cache=False
+            )
+        else:
+            responses = []
+
+    for (name, page_idx, _, size, clip), response in zip(crops, responses):
+        crop_images = response.get('images', [])
+        fields = map_fields(
+            crop_images[0].get('fields', []), crop_images[0], size, clip
+        ) if crop_images else []
+        results[name] = {
+            'page': page_idx + 1,
+            'bbox': [clip.x0, clip.y0, clip.x1, clip.y1],
+            'text': OCRProcessor.page_to_text({'fields': fields}).strip(),
+            'fields': fields,
+            'confidence': _mean_confidence(fields),
+        }
+
+    report['regions'] = len(results)
+    if page_area:
+        report['area_ratio'] = region_area / sum(page_area.values())
+    if report['missing']:
+        print(f"⚠️ 문서에 없는 페이지의 영역: {', '.join(report['missing'])}")
+    return results, report
+
+
+def _mean_confidence(fields: List[Dict[str, Any]]) -> Optional[float]:
+    if not fields:
+        return None
+    return sum(field.get('inferConfidence', 0) for field in fields) / len(fields)
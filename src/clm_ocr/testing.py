@@ -0,0 +1,474 @@
+"""
+오프라인 CLOVA OCR 대체 서버
+네트워크 없이 클라이언트의 통합 테스트 및 부하 테스트를 수행하기 위한 로컬 HTTP 서버
+"""
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple, Callable, Union
+
+import fitz  # PyMuPDF
+
+# 합성 텍스트 생성에 사용할 어휘
+_VOCABULARY = [
+    '지원', '동기', '경험', '프로젝트', '성장', '역량', '협업', '문제', '해결', '목표',
+    '회사', '직무', '개발', '분석', '데이터', '고객', '가치', '책임', '도전', '결과',
+    'Python', 'SQL', 'API', '2024', '3년', '팀장', '입사', '계획', '기여', '노력',
+]
+
+# 기본 페이지 크기 (A4, 150 DPI 기준 픽셀)
+_DEFAULT_PAGE_SIZE = (1240, 1754)
+
+LatencySpec = Union[None, float, Tuple[float, float], Callable[[random.Random], float]]
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """
+    로그정규분포 지연 시간 생성기 반환 (긴 꼬리 지연 재현용)
+
+    Args:
+        median: 지연 시간 중앙값 (초)
+        sigma: 로그 스케일 표준편차
+
+    Returns:
+        random.Random을 받아 지연 시간(초)을 반환하는 함수
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class FakeClovaOCRServer:
+    """CLOVA General OCR 요청/응답 규약을 구현한 로컬 테스트 서버"""
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        secret_key: Optional[str] = None,
+        fields_per_page: int = 20,
+        tables_per_page: int = 1,
+        latency: LatencySpec = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        slow_body_delay: float = 0.0,
+        slow_body_chunk: int = 1024,
+        seed: int = 0
+    ):
+        """
+        Args:
+            host: 바인딩 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            secret_key: 요구할 X-OCR-SECRET 값 (None이면 검사하지 않음)
+            fields_per_page: 페이지당 합성 필드 수
+            tables_per_page: 테이블 인식 요청 시 페이지당 합성 테이블 수
+            latency: 응답 지연 (None, 고정 초, (최소, 최대) 균등분포, 또는 rng를 받는 함수)
+            error_rate: 500 오류 응답 비율 (0~1)
+            rate_limit_rate: 429 응답 비율 (0~1)
+            retry_after: 429 응답의 Retry-After 헤더 값 (초)
+            slow_body_delay: 응답 본문 청크 사이 지연 (초)
+            slow_body_chunk: 느린 본문 전송 시 청크 크기 (bytes)
+            seed: 합성 결과 및 지연/오류 난수 시드
+        """
+        self.secret_key = secret_key
+        self.fields_per_page = fields_per_page
+        self.tables_per_page = tables_per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.slow_body_delay = slow_body_delay
+        self.slow_body_chunk = slow_body_chunk
+        self.seed = seed
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {
+            'requests': 0,
+            'images': 0,
+            'status': {},
+            'max_in_flight': 0,
+        }
+        # 받은 요청의 헤더 (도착 순서, 업로드 방식 검증용)
+        self.request_headers: List[Dict[str, str]] = []
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ============================================
+    # 서버 수명 주기
+    # ============================================
+
+    @property
+    def url(self) -> str:
+        """클라이언트에 전달할 API URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/custom/v1/fake/general"
+
+    def start(self) -> 'FakeClovaOCRServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeClovaOCRServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ============================================
+    # 응답 생성
+    # ============================================
+
+    def build_response(
+        self,
+        message: Dict[str, Any],
+        files: List[bytes]
+    ) -> Dict[str, Any]:
+        """
+        요청 message와 업로드된 파일로 합성 OCR 응답 생성
+
+        같은 파일 내용과 시드에 대해서는 항상 같은 fields/tables를 생성합니다.
+
+        Args:
+            message: 요청의 message JSON
+            files: 업로드된 파일 바이트 리스트 (message['images']와 같은 순서)
+
+        Returns:
+            CLOVA OCR V2 형식 응답
+        """
+        enable_table = bool(message.get('enableTableDetection', False))
+        images = []
+
+        for image_info, data in zip(message.get('images', []), files):
+            digest = hashlib.sha1(data).hexdigest()
+            for page_idx, (width, height) in enumerate(self._page_sizes(image_info, data)):
+                rng = random.Random(f"{self.seed}:{digest}:{page_idx}")
+                image = {
+                    'uid': hashlib.md5(f"{digest}:{page_idx}".encode()).hexdigest(),
+                    'name': image_info.get('name', ''),
+                    'inferResult': 'SUCCESS',
+                    'message': 'SUCCESS',
+                    'validationResult': {'result': 'NO_REQUESTED'},
+                    'convertedImageInfo': {
+                        'width': width,
+                        'height': height,
+                        'pageIndex': page_idx,
+                        'longImage': False,
+                    },
+                    'fields': self._synthetic_fields(rng, width, height),
+                }
+                if enable_table:
+                    image['tables'] = self._synthetic_tables(rng, width, height)
+                images.append(image)
+
+        return {
+            'version': message.get('version', 'V2'),
+            'requestId': message.get('requestId', str(uuid.uuid4())),
+            'timestamp': int(round(time.time() * 1000)),
+            'images': images,
+        }
+
+    @staticmethod
+    def _page_sizes(image_info: Dict[str, Any], data: bytes) -> List[Tuple[int, int]]:
+        """업로드 파일의 페이지별 크기 (PDF가 아니거나 파싱 실패 시 1페이지)"""
+        if image_info.get('format') == 'pdf':
+            try:
+                with fitz.open(stream=data, filetype='pdf') as doc:
+                    return [(int(page.rect.width), int(page.rect.height)) for page in doc]
+            except Exception:
+                pass
+        return [_DEFAULT_PAGE_SIZE]
+
+    def _synthetic_fields(
+        self,
+        rng: random.Random,
+        width: int,
+        height: int
+    ) -> List[Dict[str, Any]]:
+        """줄 단위로 배치된 합성 필드 생성"""
+        fields = []
+        margin = width * 0.08
+        line_height = 24
+        x, y = margin, margin
+
+        for idx in range(self.fields_per_page):
+            text = rng.choice(_VOCABULARY)
+            box_width = 14 * len(text) + 10
+            line_break = (idx + 1) % 8 == 0 or idx == self.fields_per_page - 1
+
+            fields.append({
+                'valueType': 'ALL',
+                'boundingPoly': {'vertices': _box(x, y, x + box_width, y + 20)},
+                'inferText': text,
+                'inferConfidence': round(1.0 - rng.betavariate(1.2, 12), 4),
+                'type': 'NORMAL',
+                'lineBreak': line_break,
+            })
+
+            x += box_width + 8
+            if line_break or x > width - margin:
+                x = margin
+                y = min(y + line_height, height - line_height)
+
+        return fields
+
+    def _synthetic_tables(
+        self,
+        rng: random.Random,
+        width: int,
+        height: int
+    ) -> List[Dict[str, Any]]:
+        """합성 테이블 생성 (첫 행은 헤더)"""
+        tables = []
+        for table_idx in range(self.tables_per_page):
+            rows, cols = rng.randint(2, 4), rng.randint(2, 4)
+            top = height * 0.5 + table_idx * 150
+            cells = []
+            for row in range(rows):
+                for col in range(cols):
+                    text = f"열{col + 1}" if row == 0 else rng.choice(_VOCABULARY)
+                    x0, y0 = 100 + col * 200, top + row * 30
+                    poly = {'vertices': _box(x0, y0, x0 + 200, y0 + 30)}
+                    cells.append({
+                        'rowIndex': row,
+                        'columnIndex': col,
+                        'rowSpan': 1,
+                        'columnSpan': 1,
+                        'boundingPoly': poly,
+                        'inferConfidence': round(1.0 - rng.betavariate(1.2, 12), 4),
+                        'cellTextLines': [{
+                            'boundingPoly': poly,
+                            'text': text,
+                            'cellWords': [{'inferText': text, 'boundingPoly': poly}],
+                        }],
+                    })
+            tables.append({'cells': cells, 'inferConfidence': 0.95})
+        return tables
+
+    # ============================================
+    # HTTP 처리
+    # ============================================
+
+    def _sample_latency(self) -> float:
+        """설정된 분포에서 지연 시간 추출"""
+        spec = self.latency
+        with self._lock:
+            if spec is None:
+                return 0.0
+            if callable(spec):
+                return max(0.0, float(spec(self._rng)))
+            if isinstance(spec, tuple):
+                return self._rng.uniform(*spec)
+            return float(spec)
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._rng.random() < rate
+
+    def _record(self, status: int, images: int = 0) -> None:
+        with self._lock:
+            self.stats['status'][status] = self.stats['status'].get(status, 0) + 1
+            self.stats['images'] += images
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                with server._lock:
+                    server.stats['requests'] += 1
+                    server.request_headers.append(dict(self.headers.items()))
+                    server._in_flight += 1
+                    server.stats['max_in_flight'] = max(
+                        server.stats['max_in_flight'], server._in_flight
+                    )
+                try:
+                    self._handle()
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+            def _handle(self):
+                body = self._read_body()
+
+                if server.secret_key and self.headers.get('X-OCR-SECRET') != server.secret_key:
+                    return self._send_json(
+                        401, {'code': '0002', 'message': 'Authentication failed'}
+                    )
+
+                try:
+                    parts = _parse_multipart(body, self.headers.get('Content-Type', ''))
+                    message = json.loads(parts['message'][0])
+                except (KeyError, ValueError):
+                    return self._send_json(400, {'code': '0011', 'message': 'Request invalid'})
+
+                time.sleep(server._sample_latency())
+
+                if server._roll(server.rate_limit_rate):
+                    return self._send_json(
+                        429,
+                        {'code': '0429', 'message': 'Too many requests'},
+                        {'Retry-After': str(server.retry_after)}
+                    )
+                if server._roll(server.error_rate):
+                    return self._send_json(
+                        500, {'code': '0500', 'message': 'Unknown service error'}
+                    )
+
+                response = server.build_response(message, parts.get('file', []))
+                self._send_json(200, response, images=len(response['images']))
+
+            def _read_body(self) -> bytes:
+                if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b';')[0], 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            break
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                    return b''.join(chunks)
+                return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+            def _send_json(self, status, payload, extra_headers=None, images=0):
+                server._record(status, images)
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in (extra_headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+
+                if server.slow_body_delay <= 0:
+                    self.wfile.write(data)
+                    return
+                for start in range(0, len(data), server.slow_body_chunk):
+                    self.wfile.write(data[start:start + server.slow_body_chunk])
+                    self.wfile.flush()
+                    time.sleep(server.slow_body_delay)
+
+        return Handler
+
+
+def _box(x0: float, y0: float, x1: float, y1: float) -> List[Dict[str, float]]:
+    """사각형 좌표를 CLOVA vertices 형식으로 변환"""
+    return [
+        {'x': float(x0), 'y': float(y0)},
+        {'x': float(x1), 'y': float(y0)},
+        {'x': float(x1), 'y': float(y1)},
+        {'x': float(x0), 'y': float(y1)},
+    ]
+
+
+def _parse_multipart(body: bytes, content_type: str) -> Dict[str, List[bytes]]:
+    """
+    multipart/form-data 본문을 필드명별 바이트 리스트로 파싱
+
+    Raises:
+        ValueError: boundary가 없거나 형식이 잘못되었을 때
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise ValueError("multipart boundary가 없습니다")
+
+    delimiter = b'--' + match.group(1).encode('latin-1')
+    parts: Dict[str, List[bytes]] = {}
+
+    for chunk in body.split(delimiter)[1:]:
+        if chunk.startswith(b'--'):
+            break
+        head, sep, data = chunk.partition(b'\r\n\r\n')
+        if not sep:
+            raise ValueError("multipart 파트 형식이 잘못되었습니다")
+        name = re.search(rb'name="([^"]*)"', head)
+        if not name:
+            raise ValueError("multipart 파트에 name이 없습니다")
+        parts.setdefault(name.group(1).decode('utf-8'), []).append(data[:-2])
+
+    return parts
+
+
+def run_load(
+    file_path: str,
+    api_url: str,
+    secret_key: str = 'fake-secret',
+    num_requests: int = 100,
+    concurrency: int = 8,
+    **ocr_kwargs
+) -> Dict[str, Any]:
+    """
+    같은 파일을 반복 요청하여 클라이언트 처리량 측정
+
+    요청마다 새 ClovaOCRClient를 만들어 캐시를 우회합니다.
+
+    Args:
+        file_path: 업로드할 파일 경로
+        api_url: 대상 API URL (예: FakeClovaOCRServer.url)
+        secret_key: X-OCR-SECRET 값
+        num_requests: 총 요청 수
+        concurrency: 동시 요청 수
+        **ocr_kwargs: ocr_from_file에 전달할 추가 인자
+
+    Returns:
+        처리량 및 지연 시간 통계 딕셔너리
+    """
+    from .client import ClovaOCRClient
+
+    def one_request(_):
+        client = ClovaOCRClient(api_url, secret_key)
+        start = time.perf_counter()
+        try:
+            client.ocr_from_file(file_path, **ocr_kwargs)
+            return True, time.perf_counter() - start
+        except Exception:
+            return False, time.perf_counter() - start
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(one_request, range(num_requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for ok, latency in outcomes if ok)
+    succeeded = len(latencies)
+
+    def percentile(q: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+    return {
+        'requests': num_requests,
+        'succeeded': succeeded,
+        'failed': num_requests - succeeded,
+        'elapsed': elapsed,
+        'throughput': succeeded / elapsed if elapsed > 0 else 0.0,
+        'p50': percentile(0.50),
+        'p95': percentile(0.95),
+        'p99': percentile(0.99),
+    }
@@ -0,0 +1,190 @@
+"""
+스트리밍 multipart 업로드
+파일 전체를 메모리에 올리지 않고 청크 단위로 multipart/form-data 본문 생성
+"""
+import mmap
+import sys
+import uuid
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# 기본 청크 크기 (64KB)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _FilePart:
+    """본문 내 파일 구간 (전송 시점에 열어서 청크 단위로 읽음)"""
+
+    def __init__(self, path: Path, use_mmap: bool):
+        self.path = path
+        self.size = path.stat().st_size
+        self.use_mmap = use_mmap
+        self._handle = None
+        self._map = None
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """offset 위치에서 최대 size 바이트 읽기"""
+        if self._handle is None:
+            self._handle = open(self.path, 'rb')
+            if self.use_mmap and self.size > 0:
+                self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map is not None:
+            return self._map[offset:offset + size]
+        self._handle.seek(offset)
+        return self._handle.read(size)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class MultipartEncoder:
+    """
+    multipart/form-data 본문을 스트리밍으로 생성하는 파일 유사 객체
+
+    전체 길이를 미리 계산하므로 requests가 Content-Length를 설정하고,
+    전송 중 메모리 사용량은 청크 크기로 제한됩니다.
+
+    Example:
+        >>> encoder = MultipartEncoder()
+        >>> encoder.add_field('message', b'{...}')
+        >>> encoder.add_file('file', 'data/test.pdf')
+        >>> headers = {'Content-Type': encoder.content_type}
+        >>> with encoder:
+        ...     requests.post(url, headers=headers, data=encoder)
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False):
+        """
+        Args:
+            chunk_size: 반복(iter) 시 청크 크기 (bytes)
+            use_mmap: 파일을 mmap으로 읽을지 여부 (기본값: 일반 read)
+        """
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+
+        self._segments: List[Union[bytes, _FilePart]] = []
+        self._finalized = False
+        self._index = 0
+        self._offset = 0
+
+    @property
+    def content_type(self) -> str:
+        """요청 Content-Type 헤더 값"""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def add_field(self, name: str, value: bytes) -> None:
+        """
+        일반 폼 필드 추가
+
+        Args:
+            name: 필드명 (예: 'message')
+            value: 필드 값
+        """
+        header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+        self._append(header.encode('utf-8') + value + b'\r\n')
+
+    def add_file(
+        self,
+        name: str,
+        file_path: Union[str, Path],
+        filename: Optional[str] = None,
+        content_type: str = 'application/octet-stream'
+    ) -> None:
+        """
+        파일 필드 추가 (내용은 전송 시점에 읽음)
+
+        Args:
+            name: 필드명 (예: 'file')
+            file_path: 업로드할 파일 경로
+            filename: 전송할 파일명 (기본값: 경로의 파일명)
+            content_type: 파트 Content-Type
+        """
+        file_path = Path(file_path)
+        filename = (filename or file_path.name).replace('"', '%22')
+        header = (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        )
+        self._append(header.encode('utf-8'))
+        self._append(_FilePart(file_path, self.use_mmap))
+        self._append(b'\r\n')
+
+    def _append(self, segment: Union[bytes, _FilePart]) -> None:
+        if self._finalized:
+            raise RuntimeError("전송이 시작된 후에는 필드를 추가할 수 없습니다")
+        self._segments.append(segment)
+
+    def _finalize(self) -> None:
+        if not self._finalized:
+            self._segments.append(f'--{self.boundary}--\r\n'.encode('utf-8'))
+            self._finalized = True
+
+    def __len__(self) -> int:
+        self._finalize()
+        return sum(
+            segment.size if isinstance(segment, _FilePart) else len(segment)
+            for segment in self._segments
+        )
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        본문의 다음 구간 읽기
+
+        Args:
+            size: 최대 바이트 수 (음수면 남은 전체)
+
+        Returns:
+            읽은 바이트 (끝에 도달하면 b'')
+        """
+        self._finalize()
+        if size is None or size < 0:
+            size = sys.maxsize
+
+        out = []
+        remaining = size
+        while remaining > 0 and self._index < len(self._segments):
+            segment = self._segments[self._index]
+            if isinstance(segment, _FilePart):
+                data = segment.read_at(self._offset, min(remaining, self.chunk_size))
+                segment_size = segment.size
+            else:
+                data = segment[self._offset:self._offset + remaining]
+                segment_size = len(segment)
+
+            out.append(data)
+            remaining -= len(data)
+            self._offset += len(data)
+
+            if self._offset >= segment_size or not data:
+                if isinstance(segment, _FilePart):
+                    segment.close()
+                self._index += 1
+                self._offset = 0
+
+        return b''.join(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """열린 파일 핸들 정리"""
+        for segment in self._segments:
+            if isinstance(segment, _FilePart):
+                segment.close()
+
+    def __enter__(self) -> 'MultipartEncoder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -24,4 +24,38 @@ def output_dir(tmp_path):
     """테스트용 출력 디렉토리"""
     output = tmp_path / "output"
     output.mkdir()
-    return output
\ No newline at end of file
+    return output
+
+
+@pytest.fixture
+def real_pdf_path(tmp_path):
+    """테스트용 실제 PDF (2페이지, PyMuPDF로 생성)"""
+    import fitz
+
+    pdf_path = tmp_path / "real.pdf"
+    doc = fitz.open()
+    for page_no in range(2):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, 72), f"Page {page_no + 1} cover letter")
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+@pytest.fixture
+def fake_server():
+    """오프라인 CLOVA OCR 대체 서버"""
+    from clm_ocr.testing import FakeClovaOCRServer
+
+    with FakeClovaOCRServer(secret_key='fake-secret', fields_per_page=12) as server:
+        yield server
+
+
+def ocr_field(text, *, x=0, y=0, width=60, height=20, confidence=0.99, line_break=False):
+    """OCR 응답 필드 생성 (boundingPoly는 (x, y)에서 시작하는 직사각형 4꼭짓점)"""
+    x1, y1 = x + width, y + height
+    return {
+        'inferText': text, 'inferConfidence': confidence, 'lineBreak': line_break,
+        'boundingPoly': {'vertices': [{'x': x, 'y': y}, {'x': x1, 'y': y},
+                                      {'x': x1, 'y': y1}, {'x': x, 'y': y1}]},
+    }
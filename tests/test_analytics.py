@@ -0,0 +1,82 @@
+"""
+코퍼스 품질 분석 테스트
+"""
+import json
+
+import numpy as np
+import pytest
+
+from clm_ocr.analytics import analyze_result, build_quality_report, summarize_report
+
+
+def _save_project(output_base, name, confidences, storage=None):
+    project_dir = storage.project_dir(name) if storage else output_base / name
+    project_dir.mkdir(parents=True)
+    fields = [
+        {'inferText': f'단어{i}', 'inferConfidence': conf,
+         'boundingPoly': {'vertices': [{'x': 10, 'y': 10}, {'x': 50, 'y': 10},
+                                       {'x': 50, 'y': 30}, {'x': 10, 'y': 30}]}}
+        for i, conf in enumerate(confidences)
+    ]
+    result = {'images': [{'convertedImageInfo': {'width': 600, 'height': 900},
+                          'fields': fields}]}
+    (project_dir / 'ocr_result.json').write_text(json.dumps(result), encoding='utf-8')
+
+
+def test_analyze_result_page_metrics(mock_env_vars):
+    """페이지별 히스토그램/저신뢰 영역 계산 테스트"""
+    result = {'images': [
+        {'convertedImageInfo': {'width': 300, 'height': 300}, 'fields': [
+            {'inferConfidence': 0.95, 'boundingPoly': {'vertices': [{'x': 10, 'y': 10}]}},
+            {'inferConfidence': 0.35, 'boundingPoly': {'vertices': [{'x': 290, 'y': 290}]}},
+        ]},
+        {'fields': []},
+    ]}
+
+    report = analyze_result(result)
+
+    assert report['fields'].tolist() == [2, 0]
+    assert report.loc[0, 'mean_conf'] == pytest.approx(0.65)
+    assert report.loc[0, 'min_conf'] == 0.35
+    assert report.loc[0, 'hist_09'] == 1 and report.loc[0, 'hist_03'] == 1
+    assert report.loc[0, 'region_2_2'] == 1 and report.loc[0, 'low_conf'] == 1
+    assert np.isnan(report.loc[1, 'mean_conf'])
+
+
+def test_build_quality_report_incremental(mock_env_vars, tmp_path):
+    """병렬 분석, 이상 문서 탐지, 증분 갱신 테스트"""
+    output_base = tmp_path / "output"
+    for idx, conf in enumerate([0.95, 0.96, 0.94, 0.95, 0.97, 0.93]):
+        _save_project(output_base, f"doc{idx}", [conf] * 5)
+    _save_project(output_base, "blurry", [0.4] * 5)
+
+    report = build_quality_report(str(output_base), workers=2)
+
+    assert report.attrs['analyzed'] == 7
+    assert summarize_report(report)['outliers'] == ['blurry']
+
+    _save_project(output_base, "new_doc", [0.95] * 3)
+    refreshed = build_quality_report(str(output_base), workers=2)
+
+    assert refreshed.attrs['analyzed'] == 1
+    assert refreshed['project'].nunique() == 8
+
+
+def test_build_quality_report_sharded_numeric_names(mock_env_vars, tmp_path):
+    """샤딩 저장소를 스캔하고, 숫자 프로젝트명도 증분 갱신 때 다시 분석하지 않는지 테스트"""
+    from clm_ocr.storage import ShardedDirectoryStorage, SQLiteStorage
+
+    storage = ShardedDirectoryStorage(str(tmp_path / "output"))
+    for name in ['2024', '0042', 'letter']:
+        _save_project(None, name, [0.95] * 4, storage=storage)
+
+    report = build_quality_report(storage=storage, report_path=str(tmp_path / "report.csv"))
+    assert sorted(report['project'].unique()) == ['0042', '2024', 'letter']
+
+    refreshed = build_quality_report(storage=storage, report_path=str(tmp_path / "report.csv"))
+    assert refreshed.attrs['analyzed'] == 0
+    assert sorted(refreshed['project'].unique()) == ['0042', '2024', 'letter']
+
+    with SQLiteStorage(str(tmp_path / "ocr.sqlite")) as sqlite_storage:
+        with pytest.raises(TypeError):
+            build_quality_report(storage=sqlite_storage)
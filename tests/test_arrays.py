@@ -0,0 +1,75 @@
+"""
+배열 기반 OCR 결과 인코딩 테스트
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from clm_ocr.arrays import ResultArrays
+from clm_ocr.processor import OCRProcessor
+
+MOCK_RESULT = {
+    'version': 'V2',
+    'images': [
+        {
+            'name': 'page1',
+            'fields': [
+                {'inferText': '자기소개서', 'inferConfidence': 0.99, 'type': 'NORMAL',
+                 'lineBreak': True, 'boundingPoly': {'vertices': [
+                     {'x': 10.0, 'y': 20.0}, {'x': 90.0, 'y': 20.0},
+                     {'x': 90.0, 'y': 40.0}, {'x': 10.0, 'y': 40.0}]}},
+                {'inferText': '성장과정', 'inferConfidence': 0.85},
+            ],
+            'tables': [{'cells': [
+                {'rowIndex': 0, 'columnIndex': 0, 'cellTextLines': [{'text': '항목'}]},
+                {'rowIndex': 1, 'columnIndex': 0, 'cellTextLines': [{'text': '값'}]},
+            ]}],
+        },
+        {'name': 'page2', 'fields': []},
+        {'name': 'page3', 'fields': [{'inferText': 'end', 'lineBreak': False}]},
+    ],
+}
+
+
+def _worker_text(name):
+    arrays, shm = ResultArrays.attach(name)
+    try:
+        return OCRProcessor.to_text(arrays.view())
+    finally:
+        del arrays
+        shm.close()
+
+
+def test_round_trip_and_conversions(mock_env_vars):
+    """직렬화 왕복 및 뷰에서의 OCRProcessor 변환 테스트"""
+    arrays = ResultArrays.from_result(MOCK_RESULT)
+    restored = ResultArrays.from_buffer(bytes(arrays.to_buffer()))
+
+    assert restored.to_result() == MOCK_RESULT
+    view = restored.view()
+    assert OCRProcessor.to_text(view) == OCRProcessor.to_text(MOCK_RESULT)
+    assert OCRProcessor.to_markdown(view, True) == OCRProcessor.to_markdown(MOCK_RESULT, True)
+    assert OCRProcessor.count_tables(view) == OCRProcessor.count_tables(MOCK_RESULT)
+    assert OCRProcessor.extract_tables(view)[0]['dataframe'].equals(
+        OCRProcessor.extract_tables(MOCK_RESULT)[0]['dataframe']
+    )
+    pd.testing.assert_frame_equal(
+        OCRProcessor.to_dataframe(view), OCRProcessor.to_dataframe(MOCK_RESULT)
+    )
+    pd.testing.assert_frame_equal(
+        restored.to_dataframe(), OCRProcessor.to_dataframe(MOCK_RESULT), check_dtype=False
+    )
+
+
+def test_shared_memory_handoff(mock_env_vars):
+    """워커 프로세스가 공유 메모리에 연결해 변환하는지 테스트"""
+    arrays = ResultArrays.from_result(MOCK_RESULT)
+    shm = arrays.to_shared_memory()
+    try:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            texts = list(executor.map(_worker_text, [shm.name] * 2))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    assert texts == [OCRProcessor.to_text(MOCK_RESULT)] * 2
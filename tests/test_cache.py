@@ -0,0 +1,101 @@
+"""
+저장된 결과 캐시 테스트
+"""
+import json
+import os
+import threading
+import time
+
+import clm_ocr.main
+from clm_ocr.cache import ProjectCache
+
+
+def _save_project(output_base, name, text='안녕'):
+    project_dir = output_base / name
+    project_dir.mkdir(parents=True, exist_ok=True)
+    result = {'images': [{'fields': [
+        {'inferText': text, 'inferConfidence': 0.9, 'lineBreak': True,
+         'boundingPoly': {'vertices': [{'x': 0, 'y': 0}] * 4}}
+    ] * 50}]}
+    (project_dir / 'ocr_result.json').write_text(json.dumps(result, ensure_ascii=False))
+    return project_dir
+
+
+def test_cache_hits_and_invalidates_on_change(mock_env_vars, tmp_path):
+    """같은 파일은 재사용하고, 파일이 바뀌면 다시 불러오는지 테스트"""
+    _save_project(tmp_path, 'doc')
+    cache = ProjectCache()
+
+    first, _ = cache.get('doc', output_base=str(tmp_path))
+    second, _ = cache.get('doc', output_base=str(tmp_path))
+    assert second is first
+
+    path = _save_project(tmp_path, 'doc', text='바뀐 내용') / 'ocr_result.json'
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    third, _ = cache.get('doc', output_base=str(tmp_path))
+
+    assert third['images'][0]['fields'][0]['inferText'] == '바뀐 내용'
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['invalidations']) == (1, 2, 1)
+    assert cache.get('missing', output_base=str(tmp_path)) == (None, None)
+    assert cache.stats()['entries'] == 1
+
+
+def test_concurrent_requests_load_once(mock_env_vars, tmp_path, monkeypatch):
+    """동시에 같은 프로젝트를 요청하면 한 번만 불러오는지 테스트"""
+    _save_project(tmp_path, 'doc')
+    original = clm_ocr.main.load_saved_result
+    loads = []
+
+    def slow_load(*args, **kwargs):
+        loads.append(args)
+        time.sleep(0.2)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(clm_ocr.main, 'load_saved_result', slow_load)
+    cache = ProjectCache()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get('doc', str(tmp_path))))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(result[0] is results[0][0] for result in results)
+
+
+def test_lru_eviction_and_prefetch(mock_env_vars, tmp_path):
+    """메모리 상한 초과 시 오래된 항목 제거 및 미리 불러오기 테스트"""
+    for name in ['a', 'b', 'c']:
+        _save_project(tmp_path, name)
+    probe = ProjectCache()
+    probe.get('a', str(tmp_path))
+    entry_bytes = probe.stats()['nbytes']
+
+    cache = ProjectCache(max_bytes=int(entry_bytes * 2.5))
+    for future in cache.prefetch(['a', 'b'], output_base=str(tmp_path)):
+        future.result()
+    cache.get('a', str(tmp_path))   # a를 최근 사용으로
+    cache.get('c', str(tmp_path))   # b 제거
+
+    stats = cache.stats()
+    assert stats['evictions'] == 1 and stats['entries'] == 2
+    assert stats['nbytes'] <= cache.max_bytes
+    cache.get('a', str(tmp_path))
+    cache.get('b', str(tmp_path))
+    assert cache.stats()['misses'] == 4
+
+
+def test_load_saved_result_use_cache(mock_env_vars, tmp_path):
+    """load_saved_result(use_cache=True)가 전역 캐시를 사용하는지 테스트"""
+    _save_project(tmp_path, 'doc')
+
+    first, df = clm_ocr.main.load_saved_result('doc', str(tmp_path), use_cache=True)
+    second, _ = clm_ocr.main.load_saved_result('doc', str(tmp_path), use_cache=True)
+
+    assert second is first
+    assert len(df) == 50
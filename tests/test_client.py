@@ -0,0 +1,169 @@
+"""
+ClovaOCRClient 테스트
+"""
+import itertools
+import time
+
+from clm_ocr.client import ClovaOCRClient, AdaptiveTimeout
+from clm_ocr.testing import FakeClovaOCRServer
+
+
+def test_adaptive_timeout_scales_with_document(mock_env_vars):
+    """페이지 수/파일 크기에 비례한 타임아웃 테스트"""
+    policy = AdaptiveTimeout(base=10, per_page=3, per_mb=2, max_timeout=600)
+
+    small = policy.timeout(pages=1, size_bytes=100_000)
+    large = policy.timeout(pages=100, size_bytes=200 * 1024 * 1024)
+
+    assert small < 30 < large
+    assert policy.hedge_delay(1, 100_000) is None
+
+
+def test_adaptive_timeout_learns_from_latency(mock_env_vars):
+    """관측 지연 퍼센타일 학습 테스트"""
+    policy = AdaptiveTimeout(base=10, per_page=0, per_mb=0, min_timeout=0.1,
+                             multiplier=2.0, min_samples=10)
+
+    for _ in range(50):
+        policy.observe(0.5, pages=1, size_bytes=0)
+
+    assert policy.timeout(1, 0) == 1.0
+    assert policy.hedge_delay(1, 0) == 0.5
+
+
+def test_hedged_request_beats_stuck_primary(mock_env_vars, real_pdf_path):
+    """기본 요청이 멈췄을 때 헤지 요청 결과 사용 테스트"""
+    delays = itertools.chain([3.0], itertools.repeat(0.0))
+
+    with FakeClovaOCRServer(latency=lambda rng: next(delays)) as server:
+        policy = AdaptiveTimeout(base=1, per_page=0, per_mb=0, min_samples=5)
+        for _ in range(20):
+            policy.observe(0.05, pages=1, size_bytes=0)
+
+        client = ClovaOCRClient(server.url, 'any', timeout_policy=policy,
+                                hedge=True, max_hedge_ratio=1.0)
+        start = time.perf_counter()
+        result = client.ocr_from_file(str(real_pdf_path))
+
+        assert time.perf_counter() - start < 2.0
+        assert len(result['images']) == 2
+        assert client.hedges_sent == 1
+
+
+def test_hedged_loser_is_aborted(mock_env_vars, real_pdf_path):
+    """헤지 후 진 요청은 연결을 끊어 바로 끝나고, 지연은 기본 요청 시작부터 측정하는지 테스트"""
+    from clm_ocr.client import RequestCancelled
+
+    delays = itertools.chain([3.0], itertools.repeat(0.2))
+    outcomes = []
+
+    class RecordingClient(ClovaOCRClient):
+        def _send(self, *args, **kwargs):
+            try:
+                return super()._send(*args, **kwargs)
+            except Exception as e:
+                outcomes.append((type(e), time.perf_counter()))
+                raise
+
+    class RecordingTimeout(AdaptiveTimeout):
+        observed = []
+
+        def observe(self, latency, pages, size_bytes):
+            self.observed.append(latency)
+            super().observe(latency, pages, size_bytes)
+
+    with FakeClovaOCRServer(latency=lambda rng: next(delays)) as server:
+        policy = RecordingTimeout(base=10, per_page=0, per_mb=0, min_samples=5)
+        for _ in range(20):
+            policy.observe(0.1, pages=1, size_bytes=0)
+
+        client = RecordingClient(server.url, 'any', timeout_policy=policy,
+                                 hedge=True, max_hedge_ratio=1.0)
+        start = time.perf_counter()
+        client.ocr_from_file(str(real_pdf_path), use_cache=False)
+        time.sleep(0.5)
+
+    assert [kind for kind, _ in outcomes] == [RequestCancelled]
+    assert outcomes[0][1] - start < 1.5
+    # 헤지 대기(p95 0.1초) + 헤지 응답(0.2초)
+    assert policy.observed[-1] >= 0.3
+
+
+def test_hedge_budget_is_capped(mock_env_vars, real_pdf_path):
+    """헤지 예산 상한 테스트"""
+    client = ClovaOCRClient('http://unused', 'any', hedge=True, max_hedge_ratio=0.1)
+    client.requests_sent = 5
+
+    assert client._acquire_hedge() is False
+    client.requests_sent = 10
+    assert client._acquire_hedge() is True
+    assert client._acquire_hedge() is False
+
+
+def _make_images(tmp_path, count):
+    import fitz
+
+    paths = []
+    for idx in range(count):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 32, 32), 0)
+        pix.set_rect(pix.irect, (idx * 40, 100, 200))
+        path = tmp_path / f"card{idx}.png"
+        pix.save(str(path))
+        paths.append(str(path))
+    return paths
+
+
+def test_ocr_batch_splits_response_per_input(mock_env_vars, fake_server, tmp_path):
+    """여러 이미지를 묶어 보내고 입력별 결과로 나누는지 테스트"""
+    paths = _make_images(tmp_path, 5)
+    client = ClovaOCRClient(fake_server.url, 'fake-secret')
+
+    results = client.ocr_batch(paths, max_images=2)
+
+    assert fake_server.stats['requests'] == 3
+    assert [len(result['images']) for result in results] == [1] * 5
+    assert results[3]['images'][0]['name'] == '0003_card3'
+    assert client.ocr_from_file(paths[3]) is results[3]
+
+
+def test_ocr_batcher_forms_batches_from_queue(mock_env_vars, fake_server, tmp_path):
+    """큐에 들어온 파일을 자동으로 묶어 전송하는지 테스트"""
+    from clm_ocr.client import OCRBatcher
+
+    paths = _make_images(tmp_path, 5)
+    client = ClovaOCRClient(fake_server.url, 'fake-secret')
+
+    with OCRBatcher(client, max_images=3, max_wait=1.0) as batcher:
+        futures = [batcher.submit(path) for path in paths]
+
+    assert all(len(future.result()['images']) == 1 for future in futures)
+    assert fake_server.stats['requests'] == 2
+
+
+def test_ocr_batcher_flushes_carry_on_close(mock_env_vars, fake_server, tmp_path):
+    """종료 시 크기 상한으로 넘겨진 파일을 max_wait만큼 기다리지 않고 바로 전송하는지 테스트"""
+    from clm_ocr.client import OCRBatcher
+
+    paths = _make_images(tmp_path, 2)
+    client = ClovaOCRClient(fake_server.url, 'fake-secret')
+
+    batcher = OCRBatcher(client, max_bytes=1, max_wait=5.0)
+    futures = [batcher.submit(path) for path in paths]
+    start = time.perf_counter()
+    batcher.close()
+
+    assert time.perf_counter() - start < 2.0
+    assert all(len(future.result()['images']) == 1 for future in futures)
+    assert fake_server.stats['requests'] == 2
+
+
+def test_split_batch_response_rejects_missing_input(mock_env_vars):
+    """응답에 결과가 없는 입력을 빈 결과로 넘기지 않고 오류로 보고하는지 테스트"""
+    import pytest
+    from clm_ocr.client import split_batch_response
+
+    response = {'images': [{'name': '0000_a', 'fields': []}]}
+
+    assert split_batch_response(response, ['0000_a'])['0000_a'] == response['images']
+    with pytest.raises(ValueError, match='0001_b'):
+        split_batch_response(response, ['0000_a', '0001_b'])
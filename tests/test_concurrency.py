@@ -0,0 +1,132 @@
+"""
+적응형 동시성 / 서킷 브레이커 테스트
+"""
+import pytest
+import requests
+
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.concurrency import AIMDLimiter, CircuitBreaker, AdaptiveDispatcher, ocr_many
+from clm_ocr.testing import FakeClovaOCRServer
+
+
+def test_aimd_limiter_increase_and_decrease(mock_env_vars):
+    """성공 시 가산 증가, 같은 혼잡 구간의 과부하는 1회만 감소 테스트"""
+    limiter = AIMDLimiter(initial_limit=4, max_limit=8, min_samples=1000)
+
+    for _ in range(8):
+        limiter.release(limiter.acquire(), latency=1.0)
+    assert limiter.limit == 5
+
+    tokens = [limiter.acquire() for _ in range(3)]
+    for token in tokens:
+        limiter.release(token, overloaded=True)
+    assert limiter.limit == 2
+    assert limiter.decreases == 1
+    assert limiter.acquire(timeout=0) is not None
+
+
+def test_circuit_breaker_opens_and_probes(mock_env_vars):
+    """연속 실패 시 차단, 복구 시간 후 시험 요청 1건 허용 테스트"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=10, clock=lambda: now[0])
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()   # 시험 요청은 1건만
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_ignores_results_from_before_open(mock_env_vars):
+    """차단 전에 보낸 요청의 늦은 실패가 차단을 연장하거나 시험 요청으로 취급되지 않는지 테스트"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=10, clock=lambda: now[0])
+
+    tokens = [breaker.acquire() for _ in range(5)]
+    breaker.record_failure(tokens[0])
+    breaker.record_failure(tokens[1])
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # 차단 중에 도착한 실패
+    now[0] = 9.0
+    breaker.record_failure(tokens[2])
+    assert breaker.opens == 1
+
+    now[0] = 10.0
+    probe = breaker.acquire()
+    assert probe is not None
+
+    # 시험 요청이 진행 중일 때 도착한 실패/성공은 무시 (두 번째 시험 요청도 허용하지 않음)
+    breaker.record_failure(tokens[3])
+    breaker.record_success(tokens[4])
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.acquire() is None
+
+    breaker.record_success(probe)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_dispatcher_releases_slot_on_interrupt(mock_env_vars):
+    """fn이 KeyboardInterrupt 등으로 빠져나가도 동시성 슬롯과 시험 요청 자리를 반납하는지 테스트"""
+    dispatcher = AdaptiveDispatcher(AIMDLimiter(initial_limit=1, max_limit=1))
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        dispatcher.call(interrupted)
+
+    assert dispatcher.limiter.in_flight == 0
+    assert dispatcher.call(lambda: 'ok') == 'ok'
+
+
+def test_dispatcher_does_not_retry_client_errors(mock_env_vars):
+    """잘못된 요청(4xx)은 재시도하지 않고 서킷에도 반영하지 않는지 테스트"""
+    dispatcher = AdaptiveDispatcher(breaker=CircuitBreaker(failure_threshold=1))
+    response = requests.Response()
+    response.status_code = 400
+    calls = []
+
+    def bad_request():
+        calls.append(1)
+        raise requests.exceptions.HTTPError(response=response)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        dispatcher.call(bad_request)
+    assert len(calls) == 1
+    assert dispatcher.metrics()['breaker_state'] == CircuitBreaker.CLOSED
+
+
+def test_ocr_many_backs_off_on_rate_limit(mock_env_vars, tmp_path):
+    """429 응답이 섞여도 모든 파일이 처리되고 한도가 줄어드는지 테스트"""
+    paths = []
+    for idx in range(20):
+        path = tmp_path / f"id_{idx}.png"
+        path.write_bytes(b'\x89PNG' + bytes(100))
+        paths.append(str(path))
+
+    with FakeClovaOCRServer(rate_limit_rate=0.3, retry_after=0, latency=0.01, seed=3) as server:
+        client = ClovaOCRClient(server.url, 'fake-secret', timeout=5)
+        dispatcher = AdaptiveDispatcher(
+            AIMDLimiter(initial_limit=8), CircuitBreaker(failure_threshold=50), max_attempts=10
+        )
+        results = ocr_many(client, paths, dispatcher=dispatcher)
+
+    assert all(result is not None for result in results)
+    metrics = dispatcher.metrics()
+    assert metrics['decreases'] >= 1
+    assert metrics['retried'] >= 1
+    assert metrics['succeeded'] == 20
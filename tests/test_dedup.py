@@ -0,0 +1,109 @@
+"""
+유사 문서 탐지 테스트
+"""
+import json
+from unittest.mock import Mock, patch
+
+import fitz
+
+from clm_ocr.dedup import DuplicateIndex, pdf_page_hashes
+from clm_ocr.main import process_pdf
+
+LETTER = (
+    "저는 데이터 분석 직무에 지원하게 된 홍길동입니다. 대학 시절 추천 시스템 프로젝트를 "
+    "주도하며 사용자 행동 로그를 분석했고, 그 경험을 바탕으로 귀사의 서비스 개선에 기여하고 "
+    "싶습니다. 협업과 문제 해결을 가장 중요한 가치로 생각합니다."
+)
+
+
+def _make_pdf(path, text):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(50, 50, 550, 400), text, fontsize=14, fontname='korea')
+    page.draw_rect(fitz.Rect(40, 40, 560, 420), color=(0, 0, 0), width=3)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_minhash_finds_edited_resubmission(mock_env_vars):
+    """작은 수정이 있는 재제출 문서 탐지 테스트"""
+    index = DuplicateIndex()
+    index.add('original', text=LETTER)
+    index.add('other', text="완전히 다른 내용의 경력기술서입니다. 영업 관리 경험 10년." * 3)
+
+    edited = LETTER.replace('홍길동', '김철수')
+    matches = index.query(text=edited)
+
+    assert [m['doc_id'] for m in matches] == ['original']
+    assert matches[0]['text_similarity'] >= 0.8
+
+
+def test_page_hash_matches_re_export(mock_env_vars, tmp_path):
+    """다시 저장한 PDF의 페이지 해시 일치 및 저장/로딩 테스트"""
+    original = _make_pdf(tmp_path / "a.pdf", LETTER)
+    reexport = _make_pdf(tmp_path / "b.pdf", LETTER + " ")
+
+    index = DuplicateIndex()
+    index.add('original', page_hashes=pdf_page_hashes(str(original)))
+    index.save(str(tmp_path / "index.npz"))
+    loaded = DuplicateIndex.load(str(tmp_path / "index.npz"))
+
+    matches = loaded.query(page_hashes=pdf_page_hashes(str(reexport)))
+
+    assert matches[0]['doc_id'] == 'original'
+    assert matches[0]['page_similarity'] == 1.0
+
+
+def test_process_pdf_reuses_duplicate(mock_env_vars, tmp_path):
+    """유사 문서 재사용 시 API를 호출하지 않는지 테스트"""
+    output_base = tmp_path / "output"
+    saved = output_base / "original"
+    saved.mkdir(parents=True)
+    saved_result = {'images': [{'fields': [{'inferText': LETTER, 'inferConfidence': 0.99}]}]}
+    (saved / "ocr_result.json").write_text(json.dumps(saved_result), encoding='utf-8')
+
+    index = DuplicateIndex()
+    index.add('original', text=LETTER)
+    resubmitted = _make_pdf(tmp_path / "resubmitted.pdf", LETTER)
+
+    with patch('clm_ocr.main.ClovaOCRClient') as mock_client_class:
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+
+        result, _ = process_pdf(str(resubmitted), output_formats=['json'],
+                                output_base=str(output_base),
+                                dedup_index=index, reuse_duplicates=True)
+
+    mock_client.ocr_from_file.assert_not_called()
+    assert result == saved_result
+    manifest = json.loads((output_base / "resubmitted" / "_complete.json").read_text())
+    assert manifest['duplicate_of'] == ['original']
+    assert len(index) == 2
+
+
+def test_build_from_saved_reads_storage_backends(mock_env_vars, tmp_path):
+    """저장소 API로 문서를 읽고, 완료 마커에 결과가 없는 문서는 건너뛰는지 테스트"""
+    from clm_ocr.client import OCROutputManager
+    from clm_ocr.main import write_outputs, _write_json
+    from clm_ocr.storage import SQLiteStorage
+
+    saved_result = {'images': [{'fields': [{'inferText': LETTER, 'inferConfidence': 0.99}]}]}
+    pdf_path = _make_pdf(tmp_path / "letter.pdf", LETTER)
+
+    with SQLiteStorage(str(tmp_path / "ocr.sqlite")) as storage:
+        output_mgr = OCROutputManager(str(pdf_path), storage=storage)
+        output_mgr.setup_directories()
+        write_outputs(output_mgr, {'ocr_result.json': lambda p: _write_json(p, saved_result)})
+
+        # 저장 중 실패: 결과 파일은 있지만 완료 마커에 없음
+        with storage.atomic_path('partial', 'ocr_result.json') as path:
+            path.write_text(json.dumps(saved_result), encoding='utf-8')
+        with storage.atomic_path('partial', '_complete.json') as path:
+            path.write_text(json.dumps({'artifacts': {}}), encoding='utf-8')
+
+        index = DuplicateIndex.build_from_saved(storage=storage)
+
+    assert index.doc_ids == [output_mgr.project_name]
+    assert index.query(LETTER)[0]['text_similarity'] == 1.0
+    assert index.query(page_hashes=pdf_page_hashes(str(pdf_path)))[0]['page_similarity'] == 1.0
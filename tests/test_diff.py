@@ -0,0 +1,89 @@
+"""
+OCR 결과 비교 테스트
+"""
+import json
+import random
+import time
+
+from clm_ocr.diff import diff_results, diff_projects
+
+from .conftest import ocr_field
+
+
+OLD = {'images': [{'fields': [
+    ocr_field('지원', x=10, y=10), ocr_field('동기', x=80, y=10), ocr_field('성장', x=10, y=50),
+    ocr_field('삭제', x=200, y=200), ocr_field('이동', x=10, y=300),
+]}]}
+NEW = {'images': [{'fields': [
+    ocr_field('지원', x=10, y=10), ocr_field('동귀', x=80, y=10, confidence=0.7),
+    ocr_field('성장', x=12, y=55),
+    ocr_field('추가', x=400, y=400), ocr_field('이동', x=300, y=10),
+]}]}
+
+
+def test_diff_results_change_kinds(mock_env_vars):
+    """추가/삭제/텍스트/신뢰도/위치 변경 분류 테스트"""
+    diff = diff_results(OLD, NEW)
+    summary = diff['summary']
+
+    assert summary['matched'] == 4
+    assert summary['unchanged'] == 1
+    assert (summary['added'], summary['removed']) == (1, 1)
+    assert summary['text_changed'] == 1 and summary['confidence_changed'] == 1
+    assert summary['moved'] == 2   # '성장' 소폭 이동 + '이동' 텍스트 기준 매칭
+
+    changed = {c['old_text']: c for c in diff['changes'] if c['kind'] == 'changed'}
+    assert changed['동기']['new_text'] == '동귀'
+    assert set(changed['동기']['attributes']) == {'text', 'confidence'}
+    assert changed['이동']['attributes'] == ['position']
+    assert [c['new_text'] for c in diff['changes'] if c['kind'] == 'added'] == ['추가']
+
+
+def test_diff_results_large_page_is_fast(mock_env_vars):
+    """필드 1만 개 페이지 비교 성능 테스트"""
+    rng = random.Random(0)
+    fields = [ocr_field(f'w{i}', x=(i % 100) * 70, y=(i // 100) * 25) for i in range(10000)]
+    shifted = [
+        ocr_field(f['inferText'] if rng.random() > 0.01 else 'x',
+               x=f['boundingPoly']['vertices'][0]['x'] + 1,
+               y=f['boundingPoly']['vertices'][0]['y'])
+        for f in fields
+    ]
+
+    start = time.perf_counter()
+    diff = diff_results({'images': [{'fields': fields}]}, {'images': [{'fields': shifted}]})
+    elapsed = time.perf_counter() - start
+
+    assert diff['summary']['matched'] == 10000
+    assert elapsed < 5.0
+
+
+def test_diff_projects(mock_env_vars, tmp_path):
+    """저장된 프로젝트 비교 테스트"""
+    for name, result in [('v1', OLD), ('v2', NEW)]:
+        (tmp_path / name).mkdir()
+        with open(tmp_path / name / 'ocr_result.json', 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+
+    diff = diff_projects('v1', 'v2', output_base=str(tmp_path))
+    assert diff['summary']['added'] == 1
+    assert diff_projects('v1', 'missing', output_base=str(tmp_path)) is None
+
+
+def test_candidate_pairs_linear_with_wide_box(mock_env_vars):
+    """페이지 전체 너비 박스가 있어도 후보 쌍 수가 필드 수에 비례하는지 테스트"""
+    from clm_ocr.diff import _candidate_indices, _page_arrays
+
+    def page(rows):
+        fields = [ocr_field(f'w{i}', x=(i % 100) * 70, y=(i // 100) * 25)
+                  for i in range(rows * 100)]
+        header = ocr_field('머리글', width=7000)
+        return _page_arrays({'fields': [header] + fields})[0]
+
+    counts = []
+    for rows in (20, 40):
+        boxes = page(rows)
+        counts.append(len(_candidate_indices(boxes, boxes)[0]))
+
+    assert counts[0] < 20 * 2001
+    assert counts[1] < 2.2 * counts[0]
@@ -0,0 +1,43 @@
+"""
+다중 엔드포인트 부하 분산 테스트
+"""
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.endpoints import EndpointPool
+from clm_ocr.testing import FakeClovaOCRServer
+
+
+def test_least_outstanding_respects_weights(mock_env_vars):
+    """가중치 대비 진행 요청이 가장 적은 엔드포인트 선택 테스트"""
+    pool = EndpointPool([
+        ('https://a', 'KEY_A', 2),
+        {'api_url': 'https://b', 'secret_key': 'KEY_B'},
+    ])
+
+    chosen = [pool.acquire() for _ in range(3)]
+
+    assert [ep.api_url for ep in chosen].count('https://a') == 2
+    assert [m['outstanding'] for m in pool.metrics()] == [2, 1]
+
+    pool.release(chosen[0], latency=0.5)
+    assert pool.acquire().api_url == 'https://a'
+    assert pool.metrics()[0]['latency'] == 0.5
+
+
+def test_failover_and_health_tracking(mock_env_vars, real_pdf_path):
+    """장애 엔드포인트에서 다른 엔드포인트로 전환하고 차단하는지 테스트"""
+    with FakeClovaOCRServer(error_rate=1.0) as broken, \
+            FakeClovaOCRServer(secret_key='good') as healthy:
+        pool = EndpointPool(
+            [(broken.url, 'any'), (healthy.url, 'bad'), (healthy.url, 'good')],
+            failure_threshold=1, recovery_time=60,
+        )
+        client = ClovaOCRClient(endpoints=pool)
+
+        results = [client.ocr_from_file(str(real_pdf_path), use_cache=False) for _ in range(3)]
+
+    assert all(len(result['images']) == 2 for result in results)
+    # 실패한 엔드포인트는 차단되어 이후 요청을 받지 않음
+    assert broken.stats['requests'] == 1
+    metrics = pool.metrics()
+    assert [m['state'] for m in metrics] == ['open', 'open', 'closed']
+    assert metrics[2]['requests'] == 3 and metrics[2]['failures'] == 0
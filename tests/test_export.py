@@ -0,0 +1,66 @@
+"""
+청크 내보내기 테스트
+"""
+import json
+
+import pytest
+
+from clm_ocr.export import ChunkBuilder, iter_chunks, export_corpus
+
+from .conftest import ocr_field
+
+
+RESULT = {'images': [
+    {'fields': [ocr_field(f'a{i}', x=i * 60, y=10, width=50, confidence=0.9)
+                for i in range(6)]},
+    {'fields': [ocr_field(f'b{i}', x=i * 60, y=10, width=50, confidence=0.5)
+                for i in range(6)]},
+]}
+
+
+def test_chunks_carry_provenance_and_overlap(mock_env_vars):
+    """길이 제한, 겹침, 페이지/필드 범위/신뢰도 출처 테스트"""
+    chunks = list(iter_chunks(RESULT, max_length=15, overlap=6, doc_id='doc'))
+
+    assert all(chunk['length'] <= 15 for chunk in chunks)
+    assert chunks[0]['id'] == 'doc:0'
+    assert chunks[0]['text'] == 'a0 a1 a2 a3 a4'
+    assert chunks[0]['spans'] == [
+        {'page': 1, 'field_start': 0, 'field_end': 5, 'bbox': [0, 10, 290, 30]}
+    ]
+    # 이전 청크 끝부분(6자 이내)이 다음 청크 앞에 반복됨
+    assert chunks[1]['text'].startswith('a3 a4')
+
+    spanning = next(chunk for chunk in chunks if chunk['pages'] == [1, 2])
+    assert spanning['mean_confidence'] == pytest.approx(
+        sum(0.9 if span['page'] == 1 else 0.5
+            for span in spanning['spans']
+            for _ in range(span['field_start'], span['field_end']))
+        / sum(span['field_end'] - span['field_start'] for span in spanning['spans'])
+    )
+    assert chunks[-1]['text'].endswith('b5')
+
+
+def test_custom_length_function(mock_env_vars):
+    """토크나이저 콜백으로 길이를 계산하는지 테스트"""
+    tokens = lambda text: len(text.split())   # noqa: E731
+    chunks = list(iter_chunks(RESULT, max_length=4, overlap=0, length_fn=tokens))
+
+    assert [chunk['length'] for chunk in chunks] == [4, 4, 4]
+    with pytest.raises(ValueError):
+        ChunkBuilder(max_length=4, overlap=4)
+
+
+def test_export_corpus(mock_env_vars, tmp_path):
+    """저장된 문서 전체를 하나의 JSONL로 내보내는지 테스트"""
+    for name in ['doc1', 'doc2']:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'ocr_result.json').write_text(json.dumps(RESULT))
+
+    count = export_corpus(str(tmp_path / 'corpus.jsonl'), output_base=str(tmp_path),
+                          max_length=40, overlap=0)
+
+    with open(tmp_path / 'corpus.jsonl', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == count == 2
+    assert sorted(line['doc_id'] for line in lines) == ['doc1', 'doc2']
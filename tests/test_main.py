@@ -84,4 +84,44 @@ def test_load_saved_result(mock_env_vars, tmp_path):
     # 검증
     assert result is not None
     assert df is not None
-    assert result['images'][0]['fields'][0]['inferText'] == '로딩 테스트'
\ No newline at end of file
+    assert result['images'][0]['fields'][0]['inferText'] == '로딩 테스트'
+
+
+def test_write_outputs_is_atomic(mock_env_vars, tmp_path):
+    """실패한 출력은 완료 마커에서 제외되고 임시 파일이 남지 않는지 테스트"""
+    from clm_ocr.client import OCROutputManager
+    from clm_ocr.main import write_outputs
+
+    output_mgr = OCROutputManager(str(tmp_path / "doc.pdf"), str(tmp_path / "output"))
+    output_mgr.setup_directories()
+
+    def broken_writer(path):
+        path.write_text('half written')
+        raise IOError("disk full")
+
+    completed = write_outputs(output_mgr, {
+        'extracted_text.txt': lambda path: path.write_text('전체 텍스트', encoding='utf-8'),
+        'document.md': broken_writer,
+    })
+
+    assert completed == ['extracted_text.txt']
+    assert sorted(p.name for p in output_mgr.project_dir.iterdir()) == [
+        '_complete.json', '_source.txt', 'extracted_text.txt'
+    ]
+    manifest = OCROutputManager.read_manifest(output_mgr.project_dir)
+    assert list(manifest['artifacts']) == ['extracted_text.txt']
+
+
+def test_load_saved_result_ignores_incomplete_json(mock_env_vars, tmp_path):
+    """완료 마커에 없는 JSON은 읽지 않는지 테스트"""
+    import json
+
+    project_dir = tmp_path / "output" / "partial"
+    project_dir.mkdir(parents=True)
+    (project_dir / "ocr_result.json").write_text(json.dumps({'images': []}))
+    (project_dir / "_complete.json").write_text(json.dumps({'artifacts': {}}))
+
+    result, df = load_saved_result('partial', output_base=str(tmp_path / "output"))
+
+    assert result is None
+    assert df is None
@@ -0,0 +1,80 @@
+"""
+페이지 병렬 변환 테스트
+"""
+import copy
+
+import pandas as pd
+
+from clm_ocr.arrays import ResultArrays
+from clm_ocr.parallel import convert_pages
+from clm_ocr.processor import OCRProcessor
+from clm_ocr.testing import FakeClovaOCRServer
+
+
+def _large_result(num_pages=12):
+    server = FakeClovaOCRServer(fields_per_page=30, tables_per_page=1)
+    images = []
+    for page_idx in range(num_pages):
+        response = server.build_response(
+            {'images': [{'format': 'png', 'name': 'p'}], 'enableTableDetection': True},
+            [f'page-{page_idx}'.encode()]
+        )
+        images.append(copy.deepcopy(response['images'][0]))
+    images[3]['fields'] = []   # 빈 페이지 포함
+    return {'version': 'V2', 'images': images}
+
+
+def test_parallel_matches_serial(mock_env_vars):
+    """병렬 변환 결과가 순차 변환과 동일한지 테스트"""
+    result = _large_result()
+
+    assert convert_pages(result, 'text', workers=3, min_pages=1) == OCRProcessor.to_text(result)
+    assert convert_pages(result, 'markdown', workers=3, min_pages=1, include_confidence=True) \
+        == OCRProcessor.to_markdown(result, include_confidence=True)
+    pd.testing.assert_frame_equal(
+        convert_pages(result, 'dataframe', workers=3, min_pages=1),
+        OCRProcessor.to_dataframe(result)
+    )
+    parallel_tables = convert_pages(result, 'tables', workers=3, min_pages=1)
+    serial_tables = OCRProcessor.extract_tables(result)
+    assert [(t['page'], t['table_idx']) for t in parallel_tables] == \
+        [(t['page'], t['table_idx']) for t in serial_tables]
+    assert all(p['dataframe'].equals(s['dataframe'])
+               for p, s in zip(parallel_tables, serial_tables))
+
+
+def test_parallel_from_shared_arrays(mock_env_vars):
+    """ResultArrays 입력은 공유 메모리로 전달해도 결과가 동일한지 테스트"""
+    result = _large_result()
+    arrays = ResultArrays.from_result(result)
+
+    assert convert_pages(arrays, 'text', workers=2, min_pages=1) == OCRProcessor.to_text(result)
+
+
+def test_small_input_falls_back_to_serial(mock_env_vars, monkeypatch):
+    """작은 결과는 프로세스 풀 없이 순차 처리하는지 테스트"""
+    import clm_ocr.parallel as parallel
+
+    def fail(*args, **kwargs):
+        raise AssertionError("프로세스 풀을 사용하면 안 됩니다")
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', fail)
+    result = _large_result(num_pages=4)
+
+    assert OCRProcessor.to_text(result, workers=8) == OCRProcessor.to_text(result)
+
+
+def test_parallel_concurrent_calls_without_fork(mock_env_vars):
+    """여러 스레드에서 동시에 변환해도 fork 없이 각각 올바른 결과를 내는지 테스트"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from clm_ocr.parallel import _pool_context
+
+    assert _pool_context().get_start_method() != 'fork'
+    results = [_large_result(num_pages=6 + idx) for idx in range(3)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        texts = list(executor.map(
+            lambda result: convert_pages(result, 'text', workers=2, min_pages=1), results
+        ))
+
+    assert texts == [OCRProcessor.to_text(result) for result in results]
@@ -0,0 +1,222 @@
+"""
+파이프라인 처리 테스트
+"""
+import threading
+import time
+
+import fitz
+
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.main import load_saved_result
+from clm_ocr.pipeline import OCRPipeline
+from clm_ocr.processor import OCRProcessor
+
+
+def _make_pdfs(tmp_path, count):
+    paths = []
+    for idx in range(count):
+        pdf_path = tmp_path / f"doc{idx}.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), f"Document {idx}")
+        doc.save(pdf_path)
+        doc.close()
+        paths.append(pdf_path)
+    return paths
+
+
+def test_pipeline_processes_documents(mock_env_vars, fake_server, tmp_path):
+    """여러 문서 처리, 실패 문서 격리, 단계별 통계 테스트"""
+    pdf_paths = _make_pdfs(tmp_path, 4) + [tmp_path / "missing.pdf"]
+    output_base = tmp_path / "output"
+    pipeline = OCRPipeline(
+        client=ClovaOCRClient(fake_server.url, 'fake-secret'),
+        output_formats=['json', 'text', 'dataframe', 'chunks'],
+        output_base=str(output_base),
+        api_workers=3,
+    )
+
+    results = pipeline.run(pdf_paths)
+
+    assert [summary['doc_id'] for summary in results[:4]] == ['doc0', 'doc1', 'doc2', 'doc3']
+    assert all(summary['error'] is None for summary in results[:4])
+    assert results[4]['error'].startswith('read:')
+
+    result, df = load_saved_result('doc2', output_base=str(output_base))
+    assert len(df) == 12
+    assert (output_base / 'doc2' / 'extracted_text.txt').read_text(encoding='utf-8') == \
+        OCRProcessor.to_text(result)
+    assert sorted(results[2]['artifacts']) == \
+        ['chunks.jsonl', 'extracted_text.txt', 'ocr_data.csv', 'ocr_result.json']
+
+    stats = pipeline.stats()
+    assert list(stats) == ['read', 'api', 'convert', 'write']
+    assert stats['read']['items'] == 5 and stats['read']['failures'] == 1
+    assert stats['write']['items'] == 4
+    assert all(0 <= stage['utilization'] <= 1 for stage in stats.values())
+
+
+def test_pipeline_same_stem_does_not_overwrite(mock_env_vars, fake_server, tmp_path):
+    """파일명이 같은 두 PDF 중 하나만 저장되고 다른 하나는 실패로 보고되는지 테스트"""
+    pdf_paths = []
+    for folder, pages in [('a', 1), ('b', 3)]:
+        (tmp_path / folder).mkdir()
+        doc = fitz.open()
+        for _ in range(pages):
+            doc.new_page()
+        doc.save(tmp_path / folder / 'resume.pdf')
+        doc.close()
+        pdf_paths.append(tmp_path / folder / 'resume.pdf')
+    output_base = tmp_path / "output"
+    pipeline = OCRPipeline(
+        client=ClovaOCRClient(fake_server.url, 'fake-secret'),
+        output_formats=['json'], output_base=str(output_base), read_workers=2,
+    )
+
+    results = pipeline.run(pdf_paths)
+
+    succeeded = [summary for summary in results if summary['error'] is None]
+    failed = [summary for summary in results if summary['error'] is not None]
+    assert len(succeeded) == len(failed) == 1
+    assert '다른 원본' in failed[0]['error']
+    result, _ = load_saved_result('resume', output_base=str(output_base))
+    assert len(result['images']) == succeeded[0]['pages']
+
+
+class BlockingClient:
+    """release 전까지 응답하지 않는 클라이언트"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def ocr_from_file(self, file_path, lang='ko', enable_table=False, use_cache=True):
+        self.release.wait(5)
+        return {'images': [{'fields': [{'inferText': 'x', 'inferConfidence': 0.9}]}]}
+
+
+def test_pipeline_backpressure(mock_env_vars, tmp_path):
+    """API 단계가 막히면 입력을 더 읽지 않는지 테스트"""
+    pdf_path = _make_pdfs(tmp_path, 1)[0]
+    consumed = []
+
+    def source():
+        for idx in range(50):
+            consumed.append(idx)
+            yield pdf_path
+
+    client = BlockingClient()
+    pipeline = OCRPipeline(
+        client=client, output_formats=['text'], output_base=str(tmp_path / "output"),
+        read_workers=1, api_workers=1, convert_workers=1, write_workers=1, queue_size=1,
+    )
+    runner = threading.Thread(target=pipeline.run, args=(source(),))
+    runner.start()
+    time.sleep(0.5)
+
+    # 대기열 2개 + 워커 2개 + 대기열에 넣으려는 1개
+    assert len(consumed) <= 5
+
+    client.release.set()
+    runner.join(10)
+    assert len(consumed) == 50
+    assert pipeline.stats()['api']['items'] == 50
+
+
+def test_pipeline_outputs_match_process_pdf(mock_env_vars, fake_server, tmp_path):
+    """파이프라인과 process_pdf가 같은 산출물을 만드는지 테스트 (공용 build_writers)"""
+    from clm_ocr.main import process_pdf
+
+    pdf_path = _make_pdfs(tmp_path, 1)[0]
+    formats = ['json', 'text', 'dataframe', 'markdown', 'chunks']
+    process_pdf(str(pdf_path), output_formats=formats, output_base=str(tmp_path / "single"),
+                api_url=fake_server.url, secret_key='fake-secret', redact=True)
+    OCRPipeline(
+        client=ClovaOCRClient(fake_server.url, 'fake-secret'), output_formats=formats,
+        output_base=str(tmp_path / "pipeline"), redact=True,
+    ).run([pdf_path])
+
+    single, piped = tmp_path / "single" / "doc0", tmp_path / "pipeline" / "doc0"
+    for name in ['extracted_text.txt', 'ocr_data.csv', 'document.md', 'chunks.jsonl']:
+        assert (piped / name).read_bytes() == (single / name).read_bytes(), name
+    # 요청 ID/시각만 다름
+    single_json, piped_json = (
+        load_saved_result('doc0', output_base=str(tmp_path / base))[0]
+        for base in ('single', 'pipeline')
+    )
+    assert piped_json['images'] == single_json['images']
+
+
+class CountingClient(ClovaOCRClient):
+    """OCR 호출 횟수를 세는 클라이언트"""
+
+    calls = 0
+
+    def ocr_from_file(self, *args, **kwargs):
+        CountingClient.calls += 1
+        return super().ocr_from_file(*args, **kwargs)
+
+
+def test_pipeline_reuses_duplicates(mock_env_vars, fake_server, tmp_path):
+    """유사 문서 인덱스를 사용해 중복 문서는 API 호출 없이 저장된 결과를 재사용하는지 테스트"""
+    import json
+    import shutil
+
+    from clm_ocr.dedup import DuplicateIndex
+
+    original = _make_pdfs(tmp_path, 1)[0]
+    copy = tmp_path / "copy.pdf"
+    shutil.copy(original, copy)
+    output_base = tmp_path / "output"
+    index = DuplicateIndex()
+    client = CountingClient(fake_server.url, 'fake-secret')
+
+    def run(path):
+        return OCRPipeline(
+            client=client, output_formats=['json'], output_base=str(output_base),
+            dedup_index=index, reuse_duplicates=True,
+        ).run([path])[0]
+
+    assert run(original)['error'] is None
+    summary = run(copy)
+
+    assert summary['error'] is None
+    assert CountingClient.calls == 1
+    assert len(index) == 2
+    manifest = json.loads((output_base / 'copy' / '_complete.json').read_text(encoding='utf-8'))
+    assert manifest['duplicate_of'] == ['doc0']
+    assert load_saved_result('copy', output_base=str(output_base))[0] == \
+        load_saved_result('doc0', output_base=str(output_base))[0]
+
+
+def test_partial_write_fails_in_both_entry_points(mock_env_vars, fake_server, tmp_path,
+                                                  monkeypatch):
+    """일부 출력 저장에 실패하면 process_pdf와 파이프라인 모두 실패로 보고하는지 테스트"""
+    from clm_ocr import main, pipeline as pipeline_module
+
+    build_writers = main.build_writers
+
+    def with_broken_writer(*args, **kwargs):
+        writers = build_writers(*args, **kwargs)
+
+        def broken(path):
+            raise IOError("disk full")
+
+        writers['document.md'] = broken
+        return writers
+
+    monkeypatch.setattr(main, 'build_writers', with_broken_writer)
+    monkeypatch.setattr(pipeline_module, 'build_writers', with_broken_writer)
+    pdf_path = _make_pdfs(tmp_path, 1)[0]
+
+    assert main.process_pdf(
+        str(pdf_path), output_formats=['json'], output_base=str(tmp_path / "single"),
+        api_url=fake_server.url, secret_key='fake-secret',
+    ) == (None, None)
+    summary, = OCRPipeline(
+        client=ClovaOCRClient(fake_server.url, 'fake-secret'), output_formats=['json'],
+        output_base=str(tmp_path / "pipeline"),
+    ).run([pdf_path])
+
+    assert summary['error'] == "write: 1개 파일 저장 실패"
+    for base in ('single', 'pipeline'):
+        manifest = main.OCROutputManager.read_manifest(tmp_path / base / "doc0")
+        assert list(manifest['artifacts']) == ['ocr_result.json']
@@ -0,0 +1,92 @@
+"""
+배치 사전 점검 테스트
+"""
+from pathlib import Path
+
+import fitz
+
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.pipeline import OCRPipeline
+from clm_ocr.preflight import preflight, plan_documents, read_plan
+
+
+def _save(doc, path, **options):
+    doc.save(path, **options)
+    doc.close()
+    return str(path)
+
+
+def test_preflight_classifies_documents(mock_env_vars, tmp_path):
+    """페이지 수, 텍스트 레이어, 과대 페이지, 문제 파일 분류 및 요약 테스트"""
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "text layer")
+    doc.new_page()
+    doc.new_page(width=3000, height=1000)
+    scanned = _save(doc, tmp_path / "scanned.pdf")
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "secret")
+    encrypted = _save(doc, tmp_path / "encrypted.pdf", encryption=fitz.PDF_ENCRYPT_AES_256,
+                      owner_pw='owner', user_pw='user')
+
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    plan_path = tmp_path / "plan.jsonl"
+    summary = preflight(
+        [scanned, encrypted, str(broken), str(tmp_path / "missing.pdf")],
+        plan_path=str(plan_path), workers=2, pages_per_request=2, cost_per_page=3.0,
+    )
+
+    records = list(read_plan(str(plan_path)))
+    assert [r['status'] for r in records] == ['ok', 'encrypted', 'broken', 'missing']
+    assert records[0]['pages'] == 3
+    assert records[0]['text_layer_pages'] == 1
+    assert records[0]['oversized_pages'] == [3]
+    assert records[0]['api_calls'] == 2
+
+    assert summary['documents'] == 4
+    assert summary['status'] == {'ok': 1, 'encrypted': 1, 'broken': 1, 'missing': 1}
+    assert summary['pages'] == 3
+    assert summary['estimated_cost'] == 9.0
+    assert summary['upload_bytes'] == records[0]['size_bytes']
+
+
+def test_pipeline_consumes_plan(mock_env_vars, fake_server, tmp_path):
+    """계획 파일의 처리 가능한 문서만 파이프라인으로 처리하는지 테스트"""
+    paths = []
+    for name in ['a', 'b']:
+        doc = fitz.open()
+        doc.new_page()
+        paths.append(_save(doc, tmp_path / f"{name}.pdf"))
+    plan_path = tmp_path / "plan.jsonl"
+    preflight(paths + [str(tmp_path / "missing.pdf")], plan_path=str(plan_path), workers=1)
+
+    pipeline = OCRPipeline(
+        client=ClovaOCRClient(fake_server.url, 'fake-secret'),
+        output_formats=['json'], output_base=str(tmp_path / "output"),
+    )
+    results = pipeline.run(plan_documents(str(plan_path)))
+
+    assert [r['doc_id'] for r in results] == ['a', 'b']
+    assert all(r['error'] is None and r['pages'] == 1 for r in results)
+
+
+def test_preflight_scans_directory_case_insensitively(mock_env_vars, tmp_path):
+    """디렉토리 입력 시 대문자 확장자와 이미지 파일도 찾는지 테스트"""
+    doc = fitz.open()
+    doc.new_page()
+    _save(doc, tmp_path / "upper.PDF")
+    nested = tmp_path / "scans"
+    nested.mkdir()
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 16, 16), 0)
+    pix.save(str(nested / "card.png"))
+    pix.save(str(nested / "photo.JPG"))
+    (tmp_path / "notes.txt").write_text("skip")
+
+    plan_path = tmp_path / "plan.jsonl"
+    summary = preflight(str(tmp_path), plan_path=str(plan_path), workers=1)
+
+    records = list(read_plan(str(plan_path)))
+    assert sorted(Path(r['path']).name for r in records) == ['card.png', 'photo.JPG', 'upper.PDF']
+    assert summary['pages'] == 3
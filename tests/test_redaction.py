@@ -0,0 +1,122 @@
+"""
+개인정보 마스킹 테스트
+"""
+import fitz
+
+from clm_ocr.processor import OCRProcessor
+from clm_ocr.redaction import redact_result, redact_pdf
+
+from .conftest import ocr_field
+
+
+def _row(*texts):
+    """y=100 한 줄에 x=50부터 80 간격으로 놓인 필드 (마지막 필드에서 줄바꿈)"""
+    return [ocr_field(text, x=50 + 80 * idx, y=100, width=80, line_break=idx == len(texts) - 1)
+            for idx, text in enumerate(texts)]
+
+
+MOCK_RESULT = {'images': [{'fields': [
+    *_row('주민번호', '900101-1234567'),
+    *_row('연락처', '010', '1234', '5678'),
+    *_row('메일:', 'hong@example.com', '계좌', '110-123-456789'),
+]}]}
+
+
+def test_redact_result_masks_all_kinds(mock_env_vars):
+    """여러 필드에 나뉜 번호를 포함한 모든 유형 마스킹 테스트"""
+    masked, findings = redact_result(MOCK_RESULT)
+
+    text = OCRProcessor.to_text(masked)
+    assert sorted(f['kind'] for f in findings) == ['account', 'email', 'phone', 'rrn']
+    assert '1234567' not in text and 'hong@' not in text and '5678' not in text
+    assert '주민번호 **************' in text
+    assert '연락처 *** **** ****' in text
+    assert next(f for f in findings if f['kind'] == 'phone')['fields'] == [3, 4, 5]
+
+    # 원본은 변경되지 않음
+    assert MOCK_RESULT['images'][0]['fields'][1]['inferText'] == '900101-1234567'
+
+
+def test_redact_pdf_removes_text_under_boxes(mock_env_vars, tmp_path):
+    """PDF 가림 주석 적용 후 해당 텍스트가 제거되는지 테스트"""
+    source = tmp_path / "letter.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((135, 115), "900101-1234567", fontsize=10)
+    page.insert_text((50, 300), "keep this", fontsize=10)
+    doc.save(source)
+    doc.close()
+
+    masked, findings = redact_result(MOCK_RESULT)
+    output = tmp_path / "redacted.pdf"
+
+    assert redact_pdf(str(source), findings, str(output), masked_result=masked)
+    with fitz.open(output) as redacted:
+        text = redacted[0].get_text()
+    assert '1234567' not in text
+    assert 'keep this' in text
+
+
+def test_redact_result_ignores_dates(mock_env_vars):
+    """날짜와 연도 범위는 계좌번호로 보지 않는지 테스트"""
+    result = {'images': [{'fields': [
+        *_row('2019-03-15', '~', '2020-01-01'),
+        *_row('2019-2021', '1002-05-123456'),
+    ]}]}
+
+    masked, findings = redact_result(result)
+
+    assert [(f['kind'], f['fields']) for f in findings] == [('account', [4])]
+    text = OCRProcessor.to_text(masked)
+    assert '2019-03-15 ~ 2020-01-01' in text
+    assert '2019-2021' in text
+
+
+def test_redact_pdf_scales_ocr_coordinates(mock_env_vars, tmp_path):
+    """OCR 이미지 크기가 페이지와 다를 때 가림 영역이 PDF 포인트로 변환되는지 테스트"""
+    source = tmp_path / "letter.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=600, height=800)
+    page.insert_text((60, 110), "900101-1234567", fontsize=10)
+    page.insert_text((60, 300), "keep this", fontsize=10)
+    doc.save(source)
+    doc.close()
+
+    # 페이지의 2배 크기 이미지 좌표 (텍스트 영역 약 (60, 100)-(140, 113) 포인트)
+    field = ocr_field('900101-1234567', x=110, y=190, width=190, height=46)
+    result = {'images': [{
+        'convertedImageInfo': {'width': 1200, 'height': 1600}, 'fields': [field],
+    }]}
+
+    masked, findings = redact_result(result)
+    output = tmp_path / "redacted.pdf"
+
+    assert redact_pdf(str(source), findings, str(output), ocr_result=result)
+    with fitz.open(output) as redacted:
+        text = redacted[0].get_text()
+    assert '1234567' not in text
+    assert 'keep this' in text
+
+
+def test_redact_pdf_text_layer_uses_same_scale(mock_env_vars, tmp_path):
+    """마스킹된 텍스트 레이어도 가림 영역과 같은 배율로 PDF 포인트에 삽입되는지 테스트"""
+    source = tmp_path / "letter.pdf"
+    doc = fitz.open()
+    doc.new_page(width=600, height=800)
+    doc.save(source)
+    doc.close()
+
+    field = ocr_field('900101-1234567', x=110, y=190, width=190, height=46)
+    result = {'images': [{
+        'convertedImageInfo': {'width': 1200, 'height': 1600}, 'fields': [field],
+    }]}
+
+    masked, findings = redact_result(result)
+    output = tmp_path / "redacted.pdf"
+
+    assert redact_pdf(str(source), findings, str(output), masked_result=masked)
+    with fitz.open(output) as redacted:
+        words = redacted[0].get_text('words')
+    x0, y0, x1, y1, text = words[0][:5]
+    assert text == '**************'
+    assert fitz.Rect(55, 95, 150, 118).contains(fitz.Rect(x0, y0, x1, y1))
@@ -0,0 +1,116 @@
+"""
+저신뢰 영역 재인식 테스트
+"""
+import fitz
+import pytest
+
+from clm_ocr.refine import find_low_confidence, refine_low_confidence
+
+from .conftest import ocr_field
+
+
+RESULT = {'images': [{
+    'convertedImageInfo': {'width': 595, 'height': 842},
+    'fields': [
+        ocr_field('이름', x=40, y=100, width=50, confidence=0.99),
+        ocr_field('홍길', x=100, y=100, width=50, confidence=0.42),
+        ocr_field('동', x=160, y=100, width=40, confidence=0.55, line_break=True),
+        ocr_field('서울', x=40, y=140, width=50, confidence=0.61),
+    ],
+}]}
+
+
+class CropClient:
+    """잘라낸 이미지 전체를 덮는 필드 하나를 돌려주는 클라이언트"""
+
+    def __init__(self, confidence):
+        self.confidence = confidence
+        self.batches = []
+
+    def ocr_batch(self, file_paths, lang='ko', enable_table=False, max_images=10,
+                  use_cache=True):
+        self.batches.append(len(file_paths))
+        results = []
+        for idx, path in enumerate(file_paths):
+            pixmap = fitz.Pixmap(path)
+            w, h = pixmap.width, pixmap.height
+            results.append({'images': [{
+                'convertedImageInfo': {'width': w, 'height': h},
+                'fields': [{
+                    'inferText': f'고침{idx}', 'inferConfidence': self.confidence,
+                    'lineBreak': True,
+                    'boundingPoly': {'vertices': [{'x': 0, 'y': 0}, {'x': w, 'y': 0},
+                                                  {'x': w, 'y': h}, {'x': 0, 'y': h}]},
+                }],
+            }]})
+        return results
+
+
+@pytest.fixture
+def page_pdf(tmp_path):
+    pdf_path = tmp_path / "form.pdf"
+    doc = fitz.open()
+    doc.new_page(width=595, height=842)
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+def test_find_low_confidence_groups_runs_within_line(mock_env_vars):
+    """같은 줄의 연속된 저신뢰 필드를 한 영역으로 묶는지 테스트"""
+    regions = find_low_confidence(RESULT)
+
+    assert [(r['field_start'], r['field_end']) for r in regions] == [(1, 3), (3, 4)]
+    assert regions[0]['rect'] == (100, 100, 200, 120)
+    assert regions[0]['confidence'] == pytest.approx(0.485)
+
+
+def test_refine_replaces_improved_regions(mock_env_vars, page_pdf):
+    """개선된 영역만 교체하고 좌표를 원래 페이지로 변환하는지 테스트"""
+    client = CropClient(confidence=0.98)
+
+    refined, report = refine_low_confidence(str(page_pdf), RESULT, client, max_images=10)
+
+    assert client.batches == [2]
+    assert report == {'regions': 2, 'improved': 2, 'low_before': 3, 'low_after': 0}
+    fields = refined['images'][0]['fields']
+    assert [f['inferText'] for f in fields] == ['이름', '고침0', '고침1']
+    assert [f['lineBreak'] for f in fields] == [False, True, False]
+
+    # 여백(4)을 포함한 영역으로 변환
+    vertices = fields[1]['boundingPoly']['vertices']
+    assert vertices[0]['x'] == pytest.approx(96, abs=0.5)
+    assert vertices[0]['y'] == pytest.approx(96, abs=0.5)
+    assert vertices[2]['x'] == pytest.approx(204, abs=0.5)
+    assert vertices[2]['y'] == pytest.approx(124, abs=0.5)
+
+    # 원본은 그대로
+    assert len(RESULT['images'][0]['fields']) == 4
+
+
+def test_refine_keeps_original_when_not_better(mock_env_vars, page_pdf):
+    """재인식 신뢰도가 더 낮으면 교체하지 않는지 테스트"""
+    refined, report = refine_low_confidence(str(page_pdf), RESULT, CropClient(confidence=0.3))
+
+    assert report['improved'] == 0
+    assert refined['images'] == RESULT['images']
+
+
+def test_map_fields_uses_actual_pixmap_size(mock_env_vars, page_pdf):
+    """올림된 이미지 크기에서도 잘라낸 영역 모서리가 원래 좌표로 정확히 돌아오는지 테스트"""
+    from clm_ocr.regions import map_fields, render_region
+
+    with fitz.open(page_pdf) as doc:
+        pixmap, clip = render_region(doc[0], (100.1, 200.1, 300.3, 220.3), dpi=300)
+    w, h = pixmap.width, pixmap.height
+    assert (w, h) != (clip.width * 300 / 72, clip.height * 300 / 72)   # 정수로 올림됨
+
+    # 응답 좌표계가 이미지와 다르게 축소된 경우
+    crop_image = {'convertedImageInfo': {'width': w // 2, 'height': h // 2}}
+    field = {'boundingPoly': {'vertices': [{'x': 0, 'y': 0}, {'x': w // 2, 'y': h // 2}]}}
+
+    mapped = map_fields([field], crop_image, (w, h), clip, scale=2.0)
+
+    vertices = mapped[0]['boundingPoly']['vertices']
+    assert vertices[0] == pytest.approx({'x': clip.x0 * 2, 'y': clip.y0 * 2}, abs=0.01)
+    assert vertices[1] == pytest.approx({'x': clip.x1 * 2, 'y': clip.y1 * 2}, abs=0.01)
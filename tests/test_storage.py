@@ -0,0 +1,161 @@
+"""
+산출물 저장소 백엔드 테스트
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from clm_ocr.client import OCROutputManager
+from clm_ocr.main import write_outputs, load_saved_result, _write_json
+from clm_ocr.storage import (
+    OutputStorage, DirectoryStorage, ShardedDirectoryStorage, SQLiteStorage, BLOB_CHUNK_SIZE,
+)
+
+MOCK_RESULT = {'images': [{'fields': [{'inferText': '저장소 테스트', 'inferConfidence': 0.9}]}]}
+
+
+def _save(storage, source_pdf, result=MOCK_RESULT):
+    output_mgr = OCROutputManager(source_pdf, storage=storage)
+    output_mgr.setup_directories()
+    output_mgr.invalidate_manifest()
+    write_outputs(output_mgr, {'ocr_result.json': lambda path: _write_json(path, result)})
+    return output_mgr.project_name
+
+
+@pytest.mark.parametrize('backend', ['sharded', 'sqlite'])
+def test_backends_round_trip(mock_env_vars, tmp_path, backend):
+    """같은 파일명의 서로 다른 PDF가 충돌하지 않고 문서 ID로 다시 읽히는지 테스트"""
+    if backend == 'sharded':
+        storage = ShardedDirectoryStorage(str(tmp_path / 'output'))
+    else:
+        storage = SQLiteStorage(str(tmp_path / 'output' / 'ocr.sqlite'))
+
+    first = _save(storage, str(tmp_path / 'a' / 'resume.pdf'))
+    other = {'images': [{'fields': [{'inferText': '다른 문서'}]}]}
+    second = _save(storage, str(tmp_path / 'b' / 'resume.pdf'), other)
+
+    assert first != second and first.startswith('resume-')
+    assert sorted(storage.iter_documents()) == sorted([first, second])
+
+    result, df = load_saved_result(first, storage=storage)
+    assert result == MOCK_RESULT
+    assert df.iloc[0]['텍스트'] == '저장소 테스트'
+    assert load_saved_result(second, storage=storage)[0] == other
+    assert load_saved_result('missing', storage=storage) == (None, None)
+    assert storage.read_manifest(first)['artifacts'] == {
+        'ocr_result.json': len(json.dumps(MOCK_RESULT, ensure_ascii=False, indent=2).encode())
+    }
+    assert storage.stat(first, 'ocr_result.json')[0] == storage.size(first, 'ocr_result.json')
+    assert storage.stat(first, 'missing.txt') is None
+
+
+def test_directory_storage_rejects_other_source(mock_env_vars, tmp_path):
+    """기본 저장소에서 파일명이 같은 다른 원본은 덮어쓰지 않고 실패하는지 테스트"""
+    storage = DirectoryStorage(str(tmp_path / 'output'))
+    assert _save(storage, str(tmp_path / 'a' / 'resume.pdf')) == 'resume'
+    assert _save(storage, str(tmp_path / 'a' / 'resume.pdf')) == 'resume'
+
+    with pytest.raises(FileExistsError):
+        _save(storage, str(tmp_path / 'b' / 'resume.pdf'), {'images': []})
+    assert load_saved_result('resume', storage=storage)[0] == MOCK_RESULT
+    assert storage.list_artifacts('resume') == ['_complete.json', 'ocr_result.json']
+
+
+def test_process_pdf_project_conflict_and_overwrite(mock_env_vars, fake_server, tmp_path,
+                                                    real_pdf_path):
+    """다른 원본과 프로젝트가 겹치면 (None, None)을 반환하고, overwrite로 다시 연결하는지 테스트"""
+    import shutil
+    from clm_ocr.main import process_pdf
+
+    moved = tmp_path / 'moved' / real_pdf_path.name
+    moved.parent.mkdir()
+    shutil.copy(real_pdf_path, moved)
+    options = dict(output_formats=['json'], output_base=str(tmp_path / 'output'),
+                   api_url=fake_server.url, secret_key='fake-secret')
+
+    assert process_pdf(str(real_pdf_path), **options)[0] is not None
+    assert process_pdf(str(moved), **options) == (None, None)
+
+    result, _ = process_pdf(str(moved), overwrite=True, **options)
+    assert result is not None
+    storage = DirectoryStorage(str(tmp_path / 'output'))
+    assert storage.read_manifest('real')['source_pdf'] == str(moved)
+    assert process_pdf(str(moved), **options)[0] is not None
+
+
+def test_sharded_layout(mock_env_vars, tmp_path):
+    """샤딩 디렉토리 구조 테스트"""
+    storage = ShardedDirectoryStorage(str(tmp_path), levels=2)
+    project_dir = storage.project_dir('resume-1234')
+
+    shard1, shard2, name = project_dir.relative_to(tmp_path).parts
+    assert len(shard1) == len(shard2) == 2
+    assert name == 'resume-1234'
+
+
+def test_sqlite_failed_write_keeps_previous(mock_env_vars, tmp_path):
+    """SQLite 저장 중 실패하면 기존 산출물이 유지되는지 테스트"""
+    with SQLiteStorage(str(tmp_path / 'ocr.sqlite')) as storage:
+        with storage.atomic_path('doc', 'a.txt') as path:
+            path.write_text('v1')
+        with pytest.raises(IOError):
+            with storage.atomic_path('doc', 'a.txt') as path:
+                path.write_text('v2')
+                raise IOError("disk full")
+
+        assert storage.read_bytes('doc', 'a.txt') == b'v1'
+        assert storage.list_artifacts('doc') == ['a.txt']
+
+
+def test_sqlite_streams_large_artifacts(mock_env_vars, tmp_path, monkeypatch):
+    """SQLite 저장 시 산출물을 한 번에 읽지 않고 나눠 복사하는지 테스트"""
+    data = bytes(range(256)) * (BLOB_CHUNK_SIZE // 256 * 3 + 7)
+    monkeypatch.setattr(Path, 'read_bytes', lambda self: pytest.fail("전체 읽기 사용"))
+
+    with SQLiteStorage(str(tmp_path / 'ocr.sqlite')) as storage:
+        with storage.atomic_path('doc', 'searchable.pdf') as path:
+            with open(path, 'wb') as f:
+                f.write(data)
+        with storage.atomic_path('doc', 'empty.txt') as path:
+            path.touch()
+
+        assert storage.read_bytes('doc', 'searchable.pdf') == data
+        assert storage.size('doc', 'searchable.pdf') == len(data)
+        assert storage.read_bytes('doc', 'empty.txt') == b''
+
+
+def test_sqlite_reads_snapshot_in_chunks(mock_env_vars, tmp_path):
+    """SQLite 산출물을 나눠 읽고, 읽는 중에 교체되어도 연 시점의 내용을 읽는지 테스트"""
+    old = bytes(range(256)) * (BLOB_CHUNK_SIZE // 256 * 2 + 3)
+
+    with SQLiteStorage(str(tmp_path / 'ocr.sqlite')) as storage:
+        with storage.atomic_path('doc', 'searchable.pdf') as path:
+            path.write_bytes(old)
+
+        with storage.open('doc', 'searchable.pdf') as f:
+            head = f.read(1000)
+            with storage.atomic_path('doc', 'searchable.pdf') as path:
+                path.write_bytes(b'new')
+            assert head + f.read() == old
+
+        assert storage.read_bytes('doc', 'searchable.pdf') == b'new'
+        with pytest.raises(FileNotFoundError):
+            storage.open('doc', 'missing.txt')
+
+
+def test_incomplete_backend_fails_on_creation(mock_env_vars):
+    """추상 메서드를 구현하지 않은 저장소는 생성할 때 실패하는지 테스트"""
+    class PartialStorage(OutputStorage):
+        def location(self, doc_id, filename=None):
+            return doc_id
+
+    with pytest.raises(TypeError):
+        PartialStorage()
+
+
+def test_directory_storage_keeps_legacy_layout(mock_env_vars, tmp_path):
+    """기본 저장소는 기존처럼 output_base/파일명 디렉토리를 사용하는지 테스트"""
+    storage = DirectoryStorage(str(tmp_path))
+    assert _save(storage, str(tmp_path / 'doc.pdf')) == 'doc'
+    assert (tmp_path / 'doc' / 'ocr_result.json').exists()
@@ -0,0 +1,84 @@
+"""
+스트리밍 처리 테스트
+"""
+import json
+
+import fitz
+import pandas as pd
+import pytest
+
+from clm_ocr.export import iter_chunks
+from clm_ocr.main import load_saved_result
+from clm_ocr.processor import OCRProcessor
+from clm_ocr.streaming import iter_pages, process_pdf_streaming
+
+
+class StubClient:
+    """페이지 수만큼 결정적인 결과를 반환하는 클라이언트"""
+
+    def __init__(self):
+        self.calls = []
+
+    def ocr_from_file(self, file_path, lang='ko', enable_table=False, use_cache=True):
+        self.calls.append(file_path)
+        with fitz.open(file_path) as doc:
+            first_line = doc[0].get_text().strip()
+            return {'images': [
+                {'fields': [
+                    {'inferText': f"{first_line}-{page.number}", 'inferConfidence': 0.8,
+                     'lineBreak': True,
+                     'boundingPoly': {'vertices': [{'x': 10, 'y': 10}, {'x': 90, 'y': 10},
+                                                   {'x': 90, 'y': 30}, {'x': 10, 'y': 30}]}},
+                    {'inferText': '끝', 'inferConfidence': 0.99},
+                ]}
+                for page in doc
+            ]}
+
+
+@pytest.fixture
+def five_page_pdf(tmp_path):
+    pdf_path = tmp_path / "long.pdf"
+    doc = fitz.open()
+    for page_no in range(5):
+        doc.new_page().insert_text((72, 72), f"P{page_no + 1}")
+    doc.save(pdf_path)
+    doc.close()
+    return pdf_path
+
+
+def test_iter_pages_chunks_document(mock_env_vars, five_page_pdf):
+    """묶음 단위 요청 및 페이지 번호 연속성 테스트"""
+    client = StubClient()
+
+    pages = list(iter_pages(str(five_page_pdf), client=client, chunk_size=2))
+
+    assert [page_num for page_num, _ in pages] == [1, 2, 3, 4, 5]
+    assert len(client.calls) == 3
+    assert pages[2][1]['fields'][0]['inferText'] == 'P3-0'
+
+
+def test_streaming_outputs_match_batch_conversion(mock_env_vars, five_page_pdf, tmp_path):
+    """점진적으로 저장한 출력이 일괄 변환 결과와 같은지 테스트"""
+    output_base = tmp_path / "output"
+
+    summary = process_pdf_streaming(
+        str(five_page_pdf),
+        output_formats=['json', 'text', 'dataframe', 'markdown', 'searchable_pdf', 'chunks'],
+        output_base=str(output_base),
+        chunk_size=2,
+        client=StubClient()
+    )
+
+    assert summary['pages'] == 5
+    result, df = load_saved_result('long', output_base=str(output_base))
+    project_dir = output_base / 'long'
+
+    assert len(result['images']) == 5
+    assert (project_dir / 'extracted_text.txt').read_text(encoding='utf-8') == \
+        OCRProcessor.to_text(result)
+    assert (project_dir / 'document.md').read_text(encoding='utf-8') == \
+        OCRProcessor.to_markdown(result)
+    pd.testing.assert_frame_equal(df, OCRProcessor.to_dataframe(result))
+    assert (project_dir / 'searchable.pdf').exists()
+    with open(project_dir / 'chunks.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == list(iter_chunks(result, doc_id='long'))
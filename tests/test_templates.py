@@ -0,0 +1,76 @@
+"""
+관심 영역 템플릿 테스트
+"""
+import fitz
+import pytest
+
+from clm_ocr.templates import RegionTemplate, extract_regions
+
+
+class CropClient:
+    """잘라낸 이미지 전체를 덮는 필드 하나를 돌려주는 클라이언트"""
+
+    def __init__(self):
+        self.batches = []
+
+    def ocr_batch(self, file_paths, lang='ko', enable_table=False, max_images=10,
+                  use_cache=True):
+        self.batches.append(len(file_paths))
+        results = []
+        for idx, path in enumerate(file_paths):
+            pixmap = fitz.Pixmap(path)
+            w, h = pixmap.width, pixmap.height
+            results.append({'images': [{
+                'convertedImageInfo': {'width': w, 'height': h},
+                'fields': [{
+                    'inferText': f'영역{idx}', 'inferConfidence': 0.97, 'lineBreak': True,
+                    'boundingPoly': {'vertices': [{'x': 0, 'y': 0}, {'x': w, 'y': 0},
+                                                  {'x': w, 'y': h}, {'x': 0, 'y': h}]},
+                }],
+            }]})
+        return results
+
+
+TEMPLATE = RegionTemplate('이력서', {
+    'header': {'page': 1, 'rect': (0.0, 0.0, 1.0, 0.1)},
+    'signature': {'page': -1, 'rect': (0.5, 0.9, 1.0, 1.0)},
+    'appendix': {'page': 5, 'rect': (0.0, 0.0, 1.0, 1.0)},
+})
+
+
+def test_extract_regions_maps_to_page_space(mock_env_vars, real_pdf_path):
+    """영역별 결과와 원래 페이지 좌표 변환, 면적 비율 보고 테스트"""
+    client = CropClient()
+
+    regions, report = extract_regions(str(real_pdf_path), TEMPLATE, client, dpi=150)
+
+    assert client.batches == [2]
+    assert set(regions) == {'header', 'signature'}
+    assert regions['header']['page'] == 1 and regions['signature']['page'] == 2
+    assert regions['header']['text'] == '영역0'
+    assert regions['signature']['confidence'] == pytest.approx(0.97)
+
+    # 페이지 595x842 기준 서명 영역
+    vertices = regions['signature']['fields'][0]['boundingPoly']['vertices']
+    assert vertices[0]['x'] == pytest.approx(297.5, abs=0.5)
+    assert vertices[0]['y'] == pytest.approx(757.8, abs=0.5)
+    assert vertices[2]['x'] == pytest.approx(595, abs=0.5)
+    assert vertices[2]['y'] == pytest.approx(842, abs=0.5)
+
+    assert report['missing'] == ['appendix']
+    assert report['area_ratio'] == pytest.approx(0.075, abs=0.001)
+
+
+def test_template_validation_and_roundtrip(mock_env_vars, tmp_path):
+    """잘못된 좌표 거부 및 JSON 저장/불러오기 테스트"""
+    with pytest.raises(ValueError):
+        RegionTemplate('bad', {'r': {'page': 1, 'rect': (0.5, 0.0, 0.2, 1.0)}})
+    with pytest.raises(ValueError):
+        RegionTemplate('bad', {'r': {'page': 0, 'rect': (0, 0, 1, 1)}})
+
+    path = tmp_path / "template.json"
+    TEMPLATE.save(str(path))
+    loaded = RegionTemplate.load(str(path))
+
+    assert loaded.name == '이력서'
+    assert loaded.regions == TEMPLATE.regions
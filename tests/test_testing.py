@@ -0,0 +1,56 @@
+"""
+오프라인 CLOVA OCR 대체 서버 테스트
+"""
+import pytest
+import requests
+
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.processor import OCRProcessor
+from clm_ocr.testing import FakeClovaOCRServer, run_load
+
+
+def test_client_against_fake_server(mock_env_vars, fake_server, real_pdf_path):
+    """실제 multipart 요청으로 페이지별 합성 결과 수신 테스트"""
+    client = ClovaOCRClient(fake_server.url, 'fake-secret')
+
+    result = client.ocr_from_file(str(real_pdf_path), enable_table=True)
+
+    assert len(result['images']) == 2
+    assert len(result['images'][0]['fields']) == 12
+    assert OCRProcessor.has_tables(result)
+    assert fake_server.stats['status'] == {200: 1}
+
+
+def test_fake_server_is_deterministic(mock_env_vars, fake_server, real_pdf_path):
+    """같은 파일은 항상 같은 fields를 생성하는지 테스트"""
+    first = ClovaOCRClient(fake_server.url, 'fake-secret').ocr_from_file(str(real_pdf_path))
+    second = ClovaOCRClient(fake_server.url, 'fake-secret').ocr_from_file(str(real_pdf_path))
+
+    assert first['images'] == second['images']
+
+
+def test_fake_server_rate_limit(mock_env_vars, real_pdf_path):
+    """429 응답 설정 테스트"""
+    with FakeClovaOCRServer(rate_limit_rate=1.0) as server:
+        client = ClovaOCRClient(server.url, 'any')
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.ocr_from_file(str(real_pdf_path))
+
+    assert server.stats['status'] == {429: 1}
+
+
+def test_fake_server_rejects_wrong_secret(mock_env_vars, fake_server, real_pdf_path):
+    """잘못된 Secret Key 거부 테스트"""
+    client = ClovaOCRClient(fake_server.url, 'wrong-secret')
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.ocr_from_file(str(real_pdf_path))
+
+
+def test_run_load(mock_env_vars, fake_server, real_pdf_path):
+    """부하 생성 헬퍼 테스트"""
+    report = run_load(str(real_pdf_path), fake_server.url, 'fake-secret',
+                      num_requests=8, concurrency=4)
+
+    assert report['succeeded'] == 8
+    assert fake_server.stats['max_in_flight'] >= 1
@@ -0,0 +1,54 @@
+"""
+스트리밍 multipart 인코더 테스트
+"""
+import pytest
+
+from clm_ocr.client import ClovaOCRClient
+from clm_ocr.testing import _parse_multipart
+from clm_ocr.upload import MultipartEncoder
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_encoder_streams_in_bounded_chunks(mock_env_vars, tmp_path, use_mmap):
+    """청크 크기 이하로 읽으면서 올바른 본문 생성 테스트"""
+    payload = bytes(range(256)) * 1000
+    file_path = tmp_path / "big.bin"
+    file_path.write_bytes(payload)
+
+    encoder = MultipartEncoder(chunk_size=4096, use_mmap=use_mmap)
+    encoder.add_field('message', b'{"version": "V2"}')
+    encoder.add_file('file', file_path)
+
+    with encoder:
+        chunks = list(encoder)
+
+    body = b''.join(chunks)
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    assert len(body) == len(encoder)
+
+    parts = _parse_multipart(body, encoder.content_type)
+    assert parts['message'] == [b'{"version": "V2"}']
+    assert parts['file'] == [payload]
+
+
+def test_client_uploads_with_content_length(mock_env_vars, fake_server, real_pdf_path,
+                                            monkeypatch):
+    """스트리밍 업로드가 chunked 없이 인코더 길이의 Content-Length로 전송되는지 테스트"""
+    import clm_ocr.client
+
+    encoders = []
+
+    class RecordingEncoder(MultipartEncoder):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            encoders.append(self)
+
+    monkeypatch.setattr(clm_ocr.client, 'MultipartEncoder', RecordingEncoder)
+    client = ClovaOCRClient(fake_server.url, 'fake-secret', upload_chunk_size=512, use_mmap=True)
+
+    result = client.ocr_from_file(str(real_pdf_path))
+
+    assert len(result['images']) == 2
+    headers, = fake_server.request_headers
+    assert int(headers['Content-Length']) == len(encoders[0]) > 512
+    assert 'Transfer-Encoding' not in headers